@@ -0,0 +1,310 @@
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from src.partida import Partida
+
+
+class EventoPlacar(NamedTuple):
+    """Placar (parcial ou final) de um jogo recebido do feed ao vivo."""
+    mandante: str
+    visitante: str
+    gols_mandante: int
+    gols_visitante: int
+    encerrada: bool = False
+    instante: float = 0.0  # time.perf_counter() na origem, para medir latência
+
+
+class AtualizacaoClassificacao(NamedTuple):
+    """Classificação publicada aos assinantes após aplicar um grupo de eventos."""
+    sequencia: int
+    classificacao: Tuple[Tuple[str, int], ...]  # (nome, pontos) do 1º ao último
+    zonas: Mapping[str, Tuple[str, ...]]  # somente leitura: a mesma atualização vai a todos os assinantes
+    instantes: Tuple[float, ...]  # instantes dos eventos absorvidos nesta atualização
+
+
+class ServicoAoVivo:
+    """
+    Serviço asyncio que consome eventos de placar e publica a classificação.
+
+    Eventos do mesmo jogo que chegam dentro de `janela` segundos são agrupados e só
+    o último placar é aplicado. O primeiro placar de um jogo entra como partida
+    provisória (processar_partida); os seguintes corrigem o placar (corrigir_partida).
+    O retrato de uma rodada (histórico por rodada) só fica guardado quando todos os
+    jogos dela que passaram pelo serviço estão encerrados; até lá o retrato automático,
+    tirado com placares provisórios, é descartado.
+
+    Cada assinante recebe as atualizações numa asyncio.Queue limitada. Com a fila cheia
+    o serviço espera o assinante abrir espaço (contrapressão): enquanto isso para de ler
+    a fonte, e a próxima publicação já sai com todos os placares acumulados. Um assinante
+    que passa `espera_assinante` segundos sem abrir espaço faz executar levantar
+    asyncio.TimeoutError (o próprio TimeoutError a partir do Python 3.11). Quem prefere
+    só a classificação mais recente assina com `descartar_antigas=True`: a atualização
+    mais antiga da fila é descartada e o serviço não espera por ele.
+    """
+
+    def __init__(self, campeonato, janela: float = 0.002, espera_assinante: float = 5.0):
+        self.campeonato = campeonato
+        self.janela = janela
+        self.espera_assinante = espera_assinante
+        self.partidas: Dict[Tuple[str, str], int] = {}  # (mandante, visitante) -> id no campeonato
+        self.encerradas = set()
+        self.aplicados = 0
+        self.agrupados = 0    # eventos substituídos por um placar mais novo do mesmo jogo
+        self.rejeitados = 0
+        self.descartadas = 0  # atualizações descartadas nas filas com descartar_antigas
+        self.esperas = 0      # entregas que esperaram um assinante abrir espaço na fila
+        self._assinantes: List[Tuple[asyncio.Queue, bool]] = []
+        self._livre = asyncio.Event()  # limpo enquanto uma entrega espera: a fonte não é lida
+        self._em_andamento: Dict[int, set] = {}  # rodada (1 = primeira) -> jogos ainda não encerrados
+        self._rodadas_tocadas = set()
+        self._retratos_adiados = set()  # rodadas completas cujo retrato espera os jogos encerrarem
+        self._pendentes: Dict[Tuple[str, str], EventoPlacar] = {}
+        self._instantes: List[float] = []
+        self._sequencia = 0
+
+    def assinar(self, tamanho_fila: int = 16, descartar_antigas: bool = False) -> asyncio.Queue:
+        """
+        Fila que recebe cada AtualizacaoClassificacao e, ao fim do fluxo, None. Com a fila
+        cheia o serviço espera; com `descartar_antigas`, descarta a atualização mais antiga.
+        """
+        fila = asyncio.Queue(maxsize=tamanho_fila)
+        self._assinantes.append((fila, descartar_antigas))
+        return fila
+
+    async def executar(self, fonte):
+        """
+        Consome o iterável assíncrono `fonte` de EventoPlacar até o fim, publicando as atualizações.
+        Itens None (linhas malformadas das fontes JSONL) e eventos inválidos contam em
+        `rejeitados`; os assinantes recebem None ao fim mesmo que a fonte falhe.
+        asyncio.TimeoutError se um assinante sem descarte fica `espera_assinante` segundos com a fila cheia.
+        """
+        novos = asyncio.Event()
+        fim = False
+        self._livre.set()
+
+        async def consumir():
+            nonlocal fim
+            try:
+                async for evento in fonte:
+                    await self._livre.wait()
+                    if evento is None:
+                        self.rejeitados += 1
+                        continue
+                    chave = (evento.mandante, evento.visitante)
+                    if chave in self._pendentes:
+                        self.agrupados += 1
+                    self._pendentes[chave] = evento
+                    self._instantes.append(evento.instante)
+                    novos.set()
+            finally:
+                fim = True
+                novos.set()
+
+        consumidor = asyncio.create_task(consumir())
+        try:
+            while not fim or self._pendentes:
+                await novos.wait()
+                if self.janela and not fim:
+                    await asyncio.sleep(self.janela)
+                novos.clear()
+                if self._pendentes:
+                    await self._aplicar_pendentes()
+            await consumidor
+        finally:
+            consumidor.cancel()
+            for fila, descartar_antigas in self._assinantes:
+                try:
+                    await self._entregar(fila, descartar_antigas, None)
+                except asyncio.TimeoutError:  # assinante parado: fica sem o aviso de fim
+                    pass
+
+    async def _aplicar_pendentes(self):
+        pendentes, self._pendentes = self._pendentes, {}
+        instantes, self._instantes = tuple(self._instantes), []
+        for chave, evento in pendentes.items():
+            self._aplicar(chave, evento)
+        self._conferir_retratos()
+        tabela = self.campeonato.calcular_classificacao()
+        self._sequencia += 1
+        atualizacao = AtualizacaoClassificacao(
+            self._sequencia,
+            tuple((equipe.nome, equipe.pontos) for equipe in tabela),
+            self.campeonato.determinar_classificacoes(),
+            instantes,
+        )
+        for fila, descartar_antigas in self._assinantes:
+            await self._entregar(fila, descartar_antigas, atualizacao)
+
+    def _aplicar(self, chave, evento: EventoPlacar):
+        registro = self.campeonato.registro
+        mandante, visitante = registro.id_do_nome(evento.mandante), registro.id_do_nome(evento.visitante)
+        if (mandante is None or visitante is None or mandante == visitante
+                or evento.gols_mandante < 0 or evento.gols_visitante < 0 or chave in self.encerradas):
+            self.rejeitados += 1
+            return
+        id_partida = self.partidas.get(chave)
+        try:
+            if id_partida is None:
+                partida = Partida(registro[mandante], registro[visitante], evento.gols_mandante, evento.gols_visitante)
+                self.partidas[chave] = self.campeonato.processar_partida(partida)
+            else:
+                self.campeonato.corrigir_partida(id_partida, evento.gols_mandante, evento.gols_visitante)
+        except ValueError:  # placar que o campeonato recusa (por exemplo, fora das colunas)
+            self.rejeitados += 1
+            return
+        if evento.encerrada:
+            self.encerradas.add(chave)
+        self.aplicados += 1
+        rodada = self.campeonato.partidas.rodada(self.partidas[chave])
+        if rodada is not None:
+            em_andamento = self._em_andamento.setdefault(rodada + 1, set())
+            if evento.encerrada:
+                em_andamento.discard(chave)
+            else:
+                em_andamento.add(chave)
+            self._rodadas_tocadas.add(rodada + 1)
+
+    def _conferir_retratos(self):
+        """Retrato das rodadas completas: refeito com os placares finais ou descartado se há jogo em andamento."""
+        historico = self.campeonato.historico
+        for numero in self._rodadas_tocadas:
+            if numero not in historico.retratos and numero not in self._retratos_adiados:
+                continue  # rodada ainda incompleta no calendário
+            if self._em_andamento[numero]:
+                historico.descartar(numero)
+                self._retratos_adiados.add(numero)
+            else:
+                self.campeonato.registrar_rodada(numero)
+                self._retratos_adiados.discard(numero)
+        self._rodadas_tocadas.clear()
+
+    async def _entregar(self, fila: asyncio.Queue, descartar_antigas: bool, item):
+        if fila.full() and descartar_antigas:
+            fila.get_nowait()
+            self.descartadas += 1
+        if not fila.full():
+            fila.put_nowait(item)
+            return
+        self.esperas += 1
+        self._livre.clear()
+        try:
+            await asyncio.wait_for(fila.put(item), self.espera_assinante)
+        except asyncio.TimeoutError:
+            raise asyncio.TimeoutError(f"Assinante com a fila cheia por mais de {self.espera_assinante} s.") from None
+        finally:
+            self._livre.set()
+
+
+# FONTES DE EVENTOS
+
+def _evento_de_json(linha) -> Optional[EventoPlacar]:
+    """
+    EventoPlacar de uma linha JSONL (str ou bytes), ou None se a linha for malformada. Gols só
+    como inteiros JSON, como no LeitorResultados: 1.7, "2" e true não viram placar.
+    """
+    try:
+        registro = json.loads(linha)
+        mandante, visitante = registro["mandante"], registro["visitante"]
+        gols_mandante, gols_visitante = registro["gols_mandante"], registro["gols_visitante"]
+        if not isinstance(mandante, str) or not isinstance(visitante, str):
+            return None
+        if type(gols_mandante) is not int or type(gols_visitante) is not int:
+            return None
+        return EventoPlacar(mandante, visitante, gols_mandante, gols_visitante,
+                            bool(registro.get("encerrada", False)), time.perf_counter())
+    except (ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+async def eventos_de_stream(leitor: asyncio.StreamReader):
+    """
+    Eventos JSONL lidos de um asyncio.StreamReader (por exemplo, um socket). Linhas
+    malformadas geram None, que ServicoAoVivo conta como rejeitado.
+    """
+    while True:
+        linha = await leitor.readline()
+        if not linha:
+            return
+        if linha.strip():
+            yield _evento_de_json(linha)
+
+
+async def eventos_de_arquivo(caminho: str, linhas_por_leitura: int = 1000):
+    """Eventos JSONL de um arquivo, lido em blocos numa thread para não bloquear o loop; como eventos_de_stream."""
+    with open(caminho, encoding="utf-8") as arquivo:
+        while True:
+            linhas = await asyncio.to_thread(arquivo.readlines, linhas_por_leitura * 128)
+            if not linhas:
+                return
+            for linha in linhas:
+                if linha.strip():
+                    yield _evento_de_json(linha)
+
+
+# GERADOR DE CARGA
+
+async def gerar_carga(campeonato, eventos_por_segundo: float, total: int, jogos_simultaneos: int = 10,
+                      semente: int = 0):
+    """
+    Eventos de placar sintéticos para os próximos jogos do calendário: a cada evento
+    um dos `jogos_simultaneos` jogos em andamento marca um gol; jogos terminam
+    (encerrada=True) depois de alguns gols e dão lugar ao próximo jogo.
+    """
+    rng = random.Random(semente)
+    proximos = iter(campeonato.jogos_restantes())
+    em_andamento = {}
+    intervalo = 1 / eventos_por_segundo
+    inicio = time.perf_counter()
+    for n in range(total):
+        while len(em_andamento) < jogos_simultaneos:
+            jogo = next(proximos, None)
+            if jogo is None:
+                break
+            em_andamento[jogo] = [0, 0]
+        if not em_andamento:
+            return
+        (mandante, visitante), placar = rng.choice(list(em_andamento.items()))
+        placar[rng.random() < 0.45] += 1
+        encerrada = sum(placar) >= rng.randint(1, 6)
+        if encerrada:
+            del em_andamento[(mandante, visitante)]
+        yield EventoPlacar(mandante.nome, visitante.nome, placar[0], placar[1], encerrada, time.perf_counter())
+        atraso = inicio + (n + 1) * intervalo - time.perf_counter()
+        await asyncio.sleep(max(atraso, 0))
+
+
+def _percentil(ordenados, p: float) -> float:
+    return ordenados[min(int(p * len(ordenados)), len(ordenados) - 1)] if ordenados else 0.0
+
+
+async def medir_latencia(servico: ServicoAoVivo, fonte) -> Dict[str, float]:
+    """
+    Executa o serviço sobre `fonte` com um assinante que registra, para cada evento,
+    o tempo entre sua criação e a publicação da classificação que o inclui.
+    Retorna p50, p95, p99 e máximo em milissegundos.
+    """
+    fila = servico.assinar(tamanho_fila=1024)
+    latencias = []
+
+    async def assinante():
+        while True:
+            atualizacao = await fila.get()
+            if atualizacao is None:
+                return
+            agora = time.perf_counter()
+            latencias.extend(agora - instante for instante in atualizacao.instantes)
+
+    tarefa = asyncio.create_task(assinante())
+    await servico.executar(fonte)
+    await tarefa
+    latencias.sort()
+    return {
+        "eventos": len(latencias),
+        "p50_ms": 1000 * _percentil(latencias, 0.50),
+        "p95_ms": 1000 * _percentil(latencias, 0.95),
+        "p99_ms": 1000 * _percentil(latencias, 0.99),
+        "max_ms": 1000 * (latencias[-1] if latencias else 0.0),
+    }
@@ -0,0 +1,252 @@
+from array import array
+from itertools import islice, repeat
+
+from src.partida import Partida
+
+# Colunas do armazém e seus tipos: 3 × int32 + 2 × uint16 + 4 × uint8 = 20 bytes por partida
+COLUNAS_PARTIDAS = (
+    ("mandantes", "i"), ("visitantes", "i"),
+    ("gols_mandante", "H"), ("gols_visitante", "H"),
+    ("rodadas", "i"),
+    ("vermelhos_mandante", "B"), ("amarelos_mandante", "B"),
+    ("vermelhos_visitante", "B"), ("amarelos_visitante", "B"),
+)
+
+_DESFEITA = -1    # valor de `mandantes` para partida desfeita (o identificador das demais não muda)
+_SEM_RODADA = -1  # partida fora do calendário
+MAX_GOLS = 0xFFFF  # maiores valores que cabem nas colunas de gols e de cartões
+MAX_CARTOES = 0xFF
+
+
+def validar_partida(gols_mandante: int, gols_visitante: int, cartoes_mandante=(0, 0), cartoes_visitante=(0, 0)):
+    """
+    ValueError se o placar ou os cartões (pares vermelhos, amarelos) não são inteiros
+    (bool e float inclusive) ou não cabem nas colunas do armazém.
+    """
+    if not (type(gols_mandante) is int and type(gols_visitante) is int
+            and 0 <= gols_mandante <= MAX_GOLS and 0 <= gols_visitante <= MAX_GOLS):
+        raise ValueError(f"Gols marcados devem ser inteiros entre 0 e {MAX_GOLS}.")
+    try:
+        (vermelhos_m, amarelos_m), (vermelhos_v, amarelos_v) = cartoes_mandante, cartoes_visitante
+    except (TypeError, ValueError):
+        raise ValueError("Cartões devem ser pares (vermelhos, amarelos).") from None
+    if not (type(vermelhos_m) is type(amarelos_m) is type(vermelhos_v) is type(amarelos_v) is int
+            and 0 <= vermelhos_m <= MAX_CARTOES and 0 <= amarelos_m <= MAX_CARTOES
+            and 0 <= vermelhos_v <= MAX_CARTOES and 0 <= amarelos_v <= MAX_CARTOES):
+        raise ValueError(f"Quantidade de cartões deve ser um inteiro entre 0 e {MAX_CARTOES}.")
+
+
+class ArmazemPartidas:
+    """
+    Registro das partidas processadas de um campeonato em colunas contíguas
+    (struct-of-arrays): uma array por campo, indexada pelo identificador da partida.
+
+    Cada partida ocupa 20 bytes; objetos Partida só são criados ao iterar ou
+    consultar. Os índices por equipe e por rodada (mais 12 bytes por partida) são
+    montados sob demanda e estendidos só com as partidas novas.
+    """
+
+    __slots__ = tuple(nome for nome, _ in COLUNAS_PARTIDAS) + (
+        "colunas", "equipes", "_por_equipe", "_por_rodada", "_indexadas", "_rodadas_alteradas")
+
+    def __init__(self, equipes):
+        self.equipes = equipes
+        self.colunas = tuple(array(tipo) for _, tipo in COLUNAS_PARTIDAS)
+        (self.mandantes, self.visitantes, self.gols_mandante, self.gols_visitante, self.rodadas,
+         self.vermelhos_mandante, self.amarelos_mandante,
+         self.vermelhos_visitante, self.amarelos_visitante) = self.colunas
+        self._por_equipe = {}   # índice da equipe -> array com os ids das partidas (só quem jogou)
+        self._por_rodada = {}   # rodada (0-indexada) -> array com os ids das partidas
+        self._indexadas = 0     # partidas [0, _indexadas) já estão nos índices
+        self._rodadas_alteradas = False
+
+    def __len__(self):
+        """Quantidade de identificadores usados, incluindo partidas desfeitas."""
+        return len(self.mandantes)
+
+    def bytes_por_partida(self) -> int:
+        return sum(coluna.itemsize for coluna in self.colunas)
+
+    # ESCRITA
+
+    def adicionar(self, i: int, j: int, gols_mandante: int, gols_visitante: int, rodada=None,
+                  cartoes_mandante=(0, 0), cartoes_visitante=(0, 0)) -> int:
+        """
+        Acrescenta uma partida entre as equipes de índices i e j e retorna seu identificador.
+        Os cartões são pares (vermelhos, amarelos), como em registrar_cartoes.
+
+        Tudo é validado antes de escrever: um valor inválido gera ValueError e
+        nenhuma coluna é alterada.
+        """
+        validar_partida(gols_mandante, gols_visitante, cartoes_mandante, cartoes_visitante)
+        if not (0 <= i < len(self.equipes) and 0 <= j < len(self.equipes)):
+            raise ValueError("Índice de equipe fora do armazém.")
+        if rodada is not None and not _SEM_RODADA <= rodada <= 0x7FFFFFFF:
+            raise ValueError(f"Rodada inválida: {rodada}")
+        return self._anexar(i, j, gols_mandante, gols_visitante, rodada, cartoes_mandante, cartoes_visitante)
+
+    def _anexar(self, i, j, gols_mandante, gols_visitante, rodada, cartoes_mandante, cartoes_visitante) -> int:
+        """adicionar sem validação, para quem já validou a partida (Campeonato.processar_partida)."""
+        self.mandantes.append(i)
+        self.visitantes.append(j)
+        self.gols_mandante.append(gols_mandante)
+        self.gols_visitante.append(gols_visitante)
+        self.rodadas.append(_SEM_RODADA if rodada is None else rodada)
+        self.vermelhos_mandante.append(cartoes_mandante[0])
+        self.amarelos_mandante.append(cartoes_mandante[1])
+        self.vermelhos_visitante.append(cartoes_visitante[0])
+        self.amarelos_visitante.append(cartoes_visitante[1])
+        return len(self.mandantes) - 1
+
+    def estender(self, mandantes, visitantes, gols_mandante, gols_visitante, rodadas=None):
+        """
+        Acrescenta jogos sem cartões, dados em colunas alinhadas (ids de mandante e
+        visitante, gols de cada um); `rodadas` também alinhada (None = fora do calendário).
+        Sem validação, como _anexar.
+        """
+        primeiro_id = len(self.mandantes)
+        self.mandantes.extend(mandantes)
+        self.visitantes.extend(visitantes)
+        self.gols_mandante.extend(gols_mandante)
+        self.gols_visitante.extend(gols_visitante)
+        quantidade = len(self.mandantes) - primeiro_id
+        if rodadas is None or None not in rodadas:
+            self.rodadas.extend(rodadas if rodadas is not None else repeat(_SEM_RODADA, quantidade))
+        else:
+            self.rodadas.extend(_SEM_RODADA if r is None else r for r in rodadas)
+        zeros = bytes(quantidade)
+        for coluna in self.colunas[5:]:
+            coluna.frombytes(zeros)
+        return primeiro_id
+
+    def desfazer(self, id_partida: int):
+        self.mandantes[id_partida] = _DESFEITA
+
+    def corrigir(self, id_partida: int, gols_mandante: int, gols_visitante: int):
+        """Troca o placar, sem validação (como estender): Campeonato.corrigir_partida já validou."""
+        self.gols_mandante[id_partida] = gols_mandante
+        self.gols_visitante[id_partida] = gols_visitante
+
+    def definir_rodada(self, id_partida: int, rodada):
+        valor = _SEM_RODADA if rodada is None else rodada
+        if self.rodadas[id_partida] != valor:
+            self.rodadas[id_partida] = valor
+            self._rodadas_alteradas |= id_partida < self._indexadas
+
+    # LEITURA
+
+    def ativa(self, id_partida: int) -> bool:
+        return 0 <= id_partida < len(self.mandantes) and self.mandantes[id_partida] != _DESFEITA
+
+    def registro(self, id_partida: int):
+        """(mandante, visitante, gols_m, gols_v) por índice, ou None se a partida foi desfeita."""
+        if self.mandantes[id_partida] == _DESFEITA:
+            return None
+        return (self.mandantes[id_partida], self.visitantes[id_partida],
+                self.gols_mandante[id_partida], self.gols_visitante[id_partida])
+
+    def registros(self):
+        """Gera (mandante, visitante, gols_m, gols_v) das partidas não desfeitas, na ordem de processamento."""
+        for jogo in zip(self.mandantes, self.visitantes, self.gols_mandante, self.gols_visitante):
+            if jogo[0] != _DESFEITA:
+                yield jogo
+
+    def rodada(self, id_partida: int):
+        """Rodada (0-indexada) em que a partida foi contada, ou None se ficou fora do calendário."""
+        rodada = self.rodadas[id_partida]
+        return None if rodada == _SEM_RODADA else rodada
+
+    def cartoes(self, id_partida: int):
+        """((vermelhos, amarelos) do mandante, (vermelhos, amarelos) do visitante)."""
+        return ((self.vermelhos_mandante[id_partida], self.amarelos_mandante[id_partida]),
+                (self.vermelhos_visitante[id_partida], self.amarelos_visitante[id_partida]))
+
+    def partida(self, id_partida: int) -> Partida:
+        """Partida montada a partir das colunas; ValueError se ela foi desfeita."""
+        if not self.ativa(id_partida):
+            raise ValueError(f"Partida {id_partida} não está registrada no campeonato.")
+        mandante, visitante = self.cartoes(id_partida)
+        return Partida(self.equipes[self.mandantes[id_partida]], self.equipes[self.visitantes[id_partida]],
+                       self.gols_mandante[id_partida], self.gols_visitante[id_partida], mandante, visitante)
+
+    def __iter__(self):
+        return iter(self[:])
+
+    def __getitem__(self, chave):
+        if isinstance(chave, slice):
+            ids = range(len(self.mandantes))[chave]
+            return VisaoPartidas(self, ids, len(ids))
+        return self.partida(chave)
+
+    def da_equipe(self, indice: int) -> "VisaoPartidas":
+        """Partidas da equipe de índice `indice` (como mandante ou visitante)."""
+        self._indexar()
+        ids = self._por_equipe.get(indice, array("i"))
+        return VisaoPartidas(self, ids, len(ids))
+
+    def da_rodada(self, rodada: int) -> "VisaoPartidas":
+        """Partidas contadas na rodada `rodada` (0-indexada) do calendário."""
+        self._indexar()
+        ids = self._por_rodada.get(rodada, array("i"))
+        return VisaoPartidas(self, ids, len(ids))
+
+    def _indexar(self):
+        if self._rodadas_alteradas:
+            self._por_rodada = {}
+            for id_partida, rodada in enumerate(islice(self.rodadas, self._indexadas)):
+                if rodada != _SEM_RODADA and self.mandantes[id_partida] != _DESFEITA:
+                    self._por_rodada.setdefault(rodada, array("i")).append(id_partida)
+            self._rodadas_alteradas = False
+        inicio = self._indexadas
+        fim = len(self.mandantes)
+        por_equipe, por_rodada = self._por_equipe, self._por_rodada
+        for id_partida in range(inicio, fim):
+            if self.mandantes[id_partida] == _DESFEITA:
+                continue  # desfeita antes de indexar: o identificador não volta a ser usado
+            for equipe in (self.mandantes[id_partida], self.visitantes[id_partida]):
+                if equipe not in por_equipe:
+                    por_equipe[equipe] = array("i")
+                por_equipe[equipe].append(id_partida)
+            rodada = self.rodadas[id_partida]
+            if rodada != _SEM_RODADA:
+                if rodada not in por_rodada:
+                    por_rodada[rodada] = array("i")
+                por_rodada[rodada].append(id_partida)
+        self._indexadas = fim
+
+
+class VisaoPartidas:
+    """
+    Recorte de um ArmazemPartidas pelos primeiros `fim` identificadores de `ids`
+    (um range ou um dos índices do armazém), sem copiar colunas nem índices: a
+    visão não enxerga partidas acrescentadas depois dela. Iterar gera objetos
+    Partida; partidas desfeitas depois da criação da visão são puladas.
+    """
+
+    __slots__ = ("armazem", "ids", "fim")
+
+    def __init__(self, armazem: ArmazemPartidas, ids, fim: int):
+        self.armazem = armazem
+        self.ids = ids
+        self.fim = fim
+
+    def _ids(self):
+        return islice(self.ids, self.fim)
+
+    def __iter__(self):
+        armazem = self.armazem
+        for id_partida in self._ids():
+            if armazem.mandantes[id_partida] != _DESFEITA:
+                yield armazem.partida(id_partida)
+
+    def __len__(self):
+        mandantes = self.armazem.mandantes
+        return sum(1 for id_partida in self._ids() if mandantes[id_partida] != _DESFEITA)
+
+    def registros(self):
+        """Como ArmazemPartidas.registros, restrito à visão."""
+        armazem = self.armazem
+        for id_partida in self._ids():
+            jogo = armazem.registro(id_partida)
+            if jogo is not None:
+                yield jogo
@@ -0,0 +1,341 @@
+"""
+Benchmarks de sorteio, processamento de partidas e classificação em vários tamanhos.
+
+Uso:
+    python -m src.benchmark                         # mede e compara com a baseline, se existir
+    python -m src.benchmark --salvar                # mede e grava a baseline
+    python -m src.benchmark --tamanhos 20 200 --limiar 0.5
+
+Sai com código 1 quando alguma medição piora mais que o limiar em relação à baseline.
+A baseline padrão é benchmark_baseline.json, na raiz do repositório; os tempos dela
+valem para a máquina em que foi gravada, então regrave-a (--salvar) ao trocar de máquina.
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, NamedTuple
+
+from src.calendario import CalendarioRoundRobin
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+TAMANHOS = (20, 200, 2_000, 20_000)
+# baseline de referência versionada na raiz do repositório (não depende do diretório atual)
+BASELINE_PADRAO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmark_baseline.json")
+
+# Placar sorteado com pesos próximos aos de um campeonato real: muitos 1x0, 1x1 e 0x0,
+# o que produz grupos grandes de equipes empatadas nos critérios básicos.
+_PLACARES = ((1, 0), (0, 0), (1, 1), (2, 1), (0, 1), (2, 0), (1, 2), (2, 2), (0, 2), (3, 1), (3, 0), (1, 3))
+_PESOS = (14, 10, 12, 9, 9, 7, 6, 4, 5, 4, 3, 3)
+
+
+class Medicao(NamedTuple):
+    tamanho: int
+    cenario: str
+    tempo: float    # segundos (melhor de `repeticoes`)
+    memoria: int    # pico de memória alocada durante a operação, em bytes
+
+
+def _placares(quantidade: int, rng: random.Random):
+    return rng.choices(_PLACARES, weights=_PESOS, k=quantidade)
+
+
+def _jogos(equipes, rodadas: int, rng: random.Random):
+    ordem = equipes + ([None] if len(equipes) % 2 else [])
+    rng.shuffle(ordem)
+    calendario = CalendarioRoundRobin(ordem)
+    return [jogo for numero in range(min(rodadas, len(calendario))) for jogo in calendario[numero]]
+
+
+def _campeonato_com_resultados(tamanho: int, rodadas: int, semente: int):
+    """Campeonato sem calendário com `rodadas` rodadas já processadas (classificação ainda não calculada)."""
+    rng = random.Random(semente)
+    equipes = [Equipe(f"Equipe {i}") for i in range(tamanho)]
+    campeonato = Campeonato(equipes)
+    jogos = _jogos(equipes, rodadas, rng)
+    campeonato.processar_partidas((m, v, gm, gv) for (m, v), (gm, gv) in zip(jogos, _placares(len(jogos), rng)))
+    for equipe in rng.sample(equipes, len(equipes) // 10):  # cartões desempatam parte dos grupos
+        equipe.cartoes_amarelos = rng.randint(0, 3)
+    return campeonato
+
+
+# Cada cenário prepara o estado e retorna a operação a ser medida.
+
+def _cenario_sortear_jogos(tamanho, rodadas, semente):
+    campeonato = Campeonato([Equipe(f"Equipe {i}") for i in range(tamanho)], semente=semente)
+    return lambda: (campeonato.sortear_jogos(), campeonato.calendario[0])
+
+
+def _cenario_processar_partida(tamanho, rodadas, semente):
+    rng = random.Random(semente)
+    campeonato = Campeonato([Equipe(f"Equipe {i}") for i in range(tamanho)], semente=semente)
+    campeonato.sortear_jogos()
+    jogos = [jogo for numero in range(min(rodadas, len(campeonato.calendario)))
+             for jogo in campeonato.calendario[numero]]
+    partidas = [Partida(m, v, gm, gv) for (m, v), (gm, gv) in zip(jogos, _placares(len(jogos), rng))]
+
+    def medir():
+        for partida in partidas:  # inclui o retrato de cada rodada completada
+            campeonato.processar_partida(partida)
+    return medir
+
+
+def _cenario_calcular_classificacao(tamanho, rodadas, semente):
+    campeonato = _campeonato_com_resultados(tamanho, rodadas, semente)
+    return campeonato.calcular_classificacao
+
+
+def _cenario_recalcular_apos_correcao(tamanho, rodadas, semente):
+    campeonato = _campeonato_com_resultados(tamanho, rodadas, semente)
+    campeonato.calcular_classificacao()
+
+    def medir():
+        campeonato.corrigir_partida(0, 3, 3)
+        return campeonato.calcular_classificacao()
+    return medir
+
+
+def _cenario_determinar_classificacoes(tamanho, rodadas, semente):
+    # campeonato novo a cada repetição: nada memorizado, a tabela é ordenada de verdade
+    campeonato = _campeonato_com_resultados(tamanho, rodadas, semente)
+    return campeonato.determinar_classificacoes
+
+
+CENARIOS = {
+    "sortear_jogos": _cenario_sortear_jogos,
+    "processar_partida": _cenario_processar_partida,
+    "calcular_classificacao": _cenario_calcular_classificacao,
+    "recalcular_apos_correcao": _cenario_recalcular_apos_correcao,
+    "determinar_classificacoes": _cenario_determinar_classificacoes,
+}
+
+
+def medir(cenario: str, tamanho: int, rodadas: int = 2, repeticoes: int = 3, semente: int = 0) -> Medicao:
+    """
+    Mede o cenário: o tempo é o melhor de `repeticoes` execuções (estado novo a cada uma)
+    e a memória vem de uma execução separada sob tracemalloc, que distorce o tempo.
+    """
+    preparar = CENARIOS[cenario]
+    tempos = []
+    for _ in range(repeticoes):
+        operacao = preparar(tamanho, rodadas, semente)
+        gc.collect()
+        inicio = time.perf_counter()
+        operacao()
+        tempos.append(time.perf_counter() - inicio)
+
+    operacao = preparar(tamanho, rodadas, semente)
+    gc.collect()
+    ativo = tracemalloc.is_tracing()
+    if not ativo:
+        tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        operacao()
+        pico = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        if not ativo:
+            tracemalloc.stop()
+    return Medicao(tamanho, cenario, min(tempos), max(pico, 0))
+
+
+def executar(tamanhos=TAMANHOS, cenarios=None, rodadas: int = 2, repeticoes: int = 3, semente: int = 0,
+             progresso=None) -> List[Medicao]:
+    medicoes = []
+    for tamanho in tamanhos:
+        for cenario in cenarios or CENARIOS:
+            medicao = medir(cenario, tamanho, rodadas, repeticoes, semente)
+            medicoes.append(medicao)
+            if progresso:
+                progresso(medicao)
+    return medicoes
+
+
+# LAÇO DE REFERÊNCIA
+
+class _EstatisticasReferencia:
+    def __init__(self):
+        self.pontos = self.vitorias = self.empates = self.derrotas = 0
+        self.gols_marcados = self.gols_sofridos = 0
+
+    def registrar(self, gols_marcados: int, gols_sofridos: int):
+        if gols_marcados < 0 or gols_sofridos < 0:
+            raise ValueError("Os gols não podem ser negativos.")
+        self.gols_marcados += gols_marcados
+        self.gols_sofridos += gols_sofridos
+        if gols_marcados > gols_sofridos:
+            self.pontos += 3
+            self.vitorias += 1
+        elif gols_marcados == gols_sofridos:
+            self.pontos += 1
+            self.empates += 1
+        else:
+            self.derrotas += 1
+
+
+def laco_referencia(jogos) -> dict:
+    """
+    O processamento partida a partida da versão original do Campeonato: estatísticas em
+    atributos de cada equipe e confronto direto em dicionário por par, sem colunas,
+    observadores, calendário nem registro de partidas. É a régua de razao_processar_partida.
+    """
+    estatisticas, confrontos = {}, {}
+    for mandante, visitante, gols_m, gols_v in jogos:
+        for nome in (mandante.nome, visitante.nome):
+            if nome not in estatisticas:
+                estatisticas[nome] = _EstatisticasReferencia()
+        estatisticas[mandante.nome].registrar(gols_m, gols_v)
+        estatisticas[visitante.nome].registrar(gols_v, gols_m)
+        chave = frozenset((mandante.nome, visitante.nome))
+        if chave not in confrontos:
+            confrontos[chave] = {mandante.nome: [0, 0, 0], visitante.nome: [0, 0, 0]}
+        registro = confrontos[chave]
+        if gols_m > gols_v:
+            registro[mandante.nome][0] += 3
+        elif gols_m < gols_v:
+            registro[visitante.nome][0] += 3
+        else:
+            registro[mandante.nome][0] += 1
+            registro[visitante.nome][0] += 1
+        registro[mandante.nome][1] += gols_m
+        registro[mandante.nome][2] += gols_v
+        registro[visitante.nome][1] += gols_v
+        registro[visitante.nome][2] += gols_m
+    return estatisticas
+
+
+def razao_processar_partida(tamanho: int = 200, partidas: int = 100_000, repeticoes: int = 3,
+                            semente: int = 0) -> float:
+    """
+    Tempo de Campeonato.processar_partida sobre `partidas` resultados aleatórios (sem
+    calendário) dividido pelo tempo de laco_referencia sobre os mesmos resultados, cada
+    um o melhor de `repeticoes`. O Campeonato ainda valida, consome o calendário, guarda
+    a partida e avisa a classificação, e fica perto de 2.5; a versão que reordenava a
+    tabela a cada estatística escrita passava de 5.
+    """
+    rng = random.Random(semente)
+    equipes = [Equipe(f"Equipe {i}") for i in range(tamanho)]
+    jogos = [(*rng.sample(equipes, 2), gm, gv) for gm, gv in _placares(partidas, rng)]
+
+    def processar():
+        campeonato = Campeonato([Equipe(equipe.nome) for equipe in equipes])
+        pares = {equipe.nome: novo for equipe, novo in zip(equipes, campeonato.equipes)}
+        lote = [Partida(pares[m.nome], pares[v.nome], gm, gv) for m, v, gm, gv in jogos]
+        gc.collect()
+        inicio = time.perf_counter()
+        for partida in lote:
+            campeonato.processar_partida(partida)
+        return time.perf_counter() - inicio
+
+    def referencia():
+        gc.collect()
+        inicio = time.perf_counter()
+        laco_referencia(jogos)
+        return time.perf_counter() - inicio
+
+    return min(processar() for _ in range(repeticoes)) / min(referencia() for _ in range(repeticoes))
+
+
+def razao_processar_partidas(tamanho: int = 200, partidas: int = 100_000, repeticoes: int = 3,
+                             semente: int = 0) -> float:
+    """
+    Quantas vezes processar_partidas (um lote) é mais rápido que processar_partida
+    chamada para cada um dos mesmos `partidas` resultados aleatórios, sem calendário;
+    cada lado é o melhor de `repeticoes`, com campeonato novo. A meta é 10; hoje o
+    lote fica perto de 3.5.
+    """
+    rng = random.Random(semente)
+    jogos = [(*rng.sample(range(tamanho), 2), gm, gv) for gm, gv in _placares(partidas, rng)]
+
+    def cronometrar(em_lote: bool):
+        campeonato = Campeonato([Equipe(f"Equipe {i}") for i in range(tamanho)])
+        equipes = campeonato.equipes
+        if em_lote:
+            lote = [(equipes[i], equipes[j], gm, gv) for i, j, gm, gv in jogos]
+            operacao = lambda: campeonato.processar_partidas(lote)
+        else:
+            lote = [Partida(equipes[i], equipes[j], gm, gv) for i, j, gm, gv in jogos]
+            operacao = lambda: [campeonato.processar_partida(partida) for partida in lote]
+        gc.collect()
+        inicio = time.perf_counter()
+        operacao()
+        return time.perf_counter() - inicio
+
+    por_partida = min(cronometrar(False) for _ in range(repeticoes))
+    return por_partida / min(cronometrar(True) for _ in range(repeticoes))
+
+
+# BASELINE
+
+def salvar_baseline(medicoes: List[Medicao], caminho: str = BASELINE_PADRAO):
+    """Grava (ou atualiza) as medições no arquivo JSON {tamanho: {cenário: {tempo, memoria}}}."""
+    dados = carregar_baseline(caminho) if os.path.exists(caminho) else {}
+    for medicao in medicoes:
+        dados.setdefault(str(medicao.tamanho), {})[medicao.cenario] = {
+            "tempo": medicao.tempo, "memoria": medicao.memoria}
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(dados, arquivo, indent=2, sort_keys=True)
+
+
+def carregar_baseline(caminho: str = BASELINE_PADRAO) -> Dict[str, Dict[str, dict]]:
+    with open(caminho, encoding="utf-8") as arquivo:
+        return json.load(arquivo)
+
+
+def comparar(medicoes: List[Medicao], baseline, limiar: float = 0.25, folga_tempo: float = 0.001,
+             folga_memoria: int = 64 * 1024) -> List[str]:
+    """
+    Regressões em relação à baseline: valor acima de (1 + limiar) × baseline e acima da
+    folga absoluta (para que ruído em medições muito pequenas não reprove).
+    """
+    regressoes = []
+    for medicao in medicoes:
+        referencia = baseline.get(str(medicao.tamanho), {}).get(medicao.cenario)
+        if referencia is None:
+            continue
+        for campo, folga, unidade in (("tempo", folga_tempo, "s"), ("memoria", folga_memoria, "B")):
+            atual, anterior = getattr(medicao, campo), referencia[campo]
+            if atual > anterior * (1 + limiar) and atual - anterior > folga:
+                regressoes.append(f"{medicao.cenario} N={medicao.tamanho}: {campo} {atual:.6g}{unidade} "
+                                  f"(baseline {anterior:.6g}{unidade}, +{(atual / anterior - 1) * 100 if anterior else float('inf'):.0f}%)")
+    return regressoes
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m src.benchmark", description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=list(TAMANHOS))
+    parser.add_argument("--cenarios", nargs="+", choices=list(CENARIOS), default=None)
+    parser.add_argument("--rodadas", type=int, default=2, help="rodadas processadas antes de classificar")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--baseline", default=BASELINE_PADRAO)
+    parser.add_argument("--limiar", type=float, default=0.25, help="piora relativa tolerada (0.25 = 25%%)")
+    parser.add_argument("--salvar", action="store_true", help="grava as medições como nova baseline")
+    args = parser.parse_args(argv)
+
+    def progresso(medicao):
+        print(f"{medicao.cenario:<28}N={medicao.tamanho:<7}{medicao.tempo * 1000:>11.3f} ms"
+              f"{medicao.memoria / 1024:>12.1f} KiB", flush=True)
+
+    medicoes = executar(args.tamanhos, args.cenarios, args.rodadas, args.repeticoes, progresso=progresso)
+    if args.salvar:
+        salvar_baseline(medicoes, args.baseline)
+        print(f"Baseline gravada em {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"Sem baseline em {args.baseline}; use --salvar para criá-la.")
+        return 0
+    regressoes = comparar(medicoes, carregar_baseline(args.baseline), args.limiar)
+    for regressao in regressoes:
+        print(f"REGRESSÃO: {regressao}", file=sys.stderr)
+    return 1 if regressoes else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
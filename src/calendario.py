@@ -0,0 +1,180 @@
+from collections import deque
+from functools import lru_cache
+
+
+def _origem(n: int, posicao: int, rodada: int) -> int:
+    """Posição na lista inicial da equipe que ocupa `posicao` na rodada `rodada` do turno."""
+    return 0 if posicao == 0 else (posicao - 1 - rodada) % (n - 1) + 1
+
+
+@lru_cache(maxsize=64)
+def _modelo_posicoes(n: int):
+    """
+    Posições 1..N-1 da lista inicial repetidas duas vezes, para que a rotação de
+    qualquer rodada seja uma fatia. Depende só de N e é compartilhado entre campeonatos.
+    """
+    return tuple(range(1, n)) * 2
+
+
+class CalendarioRoundRobin:
+    """
+    Calendário de turno e returno calculado sob demanda a partir da ordem sorteada.
+
+    Equivale a rodar a lista mantendo o primeiro elemento fixo a cada rodada do turno
+    e inverter os mandos no returno, mas nenhuma rodada é guardada: o confronto de
+    qualquer (rodada, posição) sai de aritmética modular sobre a ordem inicial.
+    """
+
+    def __init__(self, ordem):
+        """`ordem`: equipes já registradas em um campeonato (com `id`), None marcando a folga."""
+        if len(ordem) % 2 != 0:
+            raise ValueError("A ordem do calendário deve ter número par de posições (use None como folga).")
+        self.ordem = list(ordem)  # equipes na ordem sorteada; None marca a folga
+        self.n = len(self.ordem)
+        self._posicoes = {}  # id da equipe -> posição na ordem
+        for q, equipe in enumerate(self.ordem):
+            if equipe is not None:
+                if equipe.id is None:
+                    raise ValueError(f"A equipe {equipe.nome} não pertence a nenhum campeonato (sem id).")
+                self._posicoes[equipe.id] = q
+
+    @property
+    def rodadas_por_turno(self) -> int:
+        return max(self.n - 1, 0)
+
+    @property
+    def jogos_por_rodada(self) -> int:
+        return self.n // 2 - (1 if None in self.ordem else 0)
+
+    def __len__(self):
+        return 2 * self.rodadas_por_turno
+
+    def __iter__(self):
+        for numero in range(len(self)):
+            yield self.rodada(numero)
+
+    def __getitem__(self, numero: int):
+        if numero < 0:
+            numero += len(self)
+        return self.rodada(numero)
+
+    def rodada(self, numero: int):
+        """Lista de (mandante, visitante) da rodada `numero` (0-indexada; returno após o turno)."""
+        if not 0 <= numero < len(self):
+            raise IndexError(f"Rodada {numero} fora do calendário.")
+        turno, base = divmod(numero, self.rodadas_por_turno)
+        m, metade = self.rodadas_por_turno, self.n // 2
+        # posições 1..n-1 da rodada `base`: a lista inicial girada `base` vezes
+        girada = _modelo_posicoes(self.n)[m - base:2 * m - base]
+        ordem = self.ordem
+        mandantes = [ordem[0]] + [ordem[q] for q in girada[:metade - 1]]
+        visitantes = [ordem[q] for q in reversed(girada[metade - 1:])]
+        if turno == 1:
+            mandantes, visitantes = visitantes, mandantes
+        return [jogo for jogo in zip(mandantes, visitantes) if None not in jogo]
+
+    def equipe_na_posicao(self, posicao: int, rodada: int):
+        """
+        Equipe (ou None, a folga) na posição `posicao` da rodada `rodada` do turno: a
+        posição s enfrenta a n - 1 - s, e as posições da primeira metade são mandantes.
+        """
+        return self.ordem[_origem(self.n, posicao, rodada)]
+
+    def rodada_do_jogo(self, mandante, visitante):
+        """Rodada (0-indexada) em que `mandante` recebe `visitante`, em O(1); None se não houver."""
+        qa, qb = self._posicao(mandante), self._posicao(visitante)
+        if qa is None or qb is None or qa == qb:
+            return None
+        m = self.rodadas_por_turno
+        if qa == 0:
+            return (m - qb) % m
+        if qb == 0:
+            return (m - qa) % m + m
+        # as posições x, y de qa e qb na rodada r somam m - 2; como m é ímpar, 2 tem inverso mod m
+        rodada = (m - qa - qb) * ((m + 1) // 2) % m
+        posicao_a = (qa - 1 + rodada) % m + 1
+        return rodada if posicao_a < self.n // 2 else rodada + m
+
+    def _posicao(self, equipe):
+        """Posição da equipe na ordem pelo id, ou None se ela não está neste calendário."""
+        q = self._posicoes.get(equipe.id)
+        return q if q is not None and self.ordem[q] is equipe else None
+
+    def jogos_da_equipe(self, equipe):
+        """Lista (rodada, mandante, visitante) de todos os jogos da equipe, em ordem de rodada."""
+        q = self._posicao(equipe)
+        if q is None:
+            raise ValueError(f"A equipe {equipe.nome} não está no calendário.")
+        m = self.rodadas_por_turno
+        jogos = []
+        for rodada in range(m):
+            posicao = 0 if q == 0 else (q - 1 + rodada) % m + 1
+            adversario = self.equipe_na_posicao(self.n - 1 - posicao, rodada)
+            if adversario is None:
+                continue
+            # a primeira metade das posições joga em casa no turno
+            jogos.append((rodada, equipe, adversario) if posicao < self.n // 2 else (rodada, adversario, equipe))
+        return jogos + [(rodada + m, visitante, mandante) for rodada, mandante, visitante in jogos]
+
+
+class PendenciasPorLista:
+    """Jogos pendentes de um calendário materializado (lista de rodadas)."""
+
+    def __init__(self, rodadas, indice):
+        self._pendentes = {}
+        self._faltam = [len(rodada) for rodada in rodadas]
+        for numero, rodada in enumerate(rodadas):
+            for mandante, visitante in rodada:
+                self._pendentes.setdefault((indice(mandante), indice(visitante)), deque()).append(numero)
+
+    def consumir(self, i: int, j: int):
+        """Marca o jogo como disputado na primeira rodada pendente; retorna a rodada ou None."""
+        fila = self._pendentes.get((i, j))
+        if not fila:
+            return None
+        rodada = fila.popleft()
+        self._faltam[rodada] -= 1
+        return rodada
+
+    def devolver(self, i: int, j: int, rodada: int):
+        self._pendentes[(i, j)].appendleft(rodada)
+        self._faltam[rodada] += 1
+
+    def faltam(self, rodada: int) -> int:
+        return self._faltam[rodada]
+
+
+class PendenciasRoundRobin:
+    """
+    Jogos pendentes de um CalendarioRoundRobin sem materializar as rodadas:
+    a rodada de cada jogo vem de CalendarioRoundRobin.rodada_do_jogo e só os jogos
+    já disputados são guardados.
+    """
+
+    def __init__(self, calendario: CalendarioRoundRobin, equipes, disputados=(), faltam=None):
+        """`disputados` e `faltam` restauram um estado salvo (ver estado())."""
+        self._calendario = calendario
+        self._equipes = equipes
+        self._disputados = set(disputados)
+        self._faltam = list(faltam) if faltam is not None else [calendario.jogos_por_rodada] * len(calendario)
+
+    def estado(self):
+        """(pares (i, j) já disputados, jogos que faltam em cada rodada), para checkpoints."""
+        return sorted(self._disputados), list(self._faltam)
+
+    def consumir(self, i: int, j: int):
+        if (i, j) in self._disputados:
+            return None
+        rodada = self._calendario.rodada_do_jogo(self._equipes[i], self._equipes[j])
+        if rodada is None:
+            return None
+        self._disputados.add((i, j))
+        self._faltam[rodada] -= 1
+        return rodada
+
+    def devolver(self, i: int, j: int, rodada: int):
+        self._disputados.discard((i, j))
+        self._faltam[rodada] += 1
+
+    def faltam(self, rodada: int) -> int:
+        return self._faltam[rodada]
@@ -0,0 +1,236 @@
+import mmap
+import random
+import struct
+import sys
+from array import array
+
+from src.armazem_partidas import COLUNAS_PARTIDAS
+from src.calendario import CalendarioRoundRobin, PendenciasRoundRobin
+from src.campeonato import Campeonato
+from src.confrontos import ConfrontosDiretos, _Esparso
+from src.equipe import CAMPOS_ESTATISTICAS, Equipe
+
+# Formato binário (little-endian):
+#   cabeçalho   "CAMP", versão (u16), número de equipes (u32)
+#   nomes       tamanho (u16) + UTF-8, por equipe
+#   estatísticas uma coluna int64 por campo, na ordem de CAMPOS_ESTATISTICAS
+#   confrontos  modo (u8: 0 denso, 1 esparso) + matrizes int32 de pontos e gols pró
+#               (no modo esparso, antes delas, a quantidade e as células usadas, u64)
+#   adversários quantidade de pares (u64) + pares (i, j) int32
+#   jogos       quantidade (u64) + as colunas de ArmazemPartidas, na ordem de COLUNAS_PARTIDAS
+#               (cada uma com o tipo da sua array); partidas desfeitas têm mandante -1
+#               (mantêm o identificador das demais)
+#   rodadas     quantidade (u32) + jogos por rodada (u32) + pares (i, j) int32; só as rodadas
+#               definidas à mão (o calendário sorteado vai na última seção)
+#   gerador     estado do Mersenne Twister (625 × u32) + gauss (u8 + f64)
+#   histórico   quantidade de retratos (u32) + número de cada rodada (u32), ordens da
+#               classificação (n × u32 por retrato) e estatísticas (n × campos int64 por
+#               retrato, na ordem de CAMPOS_ESTATISTICAS)
+#   calendário  posições da ordem sorteada (u32; 0 sem calendário sorteado) + ordem (ids int32,
+#               -1 na folga) + pendências: jogos disputados (u64) + pares (i, j) int32 + jogos
+#               que faltam em cada rodada (u32)
+MAGICO = b"CAMP"
+VERSAO = 1
+
+_CABECALHO = struct.Struct("<4sHI")
+_INVERTER = sys.byteorder != "little"
+
+
+def _bytes(valores: array) -> bytes:
+    if _INVERTER:
+        valores = array(valores.typecode, valores)
+        valores.byteswap()
+    return valores.tobytes()
+
+
+def para_bytes(campeonato: Campeonato) -> bytes:
+    """Serializa o estado completo do campeonato no formato binário atual."""
+    n = len(campeonato.equipes)
+    calendario = campeonato.calendario
+    # antes de gravar os jogos: montar as pendências pode definir a rodada de jogos antigos
+    pendencias = campeonato.pendencias_do_calendario() if calendario is not None else None
+    partes = [_CABECALHO.pack(MAGICO, VERSAO, n)]
+
+    for equipe in campeonato.equipes:
+        nome = equipe.nome.encode("utf-8")
+        partes.append(struct.pack("<H", len(nome)) + nome)
+
+    for coluna in campeonato.colunas_estatisticas.colunas:
+        partes.append(_bytes(coluna))
+
+    confrontos = campeonato.confrontos
+    if isinstance(confrontos.pontos, array):
+        partes.append(struct.pack("<B", 0))
+        partes.append(_bytes(confrontos.pontos))
+        partes.append(_bytes(confrontos.gols_pro))
+    else:
+        celulas = sorted(set(confrontos.pontos) | set(confrontos.gols_pro))
+        partes.append(struct.pack("<BQ", 1, len(celulas)))
+        partes.append(_bytes(array("Q", celulas)))
+        partes.append(_bytes(array("i", (confrontos.pontos[c] for c in celulas))))
+        partes.append(_bytes(array("i", (confrontos.gols_pro[c] for c in celulas))))
+    pares = array("i", (indice for par in confrontos.pares() for indice in par))
+    partes.append(struct.pack("<Q", len(pares) // 2) + _bytes(pares))
+
+    partes.append(struct.pack("<Q", len(campeonato.partidas)))
+    for coluna in campeonato.partidas.colunas:
+        partes.append(_bytes(coluna))
+
+    indice = campeonato.registro.indice
+    rodadas = campeonato.rodadas if calendario is None else []  # o sorteado não é materializado
+    partes.append(struct.pack("<I", len(rodadas)))
+    partes.append(_bytes(array("I", (len(rodada) for rodada in rodadas))))
+    partes.append(_bytes(array("i", (indice(equipe) for rodada in rodadas for jogo in rodada for equipe in jogo))))
+
+    _, estado, gauss = campeonato.rng.getstate()
+    partes.append(_bytes(array("I", estado)))
+    partes.append(struct.pack("<Bd", gauss is not None, gauss or 0.0))
+
+    retratos = [campeonato.historico.retratos[r] for r in sorted(campeonato.historico.retratos)]
+    partes.append(struct.pack("<I", len(retratos)))
+    partes.append(_bytes(array("I", (retrato.rodada for retrato in retratos))))
+    partes.append(_bytes(array("I", (indice for retrato in retratos for indice in retrato.ordem))))
+    partes.append(_bytes(array("q", (valor for retrato in retratos for linha in retrato.linhas for valor in linha))))
+
+    if calendario is None:
+        partes.append(struct.pack("<I", 0))
+    else:
+        partes.append(struct.pack("<I", calendario.n))
+        partes.append(_bytes(array("i", (-1 if equipe is None else indice(equipe) for equipe in calendario.ordem))))
+        disputados, faltam = pendencias.estado()
+        partes.append(struct.pack("<Q", len(disputados)))
+        partes.append(_bytes(array("i", (i for par in disputados for i in par))))
+        partes.append(_bytes(array("I", faltam)))
+    return b"".join(partes)
+
+
+def salvar(campeonato: Campeonato, caminho: str):
+    """Grava o checkpoint do campeonato em `caminho` com uma única escrita."""
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(para_bytes(campeonato))
+
+
+def de_bytes(dados) -> Campeonato:
+    """Reconstrói um campeonato a partir de bytes (ou memoryview) no formato atual."""
+    leitor = _Leitor(memoryview(dados))
+    magico, versao, n = leitor.struct(_CABECALHO)
+    if magico != MAGICO:
+        raise ValueError("Arquivo não é um checkpoint de campeonato.")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de checkpoint não suportada: {versao}")
+    return _ler(leitor, n)
+
+
+def carregar(caminho: str) -> Campeonato:
+    """Restaura um campeonato mapeando o arquivo em memória (sem ler e analisar linha a linha)."""
+    with open(caminho, "rb") as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        visao = memoryview(mapa)
+        try:
+            return de_bytes(visao)
+        finally:
+            visao.release()
+
+
+class _Leitor:
+    """Cursor sobre o buffer do checkpoint."""
+
+    def __init__(self, dados: memoryview):
+        self.dados = dados
+        self.posicao = 0
+
+    def struct(self, formato):
+        formato = formato if isinstance(formato, struct.Struct) else struct.Struct(formato)
+        valores = formato.unpack_from(self.dados, self.posicao)
+        self.posicao += formato.size
+        return valores
+
+    def array(self, tipo: str, quantidade: int) -> array:
+        valores = array(tipo)
+        fim = self.posicao + quantidade * valores.itemsize
+        valores.frombytes(self.dados[self.posicao:fim])
+        self.posicao = fim
+        if _INVERTER:
+            valores.byteswap()
+        return valores
+
+
+def _ler_historico(leitor: _Leitor, campeonato: Campeonato):
+    n = len(campeonato.equipes)
+    campos = len(campeonato.colunas_estatisticas.colunas)
+    (quantidade,) = leitor.struct("<I")
+    numeros = leitor.array("I", quantidade)
+    ordens = leitor.array("I", quantidade * n)
+    valores = leitor.array("q", quantidade * n * campos)
+    tamanho = n * campos
+    for k, rodada in enumerate(numeros):
+        bloco = valores[k * tamanho:(k + 1) * tamanho]
+        linhas = [tuple(bloco[i * campos:(i + 1) * campos]) for i in range(n)]
+        campeonato.historico.restaurar(rodada, ordens[k * n:(k + 1) * n], linhas)
+
+
+def _ler_calendario(leitor: _Leitor, campeonato: Campeonato):
+    (posicoes,) = leitor.struct("<I")
+    if posicoes == 0:
+        return
+    equipes = campeonato.equipes
+    calendario = CalendarioRoundRobin([equipes[i] if i >= 0 else None for i in leitor.array("i", posicoes)])
+    (quantidade,) = leitor.struct("<Q")
+    pares = leitor.array("i", 2 * quantidade)
+    faltam = leitor.array("I", len(calendario))
+    pendencias = PendenciasRoundRobin(calendario, equipes, zip(pares[::2], pares[1::2]), faltam)
+    campeonato.definir_calendario(calendario, pendencias)
+
+
+def _ler(leitor: _Leitor, n: int) -> Campeonato:
+    equipes = []
+    for _ in range(n):
+        (tamanho,) = leitor.struct("<H")
+        equipes.append(Equipe(bytes(leitor.dados[leitor.posicao:leitor.posicao + tamanho]).decode("utf-8")))
+        leitor.posicao += tamanho
+    estatisticas = [leitor.array("q", n) for _ in CAMPOS_ESTATISTICAS]
+
+    # as matrizes lidas vão direto para o campeonato, sem alocar as vazias do construtor
+    confrontos = ConfrontosDiretos.__new__(ConfrontosDiretos)
+    confrontos.n_equipes = n
+    (modo,) = leitor.struct("<B")
+    if modo == 0:
+        confrontos.pontos = leitor.array("i", n * n)
+        confrontos.gols_pro = leitor.array("i", n * n)
+    else:
+        (quantidade,) = leitor.struct("<Q")
+        celulas = leitor.array("Q", quantidade)
+        confrontos.pontos = _Esparso(zip(celulas, leitor.array("i", quantidade)))
+        confrontos.gols_pro = _Esparso(zip(celulas, leitor.array("i", quantidade)))
+    confrontos.adversarios = {}
+    (quantidade,) = leitor.struct("<Q")
+    pares = leitor.array("i", 2 * quantidade)
+    for i, j in zip(pares[::2], pares[1::2]):
+        confrontos.ligar(i, j)
+
+    campeonato = Campeonato(equipes, confrontos=confrontos)
+    for coluna, valores in zip(campeonato.colunas_estatisticas.colunas, estatisticas):
+        coluna[:] = valores
+
+    (quantidade,) = leitor.struct("<Q")
+    for coluna, (_, tipo) in zip(campeonato.partidas.colunas, COLUNAS_PARTIDAS):
+        coluna.extend(leitor.array(tipo, quantidade))
+
+    (n_rodadas,) = leitor.struct("<I")
+    tamanhos = leitor.array("I", n_rodadas)
+    indices = leitor.array("i", 2 * sum(tamanhos))
+    rodadas = []
+    inicio = 0
+    for tamanho in tamanhos:
+        fim = inicio + 2 * tamanho
+        rodadas.append([(equipes[i], equipes[j]) for i, j in zip(indices[inicio:fim:2], indices[inicio + 1:fim:2])])
+        inicio = fim
+    campeonato.rodadas = rodadas
+
+    estado = tuple(leitor.array("I", 625))
+    tem_gauss, gauss = leitor.struct("<Bd")
+    campeonato.rng = random.Random()
+    campeonato.rng.setstate((3, estado, gauss if tem_gauss else None))
+
+    _ler_historico(leitor, campeonato)
+    _ler_calendario(leitor, campeonato)
+    return campeonato
@@ -0,0 +1,78 @@
+from bisect import bisect_left, insort
+
+
+class TabelaClassificacao:
+    """
+    Mantém as equipes de um campeonato ordenadas pela chave básica
+    (pontos, vitórias, saldo, gols marcados) entre uma consulta e outra.
+
+    Cada alteração de estatística apenas marca a equipe como suja; na consulta
+    seguinte só as equipes sujas são reposicionadas (busca binária) e só os
+    grupos empatados que as envolvem passam de novo pelos desempates.
+    """
+
+    def __init__(self, campeonato):
+        self.campeonato = campeonato
+        self._entradas = []          # (chave negada, índice), em ordem crescente
+        self._chaves = [None] * len(campeonato.equipes)  # índice -> chave negada atualmente em _entradas
+        self._sujas = set(range(len(campeonato.equipes)))
+        self._grupos_resolvidos = {}  # chave negada -> grupo já desempatado
+        self._resultado = None
+        # marcar(indice): registra que as estatísticas (ou confrontos) da equipe mudaram.
+        # É o próprio set.add, chamado a cada escrita nas colunas sem criar frame Python.
+        self.marcar = self._sujas.add
+
+    def reiniciar(self):
+        """Descarta a ordem mantida: a próxima consulta reordena todas as equipes a partir das colunas."""
+        self._entradas.clear()
+        self._chaves = [None] * len(self.campeonato.equipes)
+        self._sujas.update(range(len(self.campeonato.equipes)))
+        self._grupos_resolvidos.clear()
+        self._resultado = None
+
+    def ordenadas(self):
+        """Retorna a classificação completa, com todos os critérios de desempate."""
+        if self._sujas:
+            self._reposicionar()
+            self._resultado = None
+        if self._resultado is None:
+            self._resultado = self._montar()
+        return tuple(self._resultado)
+
+    def _reposicionar(self):
+        colunas = self.campeonato.colunas_estatisticas
+        pontos, vitorias = colunas.pontos, colunas.vitorias
+        gols_marcados, gols_sofridos = colunas.gols_marcados, colunas.gols_sofridos
+        for indice in self._sujas:
+            antiga = self._chaves[indice]
+            if antiga is not None:
+                del self._entradas[bisect_left(self._entradas, (antiga, indice))]
+                self._grupos_resolvidos.pop(antiga, None)
+            gols = gols_marcados[indice]
+            nova = (-pontos[indice], -vitorias[indice], gols_sofridos[indice] - gols, -gols)
+            self._chaves[indice] = nova
+            self._grupos_resolvidos.pop(nova, None)
+            insort(self._entradas, (nova, indice))
+        self._sujas.clear()
+
+    def _montar(self):
+        equipes = self.campeonato.equipes
+        entradas = self._entradas
+        resultado = []
+        i = 0
+        total = len(entradas)
+        while i < total:
+            chave = entradas[i][0]
+            fim = i + 1
+            while fim < total and entradas[fim][0] == chave:
+                fim += 1
+            if fim - i == 1:
+                resultado.append(equipes[entradas[i][1]])
+            else:
+                grupo = self._grupos_resolvidos.get(chave)
+                if grupo is None:
+                    grupo = self.campeonato._desempatar_grupo([equipes[indice] for _, indice in entradas[i:fim]])
+                    self._grupos_resolvidos[chave] = grupo
+                resultado.extend(grupo)
+            i = fim
+        return resultado
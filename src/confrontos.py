@@ -0,0 +1,192 @@
+from array import array
+from collections.abc import Mapping
+
+# Acima deste número de equipes as matrizes N×N passam a ser esparsas (dict)
+LIMITE_DENSO = 1024
+
+
+class _Esparso(dict):
+    """Dicionário que lê 0 para células ausentes sem criá-las."""
+
+    def __missing__(self, chave):
+        return 0
+
+
+class ConfrontosDiretos:
+    """
+    Resultados acumulados de confronto direto, indexados pela posição das equipes.
+
+    Guarda duas matrizes N×N achatadas (célula i * N + j, do ponto de vista de i
+    contra j): pontos conquistados e gols marcados. Os gols sofridos de i contra j
+    são os gols marcados de j contra i. Até LIMITE_DENSO equipes as matrizes são
+    arrays contíguas; acima disso, dicionários com as mesmas células.
+    """
+
+    def __init__(self, n_equipes: int):
+        self.n_equipes = n_equipes
+        if n_equipes <= LIMITE_DENSO:
+            self.pontos = array("i", bytes(4 * n_equipes * n_equipes))
+            self.gols_pro = array("i", bytes(4 * n_equipes * n_equipes))
+        else:
+            self.pontos = _Esparso()
+            self.gols_pro = _Esparso()
+        # adversários já enfrentados, só das equipes que já jogaram, para percorrer só as células usadas
+        self.adversarios = {}
+
+    def copiar(self):
+        copia = ConfrontosDiretos.__new__(ConfrontosDiretos)
+        copia.n_equipes = self.n_equipes
+        copia.pontos = self.pontos.__copy__() if isinstance(self.pontos, array) else _Esparso(self.pontos)
+        copia.gols_pro = self.gols_pro.__copy__() if isinstance(self.gols_pro, array) else _Esparso(self.gols_pro)
+        copia.adversarios = {i: set(a) for i, a in self.adversarios.items()}
+        return copia
+
+    def registrar(self, mandante: int, visitante: int, gols_mandante: int, gols_visitante: int):
+        """Acumula o resultado de uma partida entre as equipes de índices dados."""
+        n = self.n_equipes
+        ida = mandante * n + visitante
+        volta = visitante * n + mandante
+        if gols_mandante > gols_visitante:
+            self.pontos[ida] += 3
+        elif gols_mandante < gols_visitante:
+            self.pontos[volta] += 3
+        else:
+            self.pontos[ida] += 1
+            self.pontos[volta] += 1
+        self.gols_pro[ida] += gols_mandante
+        self.gols_pro[volta] += gols_visitante
+        self.ligar(mandante, visitante)
+
+    def remover(self, mandante: int, visitante: int, gols_mandante: int, gols_visitante: int):
+        """Desfaz um resultado antes acumulado por registrar."""
+        n = self.n_equipes
+        ida = mandante * n + visitante
+        volta = visitante * n + mandante
+        if gols_mandante > gols_visitante:
+            self.pontos[ida] -= 3
+        elif gols_mandante < gols_visitante:
+            self.pontos[volta] -= 3
+        else:
+            self.pontos[ida] -= 1
+            self.pontos[volta] -= 1
+        self.gols_pro[ida] -= gols_mandante
+        self.gols_pro[volta] -= gols_visitante
+        if not self.disputado(mandante, visitante):
+            for i, j in ((mandante, visitante), (visitante, mandante)):
+                adversarios = self.adversarios.get(i)
+                if adversarios is not None:
+                    adversarios.discard(j)
+                    if not adversarios:
+                        del self.adversarios[i]
+            if isinstance(self.pontos, _Esparso):
+                for celula in (ida, volta):
+                    self.pontos.pop(celula, None)
+                    self.gols_pro.pop(celula, None)
+
+    def registrar_lote(self, mandantes, visitantes, gols_mandantes, gols_visitantes):
+        """Acumula vários resultados de uma vez, dados em colunas alinhadas."""
+        n = self.n_equipes
+        pontos, gols_pro = self.pontos, self.gols_pro
+        for mandante, visitante, gols_mandante, gols_visitante in zip(mandantes, visitantes, gols_mandantes,
+                                                                      gols_visitantes):
+            ida = mandante * n + visitante
+            volta = visitante * n + mandante
+            if gols_mandante > gols_visitante:
+                pontos[ida] += 3
+            elif gols_mandante < gols_visitante:
+                pontos[volta] += 3
+            else:
+                pontos[ida] += 1
+                pontos[volta] += 1
+            gols_pro[ida] += gols_mandante
+            gols_pro[volta] += gols_visitante
+        for mandante, visitante in set(zip(mandantes, visitantes)):
+            self.ligar(mandante, visitante)
+
+    def ligar(self, a: int, b: int):
+        """Marca as equipes a e b como adversárias já enfrentadas (cria os conjuntos sob demanda)."""
+        adversarios = self.adversarios
+        if a in adversarios:
+            adversarios[a].add(b)
+        else:
+            adversarios[a] = {b}
+        if b in adversarios:
+            adversarios[b].add(a)
+        else:
+            adversarios[b] = {a}
+
+    def pontuacao(self, equipe: int, adversaria: int):
+        """(pontos, saldo, gols pró) de `equipe` nos jogos contra `adversaria`."""
+        n = self.n_equipes
+        pro = self.gols_pro[equipe * n + adversaria]
+        return (self.pontos[equipe * n + adversaria], pro - self.gols_pro[adversaria * n + equipe], pro)
+
+    def disputado(self, a: int, b: int) -> bool:
+        """Indica se há ao menos um confronto registrado entre as duas equipes."""
+        n = self.n_equipes
+        # toda partida dá pontos a pelo menos um dos lados
+        return self.pontos[a * n + b] + self.pontos[b * n + a] > 0
+
+    def mini_tabela(self, indices):
+        """
+        Soma (pontos, saldo, gols pró) de cada equipe do grupo apenas contra as demais do grupo.
+
+        Percorre só os adversários já enfrentados, então o custo é O(k + confrontos
+        registrados entre membros), e não O(k²), quando o grupo é grande e esparso.
+        """
+        n = self.n_equipes
+        pontos, gols_pro = self.pontos, self.gols_pro
+        membros = set(indices)
+        tabela = {}
+        for i in indices:
+            p = saldo = gp = 0
+            linha = i * n
+            for j in self.adversarios.get(i, ()):
+                if j in membros:
+                    pro = gols_pro[linha + j]
+                    p += pontos[linha + j]
+                    saldo += pro - gols_pro[j * n + i]
+                    gp += pro
+            tabela[i] = (p, saldo, gp)
+        return tabela
+
+    def pares(self):
+        """Itera os pares (i, j), i < j, com confronto registrado."""
+        for i in sorted(self.adversarios):
+            for j in sorted(self.adversarios[i]):
+                if i < j:
+                    yield (i, j)
+
+
+class VisaoHistorico(Mapping):
+    """
+    Visão de compatibilidade no formato antigo de historico_confrontos:
+    frozenset({nome_a, nome_b}) -> {nome: {"pontos", "gols_pro", "gols_contra"}}.
+    """
+
+    def __init__(self, confrontos: ConfrontosDiretos, registro):
+        self._confrontos = confrontos
+        self._equipes = registro  # RegistroEquipes: equipe por id e id por nome
+
+    def _indice(self, nome):
+        return self._equipes.id_do_nome(nome)
+
+    def _registro(self, a: int, b: int):
+        registro = {}
+        for i, j in ((a, b), (b, a)):
+            pontos, saldo, gols_pro = self._confrontos.pontuacao(i, j)
+            registro[self._equipes[i].nome] = {"pontos": pontos, "gols_pro": gols_pro, "gols_contra": gols_pro - saldo}
+        return registro
+
+    def __getitem__(self, chave):
+        indices = [self._indice(nome) for nome in chave] if isinstance(chave, frozenset) else []
+        if len(indices) != 2 or None in indices or not self._confrontos.disputado(*indices):
+            raise KeyError(chave)
+        return self._registro(*indices)
+
+    def __iter__(self):
+        for a, b in self._confrontos.pares():
+            yield frozenset({self._equipes[a].nome, self._equipes[b].nome})
+
+    def __len__(self):
+        return sum(1 for _ in self._confrontos.pares())
@@ -0,0 +1,458 @@
+"""
+Distribuições exatas de pontos finais e de posições a partir das probabilidades
+de vitória/empate/derrota de cada jogo restante de `rodadas`.
+
+    motor = MotorRating(campeonato)          # ou ModeloPlacar ajustado, ou dict
+    exata = DistribuicaoExata(campeonato, motor)
+    exata.distribuicao_posicoes()["Equipe"]   # [P(1º), P(2º), ...]
+    exata.probabilidades_zonas()
+
+Os pontos finais de uma equipe dependem só dos seus jogos, então a distribuição sai
+da convolução dos resultados (O(jogos²) por equipe). Já as posições dependem da
+distribuição conjunta de todos os resultados, percorrida jogo a jogo para cada total
+final s, uma vez para todas as equipes, fundindo estados equivalentes:
+1. Para um s, só importam as equipes que ainda podem terminar com s pontos; as demais
+   terminam acima ou abaixo com certeza. Os jogos das que importam contra as demais
+   entram de uma vez, como distribuição de ganho.
+2. Os jogos entre as que importam seguem uma ordem de eliminação que fecha uma equipe
+   de cada vez; entre algumas ordens gulosas, fica a de menos estados. O estado guarda
+   quanto falta a cada equipe aberta para chegar a s (quem passou de s ou não alcança
+   mais sai do estado), com a distribuição das contagens de equipes fechadas acima de s
+   e com s pontos.
+3. Ao fechar com s pontos, a equipe marca uma cópia das contagens, que daí em diante
+   somam só as demais: no fim, a cópia marcada com x dá P(x termina com s, acima,
+   empatados).
+
+O número de estados cresce exponencialmente com o número de equipes abertas ao mesmo
+tempo, e isso depende de quantas disputam os mesmos pontos. Antes de calcular,
+estados_estimados() conta os estados que o cálculo vai percorrer, seguindo só as faltas,
+e distribuicao_posicoes recusa com ValueError as tabelas que passam de `max_estados`.
+Cada estado custa de 60 a 250 µs (as contagens marcadas pesam), e a contagem de uma
+tabela recusada leva uns 10 s com o limite padrão de 500 mil. Medido (CPython 3.11) nas
+últimas 5 rodadas de um campeonato de 20 equipes, dez tabelas sorteadas como em
+tests/test_distribuicao_exata.py, todas calculadas:
+
+    7 de 10     5 a 65 mil estados      0,4 a 6 s
+    3 de 10     70 a 212 mil            19 a 35 s
+
+Com 6 rodadas já aparecem tabelas acima do limite, e com 8 quase todas passam dele;
+para elas resta a simulação (Campeonato.simular).
+
+Posições consideram só os pontos: equipes empatadas dividem igualmente as posições
+que ocupam, já que saldo e gols dos jogos futuros não fazem parte do modelo.
+"""
+import math
+import random
+from typing import Dict, List, NamedTuple, Tuple
+
+from src.campeonato import ZONAS
+
+PONTOS_VITORIA = 3
+PONTOS_EMPATE = 1
+_RESOLVIDA = -1
+TENTATIVAS_ORDEM = 10  # ordens de eliminação contadas por total de pontos
+
+
+class DistribuicaoExata:
+    """
+    Retrato do campeonato (pontos atuais e jogos restantes com suas probabilidades)
+    e cálculos exatos sobre ele.
+
+    `modelo` pode ser qualquer objeto com probabilidades(mandante, visitante) ->
+    (vitória, empate, derrota), como MotorRating e ModeloPlacar, ou um dict
+    {(nome do mandante, nome do visitante): (vitória, empate, derrota)}.
+    """
+
+    def __init__(self, campeonato, modelo, max_estados: int = 500_000):
+        self.nomes = [e.nome for e in campeonato.equipes]
+        self.pontos = [e.pontos for e in campeonato.equipes]
+        self.max_estados = max_estados
+        self.jogos: List[Tuple[int, int, float, float, float]] = []
+        indice = campeonato.registro.indice
+        for mandante, visitante in campeonato.jogos_restantes():
+            if isinstance(modelo, dict):
+                vitoria, empate, derrota = modelo[(mandante.nome, visitante.nome)]
+            else:
+                vitoria, empate, derrota = modelo.probabilidades(mandante, visitante)
+            if min(vitoria, empate, derrota) < 0 or not math.isclose(vitoria + empate + derrota, 1, abs_tol=1e-9):
+                raise ValueError(f"Probabilidades inválidas para {mandante.nome} x {visitante.nome}.")
+            self.jogos.append((indice(mandante), indice(visitante), vitoria, empate, derrota))
+        self._planos = None
+        self._estados = None
+        self._posicoes = None
+
+    # PONTOS
+
+    def distribuicao_pontos(self) -> Dict[str, List[float]]:
+        """P(pontos finais = k) no índice k, por equipe."""
+        distribuicoes = {}
+        for x, nome in enumerate(self.nomes):
+            distribuicao = [0.0] * (self.pontos[x] + 1)
+            distribuicao[self.pontos[x]] = 1.0
+            for i, j, vitoria, empate, derrota in self.jogos:
+                if x not in (i, j):
+                    continue
+                ganhos = ((PONTOS_VITORIA, vitoria), (PONTOS_EMPATE, empate), (0, derrota)) if x == i else \
+                         ((PONTOS_VITORIA, derrota), (PONTOS_EMPATE, empate), (0, vitoria))
+                nova = [0.0] * (len(distribuicao) + PONTOS_VITORIA)
+                for pontos, p in enumerate(distribuicao):
+                    if p:
+                        for ganho, q in ganhos:
+                            nova[pontos + ganho] += p * q
+                distribuicao = nova
+            while len(distribuicao) > 1 and distribuicao[-1] == 0:
+                distribuicao.pop()
+            distribuicoes[nome] = distribuicao
+        return distribuicoes
+
+    # POSIÇÕES
+
+    def distribuicao_posicoes(self) -> Dict[str, List[float]]:
+        """
+        Probabilidade de cada equipe terminar em cada posição (1ª posição no índice 0).
+        ValueError, antes de qualquer cálculo, se estados_estimados() passa de `max_estados`.
+        """
+        if self._posicoes is None:
+            if self.estados_estimados() > self.max_estados:
+                raise ValueError(f"O cálculo exato das posições percorre mais de {self.max_estados} "
+                                 f"estados; há jogos restantes demais.")
+            n = len(self.nomes)
+            base = n + 1
+            posicoes = [[0.0] * n for _ in range(n)]
+            for plano in self._planos:
+                for codigo, p in self._contagens(plano).items():
+                    marca, codigo = divmod(codigo, base * base)
+                    acima, empatados = divmod(codigo, base)
+                    # empatadas em pontos dividem igualmente as posições que ocupam
+                    parte = p / (empatados + 1)
+                    distribuicao = posicoes[marca - 1]
+                    for posicao in range(acima, acima + empatados + 1):
+                        distribuicao[posicao] += parte
+            self._posicoes = {nome: posicoes[x] for x, nome in enumerate(self.nomes)}
+        return self._posicoes
+
+    def estados_estimados(self) -> int:
+        """
+        Número de estados que distribuicao_posicoes percorre, somado por todos os totais de
+        pontos, contado antes do cálculo e sem as probabilidades. O tempo é proporcional a ele:
+        ver a tabela no início do módulo. A contagem para assim que passa de `max_estados` e
+        então devolve só o que contou até ali.
+        """
+        if self._estados is None:
+            totais = sorted({s for distribuicao in self.distribuicao_pontos().values()
+                             for s, p in enumerate(distribuicao) if p})
+            planos, soma = [], 0
+            for s in totais:
+                plano = self._planejar(s, self.max_estados - soma)
+                soma += plano.estados
+                if soma > self.max_estados:
+                    self._estados = soma
+                    return soma
+                planos.append(plano)
+            self._planos, self._estados = planos, soma
+        return self._estados
+
+    def probabilidades_zonas(self) -> Dict[str, Dict[str, float]]:
+        """Probabilidade de título e de cada zona de determinar_classificacoes."""
+        posicoes = range(len(self.nomes))
+        faixas = {"titulo": posicoes[:1]}
+        faixas.update({zona: posicoes[faixa] for zona, faixa in ZONAS.items()})
+        return {
+            nome: {zona: sum(distribuicao[p] for p in faixa) for zona, faixa in faixas.items()}
+            for nome, distribuicao in self.distribuicao_posicoes().items()
+        }
+
+    def _planejar(self, s: int, limite: int) -> "_Plano":
+        """
+        Equipes que podem terminar com `s` pontos, ordem dos jogos entre elas e número de
+        estados; a contagem para assim que passa de `limite`.
+        """
+        n = len(self.pontos)
+        maximos = [0] * n  # pontos em disputa nos jogos restantes de cada equipe
+        for i, j, *_ in self.jogos:
+            maximos[i] += PONTOS_VITORIA
+            maximos[j] += PONTOS_VITORIA
+        # as demais terminam acima ou abaixo de s com certeza, e os jogos delas contam como
+        # externos para os adversários
+        relevantes = {t for t in range(n) if self.pontos[t] <= s <= self.pontos[t] + maximos[t]}
+        acima = sum(1 for t in range(n) if self.pontos[t] > s)
+        internos = [jogo for jogo in self.jogos if jogo[0] in relevantes and jogo[1] in relevantes]
+        # jogos de uma equipe contra as irrelevantes só mexem nos pontos dela: entram de uma
+        # vez, como uma distribuição de ganho, quando ela faz o último jogo contra outra relevante
+        externos = {t: [1.0] for t in relevantes}
+        for i, j, vitoria, empate, derrota in self.jogos:
+            if i in relevantes and j not in relevantes:
+                externos[i] = _somar_jogo(externos[i], vitoria, empate, derrota)
+            elif j in relevantes and i not in relevantes:
+                externos[j] = _somar_jogo(externos[j], derrota, empate, vitoria)
+        # acima_externo[t][d] = P(ganho externo > d); empate em P(ganho externo == d)
+        acima_externo = {}
+        for t, distribuicao in externos.items():
+            caudas = [0.0] * len(distribuicao)
+            for d in range(len(distribuicao) - 2, -1, -1):
+                caudas[d] = caudas[d + 1] + distribuicao[d + 1]
+            acima_externo[t] = caudas
+
+        # a ordem gulosa depende de como os empates do critério são desfeitos, e o número de
+        # estados varia até 3x entre elas: vence a de menos estados entre algumas tentativas
+        melhor = None
+        for tentativa in range(TENTATIVAS_ORDEM):
+            ordem = _ordem_eliminacao(internos, random.Random(tentativa) if tentativa else None)
+            vagas, potencial_inicial, passos = _passos(ordem, internos, externos)
+            faltas = [_RESOLVIDA] * len(vagas)  # faltas das equipes abertas no início, como em _contagens
+            for t, vaga in vagas.items():
+                if s - self.pontos[t] <= potencial_inicial[t]:
+                    faltas[vaga] = s - self.pontos[t]
+            estados = _contar_estados({tuple(faltas)}, passos, limite if melhor is None else min(limite, melhor[0]))
+            if melhor is None or estados < melhor[0]:
+                melhor = (estados, vagas, potencial_inicial, passos)
+        estados, vagas, potencial_inicial, passos = melhor
+        return _Plano(s, relevantes, acima, vagas, potencial_inicial, externos, acima_externo, passos, estados)
+
+    def _contagens(self, plano: "_Plano") -> Dict[int, float]:
+        """
+        Distribuição de marca * (n + 1)² + acima * (n + 1) + empatados, em que a equipe
+        marca - 1 termina com `plano.s` pontos e acima/empatados contam as outras equipes com
+        mais pontos e com os mesmos pontos.
+
+        Cada estado guarda as contagens sem marca (todas as equipes fechadas) e, para cada
+        equipe que fechou com s pontos, as contagens marcadas com ela, que daí em diante
+        somam só as demais.
+        """
+        s, externos, acima_externo = plano.s, plano.externos, plano.acima_externo
+        base = len(self.pontos) + 1
+        marcada = base * base  # contagens de código >= marcada já têm equipe marcada
+
+        def nucleo(t, falta):
+            """
+            Repartição das contagens ao fechar a equipe t, a quem faltam `falta` pontos: termos
+            (marca, deslocamento do código, probabilidade); os de marca valem só para as contagens
+            ainda sem equipe marcada.
+            """
+            if falta < 0:
+                return ((False, base, 1.0),)
+            distribuicao = externos[t]
+            if falta >= len(distribuicao):
+                return ((False, 0, 1.0),)
+            p_acima, p_empate = acima_externo[t][falta], distribuicao[falta]
+            termos = tuple((False, deslocamento, q) for deslocamento, q in
+                           ((0, 1.0 - p_acima - p_empate), (1, p_empate), (base, p_acima)) if q > 0)
+            return termos + ((True, (t + 1) * marcada, p_empate),) if p_empate > 0 else termos
+
+        def acumular(destino, faltas, contagens, repartir=((False, 0, 1.0),)):
+            atuais = destino.get(faltas)
+            if atuais is None:
+                # estado novo: cópia (ou cópia deslocada) montada em C, sem somar entrada a entrada
+                if len(repartir) == 1 and not repartir[0][0]:
+                    _, deslocamento, q = repartir[0]
+                    if deslocamento == 0 and q == 1.0:
+                        destino[faltas] = contagens.copy()
+                    else:
+                        destino[faltas] = {codigo + deslocamento: p * q for codigo, p in contagens.items()}
+                    return
+                atuais = destino[faltas] = {}
+            obter = atuais.get
+            for marca, deslocamento, q in repartir:
+                for codigo, p in contagens.items():
+                    if marca and codigo >= marcada:
+                        continue
+                    codigo += deslocamento
+                    atuais[codigo] = obter(codigo, 0.0) + p * q
+
+        # estado = quanto falta a cada equipe aberta para chegar a s (ou _RESOLVIDA) -> contagens
+        contagens = {plano.acima * base: 1.0}
+        faltas = [_RESOLVIDA] * len(plano.vagas)
+        for t in plano.relevantes:
+            falta = s - self.pontos[t]
+            if t not in plano.vagas:
+                repartidas = {}
+                acumular(repartidas, None, contagens, nucleo(t, falta))
+                contagens = repartidas[None]
+            elif falta <= plano.potencial_inicial[t]:
+                faltas[plano.vagas[t]] = falta
+        estados = {tuple(faltas): contagens}
+
+        for i, j, vaga_i, vaga_j, fecha_i, fecha_j, potencial_i, potencial_j, resultados in plano.passos:
+            novos = {}
+            # o jogo só mexe nas faltas de i e de j: as transições (novas faltas e repartição das
+            # contagens pelas equipes fechadas) saem uma vez por par de faltas
+            transicoes = {}
+            for faltas, contagens in estados.items():
+                falta_i, falta_j = faltas[vaga_i], faltas[vaga_j]
+                if falta_i == _RESOLVIDA and falta_j == _RESOLVIDA:
+                    acumular(novos, faltas, contagens)
+                    continue
+                destinos = transicoes.get((falta_i, falta_j))
+                if destinos is None:
+                    destinos = transicoes[(falta_i, falta_j)] = self._transicoes(
+                        nucleo, resultados, (i, falta_i, fecha_i, potencial_i), (j, falta_j, fecha_j, potencial_j))
+                for nova_i, nova_j, repartir in destinos:
+                    novo = list(faltas)
+                    novo[vaga_i] = nova_i
+                    novo[vaga_j] = nova_j
+                    acumular(novos, tuple(novo), contagens, repartir)
+            estados = novos
+
+        total = {}
+        for contagens in estados.values():
+            for codigo, p in contagens.items():
+                if codigo >= marcada:  # as contagens sem marca só conduzem as marcadas até aqui
+                    total[codigo] = total.get(codigo, 0.0) + p
+        return total
+
+    @staticmethod
+    def _transicoes(nucleo, resultados, equipe_i, equipe_j):
+        """[(nova falta de i, nova falta de j, repartição das contagens)] para os três resultados do jogo."""
+        por_destino = {}
+        for ganho_i, ganho_j, q in resultados:
+            if not q:
+                continue
+            novas = []
+            repartir = ((False, 0, q),)
+            for (t, falta, fecha, potencial), ganho in ((equipe_i, ganho_i), (equipe_j, ganho_j)):
+                if falta == _RESOLVIDA:
+                    novas.append(_RESOLVIDA)
+                    continue
+                falta -= ganho
+                if fecha or falta < 0:
+                    repartir = _compor(repartir, nucleo(t, falta))
+                    novas.append(_RESOLVIDA)
+                else:
+                    novas.append(_RESOLVIDA if falta > potencial else falta)  # além do potencial: não alcança mais
+            destino = por_destino.setdefault(tuple(novas), {})
+            for marca, deslocamento, p in repartir:
+                destino[(marca, deslocamento)] = destino.get((marca, deslocamento), 0.0) + p
+        return [(nova_i, nova_j, tuple((marca, deslocamento, p) for (marca, deslocamento), p in repartir.items()))
+                for (nova_i, nova_j), repartir in por_destino.items()]
+
+
+class _Plano(NamedTuple):
+    """Preparação de DistribuicaoExata._contagens para o total de `s` pontos."""
+    s: int
+    relevantes: set
+    acima: int  # equipes que terminam com mais de s pontos em qualquer resultado
+    vagas: Dict[int, int]
+    potencial_inicial: Dict[int, int]
+    externos: Dict[int, List[float]]
+    acima_externo: Dict[int, List[float]]
+    passos: list
+    estados: int  # somados por todos os passos; passa de `limite` se _planejar parou de contar
+
+
+def _compor(primeira, segunda):
+    """Repartição equivalente a aplicar `primeira` e depois `segunda` (termos de _contagens.nucleo)."""
+    composta = {}
+    for marca_1, deslocamento_1, q_1 in primeira:
+        for marca_2, deslocamento_2, q_2 in segunda:
+            if marca_1 and marca_2:
+                continue  # contagens já marcadas não recebem outra marca
+            chave = (marca_1 or marca_2, deslocamento_1 + deslocamento_2)
+            composta[chave] = composta.get(chave, 0.0) + q_1 * q_2
+    return tuple((marca, deslocamento, q) for (marca, deslocamento), q in composta.items())
+
+
+def _somar_jogo(distribuicao: List[float], vitoria: float, empate: float, derrota: float) -> List[float]:
+    """Convolução de uma distribuição de ganho com o resultado de mais um jogo."""
+    nova = [0.0] * (len(distribuicao) + PONTOS_VITORIA)
+    for ganho, p in enumerate(distribuicao):
+        if p:
+            nova[ganho + PONTOS_VITORIA] += p * vitoria
+            nova[ganho + PONTOS_EMPATE] += p * empate
+            nova[ganho] += p * derrota
+    while len(nova) > 1 and nova[-1] == 0:
+        nova.pop()
+    return nova
+
+
+def _apos_jogo(falta: int, ganho: int, fecha: bool, potencial: int) -> int:
+    """Falta de um rival depois de um jogo interno, como em DistribuicaoExata._transicoes."""
+    if falta == _RESOLVIDA:
+        return _RESOLVIDA
+    falta -= ganho
+    return _RESOLVIDA if fecha or falta < 0 or falta > potencial else falta
+
+
+def _contar_estados(iniciais: set, passos: list, limite: int) -> int:
+    """
+    Soma, por todos os passos, do número de estados de DistribuicaoExata._contagens, percorrendo
+    só as faltas, sem as contagens (cerca de um sexto do custo). Para assim que passa de `limite`.
+    """
+    estados = iniciais
+    soma = len(estados)
+    for _, _, vaga_i, vaga_j, fecha_i, fecha_j, potencial_i, potencial_j, resultados in passos:
+        if soma > limite:
+            break
+        novos = set()
+        transicoes = {}
+        for faltas in estados:
+            falta_i, falta_j = faltas[vaga_i], faltas[vaga_j]
+            if falta_i == _RESOLVIDA and falta_j == _RESOLVIDA:
+                novos.add(faltas)
+                continue
+            destinos = transicoes.get((falta_i, falta_j))
+            if destinos is None:
+                destinos = transicoes[(falta_i, falta_j)] = {
+                    (_apos_jogo(falta_i, ganho_i, fecha_i, potencial_i),
+                     _apos_jogo(falta_j, ganho_j, fecha_j, potencial_j))
+                    for ganho_i, ganho_j, q in resultados if q}
+            for nova_i, nova_j in destinos:
+                novo = list(faltas)
+                novo[vaga_i] = nova_i
+                novo[vaga_j] = nova_j
+                novos.add(tuple(novo))
+        estados = novos
+        soma += len(estados)
+    return soma
+
+
+def _passos(ordem, internos, externos):
+    """
+    Posição de cada equipe aberta no estado, potencial inicial de cada equipe e, por jogo
+    de `ordem`, os parâmetros do passo de DistribuicaoExata._contagens.
+    """
+    fecha_em = {}
+    for k, (i, j, *_) in enumerate(ordem):
+        fecha_em[i] = fecha_em[j] = k
+    vagas = {t: v for v, t in enumerate(sorted(fecha_em))}
+    # pontos que cada equipe ainda pode ganhar depois do k-ésimo jogo interno
+    potenciais = {t: PONTOS_VITORIA * sum(1 for jogo in internos if t in jogo[:2]) + len(distribuicao) - 1
+                  for t, distribuicao in externos.items()}
+    potencial_inicial = dict(potenciais)
+    passos = []
+    for k, (i, j, vitoria, empate, derrota) in enumerate(ordem):
+        potenciais[i] -= PONTOS_VITORIA
+        potenciais[j] -= PONTOS_VITORIA
+        passos.append((i, j, vagas[i], vagas[j], fecha_em[i] == k, fecha_em[j] == k, potenciais[i], potenciais[j],
+                       ((PONTOS_VITORIA, 0, vitoria), (PONTOS_EMPATE, PONTOS_EMPATE, empate),
+                        (0, PONTOS_VITORIA, derrota))))
+    return vagas, potencial_inicial, passos
+
+
+def _ordem_eliminacao(jogos, sorteio=None) -> list:
+    """
+    Jogos agrupados por equipe: a cada passo entram todos os jogos pendentes da equipe
+    que menos abre equipes novas, de preferência uma já aberta. Assim poucas equipes
+    ficam com parte dos jogos processados (e os pontos no estado) ao mesmo tempo.
+    Empates no critério vão para a equipe de menor índice ou, com `sorteio` (random.Random),
+    para uma ordem sorteada das equipes.
+    """
+    pendentes = {}
+    for jogo in jogos:
+        pendentes.setdefault(jogo[0], []).append(jogo)
+        pendentes.setdefault(jogo[1], []).append(jogo)
+    desempate = {t: sorteio.random() if sorteio else t for t in sorted(pendentes)}
+    ordem, usados, abertas = [], set(), set()
+    while pendentes:
+        def custo(t):
+            novas = {o for jogo in pendentes[t] for o in jogo[:2]} - abertas - {t}
+            return len(novas), t not in abertas, desempate[t]
+        equipe = min(pendentes, key=custo)
+        for jogo in pendentes.pop(equipe):
+            if id(jogo) not in usados:
+                usados.add(id(jogo))
+                ordem.append(jogo)
+                abertas.update(jogo[:2])
+        abertas.discard(equipe)
+        pendentes = {t: [jogo for jogo in lista if id(jogo) not in usados] for t, lista in pendentes.items()}
+        pendentes = {t: lista for t, lista in pendentes.items() if lista}
+    return ordem
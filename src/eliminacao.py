@@ -0,0 +1,544 @@
+"""
+Situação matemática de cada equipe (título, zonas de determinar_classificacoes):
+garantida, eliminada ou em aberto, com a melhor e a pior posição possíveis e os
+números mágicos.
+
+As posições consideram só os pontos (vitória 3, empate 1). Na melhor posição os
+empates em pontos favorecem a equipe e, na pior, a prejudicam, já que os
+critérios de desempate dos jogos futuros não são conhecidos.
+
+Decidir exatamente a melhor posição com vitória valendo 3 e empate 1 é NP-difícil,
+então cada posição vem como um intervalo:
+- `melhor_posicao` é um limite provado (a equipe não termina acima dele). Ele sai
+  de um fluxo máximo em que cada jogo distribui só 2 pontos, relaxação que nunca
+  dá mais pontos aos rivais do que um resultado real.
+- `melhor_confirmada` é a posição de um cenário de resultados efetivamente
+  construído, a partir do fluxo.
+- `pior_posicao` e `pior_confirmada` são o equivalente para a pior posição.
+Quando o intervalo cruza a fronteira de alguma zona, uma busca exata nos resultados
+restantes (limitada a `orcamento_busca` nós) tenta fechá-lo. Um status só é
+"garantido" ou "eliminado" com prova; sem ela fica "em_aberto".
+"""
+from typing import Dict, List, NamedTuple, Optional
+
+from src.campeonato import ZONAS
+
+PONTOS_VITORIA = 3
+PONTOS_EMPATE = 1
+
+
+class SituacaoEquipe(NamedTuple):
+    nome: str
+    pontos: int
+    pontos_maximos: int
+    melhor_posicao: int                  # não termina acima desta posição
+    melhor_confirmada: int               # há cenário em que termina nesta posição (ou acima)
+    pior_posicao: int                    # não termina abaixo desta posição
+    pior_confirmada: int                 # há cenário em que termina nesta posição (ou abaixo)
+    zonas: Dict[str, str]                # zona -> "garantido" | "eliminado" | "em_aberto"
+    numeros_magicos: Dict[str, Optional[int]]
+
+
+class _Fluxo:
+    """Fluxo máximo de Dinic sobre listas de arestas (a aresta e e a reversa e ^ 1)."""
+
+    def __init__(self, vertices: int):
+        self.adjacentes = [[] for _ in range(vertices)]
+        self.destino = []
+        self.capacidade = []
+
+    def aresta(self, origem: int, destino: int, capacidade: int) -> int:
+        indice = len(self.destino)
+        self.adjacentes[origem].append(indice)
+        self.destino.append(destino)
+        self.capacidade.append(capacidade)
+        self.adjacentes[destino].append(indice + 1)
+        self.destino.append(origem)
+        self.capacidade.append(0)
+        return indice
+
+    def fluxo(self, aresta: int) -> int:
+        return self.capacidade[aresta ^ 1]
+
+    def maximo(self, fonte: int, sumidouro: int) -> int:
+        total = 0
+        adjacentes, destino, capacidade = self.adjacentes, self.destino, self.capacidade
+        while True:
+            nivel = [-1] * len(adjacentes)
+            nivel[fonte] = 0
+            fila = [fonte]
+            for u in fila:
+                for e in adjacentes[u]:
+                    if capacidade[e] and nivel[destino[e]] < 0:
+                        nivel[destino[e]] = nivel[u] + 1
+                        fila.append(destino[e])
+            if nivel[sumidouro] < 0:
+                return total
+            proxima = [0] * len(adjacentes)
+
+            def empurrar(u, limite):
+                if u == sumidouro:
+                    return limite
+                arestas = adjacentes[u]
+                while proxima[u] < len(arestas):
+                    e = arestas[proxima[u]]
+                    v = destino[e]
+                    if capacidade[e] and nivel[v] == nivel[u] + 1:
+                        enviado = empurrar(v, min(limite, capacidade[e]))
+                        if enviado:
+                            capacidade[e] -= enviado
+                            capacidade[e ^ 1] += enviado
+                            return enviado
+                    proxima[u] += 1
+                return 0
+
+            while True:
+                enviado = empurrar(fonte, float("inf"))
+                if not enviado:
+                    break
+                total += enviado
+
+
+def _faixas(n: int) -> Dict[str, range]:
+    """Zonas como intervalos de posições (1 = primeira)."""
+    posicoes = range(1, n + 1)
+    faixas = {"titulo": posicoes[:1]}
+    faixas.update({zona: posicoes[faixa] for zona, faixa in ZONAS.items()})
+    return faixas
+
+
+class AnalisadorEliminacao:
+    """
+    Situação de todas as equipes de um Campeonato, a partir dos pontos atuais e
+    dos jogos restantes de `rodadas`.
+
+    A análise é refeita só quando a `versao` do campeonato (ou o calendário) muda,
+    ou seja, a cada partida processada, corrigida ou desfeita, e mesmo então só para
+    as equipes cujo problema reduzido mudou: a análise de cada equipe lê só as que
+    ainda disputam os mesmos pontos que ela e os jogos delas, e é guardada por esses
+    dados. Para 20 equipes, uma análise completa leva de 10 a 25 ms em média.
+    """
+
+    def __init__(self, campeonato, orcamento_busca: int = 2_000):
+        self.campeonato = campeonato
+        self.orcamento_busca = orcamento_busca  # nós por busca exata; esgotado, valem os limites
+        self._chave = None
+        self._situacoes: Dict[str, SituacaoEquipe] = {}
+        self._por_equipe = {}  # índice -> (dados lidos pela análise da equipe, situação)
+        self.reanalisadas = 0  # análises de equipe feitas (as demais vieram de _por_equipe)
+
+    def situacoes(self) -> Dict[str, SituacaoEquipe]:
+        campeonato = self.campeonato
+        chave = (campeonato.versao, id(campeonato._rodadas_do_calendario()))
+        if chave != self._chave:
+            self._situacoes = self._analisar()
+            self._chave = chave
+        return self._situacoes
+
+    def situacao(self, equipe) -> SituacaoEquipe:
+        return self.situacoes()[equipe if isinstance(equipe, str) else equipe.nome]
+
+    def invalidar(self):
+        """Força nova análise (para calendários alterados no lugar)."""
+        self._chave = None
+
+    def equipes(self, zona: str, status: str) -> List[str]:
+        """Nomes das equipes com `status` na `zona` (ex.: equipes("titulo", "em_aberto"))."""
+        return [nome for nome, situacao in self.situacoes().items() if situacao.zonas[zona] == status]
+
+    # ANÁLISE
+
+    def _analisar(self) -> Dict[str, SituacaoEquipe]:
+        campeonato = self.campeonato
+        equipes = campeonato.equipes
+        indice = campeonato.registro.indice
+        pontos = [e.pontos for e in equipes]
+        jogos = [(indice(m), indice(v)) for m, v in campeonato.jogos_restantes()]
+        disputas = [0] * len(equipes)
+        for i, j in jogos:
+            disputas[i] += 1
+            disputas[j] += 1
+
+        situacoes = {}
+        for x, equipe in enumerate(equipes):
+            proprios = [jogo for jogo in jogos if x in jogo]
+            outros = [jogo for jogo in jogos if x not in jogo]
+            restantes = disputas[:]  # jogos de cada equipe fora os contra x
+            for i, j in proprios:
+                restantes[j if i == x else i] -= 1
+            maximo = pontos[x] + PONTOS_VITORIA * len(proprios)
+
+            # melhor caso: quem já passou de `maximo` ou não chega a ele nem vencendo tudo vence
+            # os jogos contra as demais sem mudar nada; sobram as que disputam o máximo
+            disputantes = {t for t in range(len(equipes))
+                           if t != x and pontos[t] <= maximo < pontos[t] + PONTOS_VITORIA * restantes[t]}
+            acima = sum(1 for t in range(len(equipes)) if t != x and pontos[t] > maximo)
+            jogos_melhor = tuple(jogo for jogo in outros if jogo[0] in disputantes and jogo[1] in disputantes)
+
+            # pior caso: a equipe perde todos os seus jogos. As análises contam quem chega a
+            # alvos de pontos[x] a `maximo`; quem já passou de `maximo` chega a todos, e quem não
+            # chega aos pontos atuais dela (com a folga de um jogo do cenário construído) a
+            # nenhum. Essas perdem os jogos contra as demais, que já entram como vitória na base
+            base = pontos[:]
+            for i, j in proprios:
+                base[j if i == x else i] += PONTOS_VITORIA
+            alcancaveis = {t for t in range(len(equipes)) if t != x and base[t] < maximo
+                           and base[t] + PONTOS_VITORIA * (restantes[t] + 1) >= pontos[x]}
+            passaram = sum(1 for t in range(len(equipes)) if t != x and base[t] >= maximo)
+            jogos_pior = []
+            for i, j in outros:
+                if i in alcancaveis and j in alcancaveis:
+                    jogos_pior.append((i, j))
+                elif i in alcancaveis or j in alcancaveis:
+                    base[i if i in alcancaveis else j] += PONTOS_VITORIA
+            jogos_pior = tuple(jogos_pior)
+
+            # a análise de x só lê o que entra na chave: se ela não mudou, a situação também não
+            chave = (pontos[x], len(proprios), acima, passaram, jogos_melhor, jogos_pior,
+                     tuple((t, pontos[t]) for t in sorted(disputantes)),
+                     tuple((t, base[t]) for t in sorted(alcancaveis)))
+            guardada = self._por_equipe.get(x)
+            if guardada is None or guardada[0] != chave:
+                self.reanalisadas += 1
+                guardada = self._por_equipe[x] = (chave, self._analisar_equipe(
+                    x, equipe.nome, pontos, base, jogos_melhor, jogos_pior, len(proprios), maximo))
+            situacoes[equipe.nome] = guardada[1]
+        return situacoes
+
+    def _analisar_equipe(self, x, nome, pontos, base, jogos_melhor, jogos_pior, jogos_proprios, maximo):
+        n = len(pontos)
+        faixas = _faixas(n)
+        # posições p em que "terminar até p" muda algum status: só vale refinar intervalos que as cruzam
+        fronteiras = {faixa[-1] for faixa in faixas.values() if faixa} | \
+                     {faixa[0] - 1 for faixa in faixas.values() if faixa}
+
+        melhor, melhor_confirmada = self._melhor_posicao(x, pontos, jogos_melhor, maximo)
+        if any(melhor <= p < melhor_confirmada for p in fronteiras):
+            melhor, melhor_confirmada = self._buscar_melhor(x, pontos, jogos_melhor, maximo,
+                                                            melhor, melhor_confirmada)
+
+        disputas = [0] * n
+        confrontos = {}
+        for i, j in jogos_pior:
+            disputas[i] += 1
+            disputas[j] += 1
+            par = (i, j) if i < j else (j, i)
+            confrontos[par] = confrontos.get(par, 0) + 1
+
+        max_entre_si = max(confrontos.values(), default=0)
+        limites = {}
+
+        def alcancam(alvo):
+            if alvo not in limites:
+                limites[alvo] = self._limite_alcancam(x, base, disputas, confrontos, max_entre_si,
+                                                      len(jogos_pior), alvo)
+            return limites[alvo]
+
+        pior = 1 + alcancam(pontos[x])
+        pior_confirmada = 1 + self._cenario_alcancam(x, base, jogos_pior, pontos[x])
+        if any(pior_confirmada <= p < pior for p in fronteiras):
+            pior_confirmada, pior = self._buscar_pior(x, base, jogos_pior, pontos[x], pior_confirmada, pior)
+
+        zonas = {}
+        numeros = {}
+        for zona, faixa in faixas.items():
+            if not faixa:
+                continue
+            if melhor > faixa[-1] or pior < faixa[0]:
+                zonas[zona] = "eliminado"
+            elif melhor >= faixa[0] and pior <= faixa[-1]:
+                zonas[zona] = "garantido"
+            else:
+                zonas[zona] = "em_aberto"
+            # no rebaixamento (faixa no fim da tabela) o número mágico é o de escapar dela
+            alvo = faixa[0] - 1 if faixa[-1] == n and faixa[0] > 1 else faixa[-1]
+            numeros[zona] = self._numero_magico(alcancam, pontos[x], jogos_proprios, alvo)
+
+        return SituacaoEquipe(nome, pontos[x], maximo, melhor, melhor_confirmada,
+                              pior, pior_confirmada, zonas, numeros)
+
+    @staticmethod
+    def _melhor_posicao(x, pontos, jogos, maximo):
+        """
+        (limite provado, posição de um cenário construído) quando a equipe vence todos
+        os seus jogos e termina com `maximo` pontos.
+        """
+        n = len(pontos)
+        disputas = [0] * n
+        for i, j in jogos:
+            disputas[i] += 1
+            disputas[j] += 1
+        acima = {t for t in range(n) if t != x and pontos[t] > maximo}
+        if all(maximo - pontos[t] >= disputas[t] for t in range(n) if t != x and t not in acima):
+            # empatando tudo entre si (e perdendo para as já acima), ninguém mais passa do máximo
+            return 1 + len(acima), 1 + len(acima)
+
+        def montar(livres):
+            # cada jogo distribui 2 pontos; equipes livres (já acima) absorvem tudo
+            rede = _Fluxo(2 + len(jogos) + n)
+            arestas = []
+            for g, (i, j) in enumerate(jogos):
+                rede.aresta(0, 2 + g, 2)
+                arestas.append((rede.aresta(2 + g, 2 + len(jogos) + i, 2),
+                                rede.aresta(2 + g, 2 + len(jogos) + j, 2)))
+            for t in range(n):
+                if t != x and disputas[t]:
+                    folga = 2 * disputas[t] if t in livres else max(0, maximo - pontos[t])
+                    rede.aresta(2 + len(jogos) + t, 1, folga)
+            return rede, arestas, rede.maximo(0, 1)
+
+        rede, arestas, enviado = montar(acima)
+        sobra = 2 * len(jogos) - enviado
+        # liberar a equipe t aumenta o fluxo no máximo no acréscimo da sua capacidade
+        acrescimos = sorted((2 * disputas[t] - max(0, maximo - pontos[t]), t)
+                            for t in range(n) if t != x and t not in acima and disputas[t])
+        liberadas = []
+        while sobra > 0 and acrescimos:
+            acrescimo, t = acrescimos.pop()
+            if acrescimo <= 0:
+                break
+            sobra -= acrescimo
+            liberadas.append(t)
+        limite = 1 + len(acima) + len(liberadas)
+
+        # cenário: resultados reais guiados pelo fluxo com as mesmas equipes liberadas
+        livres = acima | set(liberadas)
+        if liberadas:
+            rede, arestas, _ = montar(livres)
+        final = pontos[:]
+        vitorias = []   # (vencedor, perdedor)
+        empates = []
+        pendentes = []
+        for (i, j), (aresta_i, aresta_j) in zip(jogos, arestas):
+            if i in livres or j in livres:
+                vencedor = i if i in livres else j
+                vitorias.append((vencedor, j if vencedor == i else i))
+                final[vencedor] += PONTOS_VITORIA
+                continue
+            fluxo_i, fluxo_j = rede.fluxo(aresta_i), rede.fluxo(aresta_j)
+            if fluxo_i == fluxo_j == 1:
+                empates.append((i, j))
+                final[i] += PONTOS_EMPATE
+                final[j] += PONTOS_EMPATE
+            elif fluxo_i == 2 or fluxo_j == 2:
+                vencedor, perdedor = (i, j) if fluxo_i == 2 else (j, i)
+                vitorias.append((vencedor, perdedor))
+                final[vencedor] += PONTOS_VITORIA
+            else:
+                pendentes.append((i, j))
+        for i, j in pendentes:
+            vencedor, perdedor = (i, j) if final[i] <= final[j] else (j, i)
+            vitorias.append((vencedor, perdedor))
+            final[vencedor] += PONTOS_VITORIA
+
+        def cabe(t, pontos_extra):
+            return t in livres or final[t] + pontos_extra <= maximo
+
+        # reparo: equipes acima do máximo cedem vitórias (viram empates) ou empates (viram derrotas)
+        mudou = True
+        while mudou:
+            mudou = False
+            for k, (vencedor, perdedor) in enumerate(vitorias):
+                if vencedor not in livres and final[vencedor] > maximo and cabe(perdedor, PONTOS_EMPATE):
+                    final[vencedor] -= PONTOS_VITORIA - PONTOS_EMPATE
+                    final[perdedor] += PONTOS_EMPATE
+                    empates.append((vencedor, perdedor))
+                    vitorias[k] = None
+                    mudou = True
+            vitorias = [v for v in vitorias if v is not None]
+            for k, (i, j) in enumerate(empates):
+                for acima_do_maximo, outra in ((i, j), (j, i)):
+                    if final[acima_do_maximo] > maximo and acima_do_maximo not in livres \
+                            and cabe(outra, PONTOS_VITORIA - PONTOS_EMPATE):
+                        final[acima_do_maximo] -= PONTOS_EMPATE
+                        final[outra] += PONTOS_VITORIA - PONTOS_EMPATE
+                        vitorias.append((outra, acima_do_maximo))
+                        empates[k] = None
+                        mudou = True
+                        break
+            empates = [e for e in empates if e is not None]
+        confirmada = 1 + sum(1 for t in range(n) if t != x and final[t] > maximo)
+        return limite, confirmada
+
+    @staticmethod
+    def _limite_alcancam(x, base, disputas, confrontos, max_entre_si: int, jogos: int, alvo) -> int:
+        """
+        Limite provado de quantas equipes podem chegar a `alvo` pontos. Cada uma precisa
+        alcançá-lo sozinha (3 pontos por jogo) e, juntas, não podem precisar de mais que os
+        3 pontos de cada jogo restante. Além disso, duas candidatas que se enfrentam e
+        não alcançam juntas (os confrontos entre elas dão 3 pontos ao par, não 6) estão
+        em conflito; de cada par de um emparelhamento de conflitos só uma chega.
+        """
+        faltas = {t: max(0, alvo - base[t]) for t in range(len(base))
+                  if t != x and alvo - base[t] <= PONTOS_VITORIA * disputas[t]}
+        disponivel = PONTOS_VITORIA * jogos
+        quantidade = 0
+        for falta in sorted(faltas.values()):
+            disponivel -= falta
+            if disponivel < 0:
+                break
+            quantidade += 1
+
+        # conflito: as sobras (pontos que cada uma pode deixar de ganhar) somam menos que os
+        # 3 pontos por confronto entre elas; só equipes com pouca sobra entram em algum
+        sobras = {t: PONTOS_VITORIA * disputas[t] - falta for t, falta in faltas.items()}
+        apertadas = sorted(t for t, sobra in sobras.items() if sobra < PONTOS_VITORIA * max_entre_si)
+        emparelhadas = set()
+        for a, i in enumerate(apertadas):
+            for j in apertadas[a + 1:]:
+                if i not in emparelhadas and j not in emparelhadas and \
+                        sobras[i] + sobras[j] < PONTOS_VITORIA * confrontos.get((i, j), 0):
+                    emparelhadas.update((i, j))
+        return min(quantidade, len(faltas) - len(emparelhadas) // 2)
+
+    @staticmethod
+    def _cenario_alcancam(x, base, jogos, alvo) -> int:
+        """Quantas equipes chegam a `alvo` pontos num cenário construído (vitória para quem mais precisa)."""
+        final = base[:]
+        restantes = [0] * len(base)
+        for i, j in jogos:
+            restantes[i] += 1
+            restantes[j] += 1
+
+        def falta(t):
+            # 0: já chegou ou não chega mais; só decide quem vence
+            diferenca = alvo - final[t]
+            return diferenca if 0 < diferenca <= PONTOS_VITORIA * (restantes[t] + 1) else 0
+        for i, j in jogos:
+            falta_i, falta_j = falta(i), falta(j)
+            restantes[i] -= 1
+            restantes[j] -= 1
+            if not falta_i and not falta_j:
+                continue
+            vencedor, perdedor = (i, j) if falta_i >= falta_j else (j, i)
+            falta_perdedor = min(falta_i, falta_j)
+            # empate quando a derrota tiraria o perdedor da disputa e o empate mantém os dois nela
+            if falta_perdedor > PONTOS_VITORIA * restantes[perdedor] \
+                    and max(falta_i, falta_j) - PONTOS_EMPATE <= PONTOS_VITORIA * restantes[vencedor]:
+                final[i] += PONTOS_EMPATE
+                final[j] += PONTOS_EMPATE
+            else:
+                final[vencedor] += PONTOS_VITORIA
+        return sum(1 for t in range(len(base)) if t != x and final[t] >= alvo)
+
+    # BUSCA EXATA (quando limite e cenário divergem)
+
+    def _buscar_melhor(self, x, pontos, jogos, maximo, limite, confirmada):
+        """
+        Menor número de equipes acima de `maximo` por busca em profundidade nos resultados.
+        Retorna (melhor_posicao, melhor_confirmada): iguais se a busca terminou.
+        """
+        final = pontos[:]
+        restantes = []
+        for i, j in jogos:
+            # quem já passou do máximo vence: o adversário não ganha pontos
+            if final[i] > maximo or final[j] > maximo:
+                final[i if final[i] > maximo else j] += PONTOS_VITORIA
+            else:
+                restantes.append((i, j))
+        melhor = [confirmada - 1]
+        orcamento = [self.orcamento_busca]
+
+        def resultados(i, j):
+            # primeiro o que dá pontos a quem tem mais folga
+            vitoria_i, vitoria_j = ((i, PONTOS_VITORIA), (j, 0)), ((i, 0), (j, PONTOS_VITORIA))
+            empate = ((i, PONTOS_EMPATE), (j, PONTOS_EMPATE))
+            return (vitoria_i, empate, vitoria_j) if final[i] <= final[j] else (vitoria_j, empate, vitoria_i)
+
+        def buscar(k, quantidade):
+            if quantidade >= melhor[0] or orcamento[0] <= 0:
+                return
+            orcamento[0] -= 1
+            if k == len(restantes):
+                melhor[0] = quantidade
+                return
+            i, j = restantes[k]
+            for resultado in resultados(i, j):
+                extra = 0
+                for t, ganho in resultado:
+                    if final[t] <= maximo < final[t] + ganho:
+                        extra += 1
+                    final[t] += ganho
+                buscar(k + 1, quantidade + extra)
+                for t, ganho in resultado:
+                    final[t] -= ganho
+                if melhor[0] == limite - 1:
+                    return
+
+        buscar(0, sum(1 for t in range(len(final)) if t != x and final[t] > maximo))
+        exato = orcamento[0] > 0
+        return (1 + melhor[0] if exato else limite), 1 + melhor[0]
+
+    def _buscar_pior(self, x, base, jogos, alvo, confirmada, limite):
+        """
+        Maior número de equipes que chegam a `alvo` por busca em profundidade.
+        Retorna (pior_confirmada, pior_posicao): iguais se a busca terminou.
+        """
+        final = base[:]
+        faltam = [0] * len(base)
+        for i, j in jogos:
+            faltam[i] += 1
+            faltam[j] += 1
+        candidatas = {t for t in range(len(base)) if t != x and alvo - final[t] <= PONTOS_VITORIA * faltam[t]}
+        restantes = []
+        for i, j in jogos:
+            if i in candidatas and j in candidatas:
+                restantes.append((i, j))
+            elif i in candidatas or j in candidatas:
+                # contra quem não disputa a vaga, a candidata vence
+                vencedor = i if i in candidatas else j
+                final[vencedor] += PONTOS_VITORIA
+                faltam[i] -= 1
+                faltam[j] -= 1
+        melhor = [confirmada - 1]
+        orcamento = [self.orcamento_busca]
+
+        def possiveis():
+            return sum(1 for t in candidatas if alvo - final[t] <= PONTOS_VITORIA * faltam[t])
+
+        def buscar(k):
+            if possiveis() <= melhor[0] or orcamento[0] <= 0:
+                return
+            orcamento[0] -= 1
+            if k == len(restantes):
+                melhor[0] = sum(1 for t in candidatas if final[t] >= alvo)
+                return
+            i, j = restantes[k]
+            faltam[i] -= 1
+            faltam[j] -= 1
+            primeiro, segundo = (i, j) if alvo - final[i] >= alvo - final[j] else (j, i)
+            for resultado in (((primeiro, PONTOS_VITORIA),), ((i, PONTOS_EMPATE), (j, PONTOS_EMPATE)),
+                              ((segundo, PONTOS_VITORIA),)):
+                for t, ganho in resultado:
+                    final[t] += ganho
+                buscar(k + 1)
+                for t, ganho in resultado:
+                    final[t] -= ganho
+                if melhor[0] == limite - 1:
+                    break
+            faltam[i] += 1
+            faltam[j] += 1
+
+        buscar(0)
+        exato = orcamento[0] > 0
+        return 1 + melhor[0], (1 + melhor[0] if exato else limite)
+
+    @staticmethod
+    def _numero_magico(alcancam, pontos: int, jogos: int, posicao: int) -> Optional[int]:
+        """
+        Menor número de pontos que, somados aos atuais, garantem terminar até `posicao`
+        sejam quais forem os outros resultados (None se nem vencendo tudo basta).
+        Conservador: os adversários diretos ganham 3 pontos em cada jogo contra a equipe.
+        `alcancam(alvo)` é o limite de equipes que chegam a `alvo` pontos nesse cenário.
+        """
+        if posicao < 1:
+            return None
+        # quanto mais pontos, menos equipes os alcançam: busca binária no ganho
+        baixo, alto = 0, PONTOS_VITORIA * jogos + 1
+        while baixo < alto:
+            meio = (baixo + alto) // 2
+            if 1 + alcancam(pontos + meio) <= posicao:
+                alto = meio
+            else:
+                baixo = meio + 1
+        return baixo if baixo <= PONTOS_VITORIA * jogos else None
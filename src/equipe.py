@@ -1,18 +1,63 @@
-class EstatisticasEquipe:
+from array import array
+
+# Ordem das colunas em ColunasEstatisticas
+CAMPOS_ESTATISTICAS = (
+    "pontos", "vitorias", "empates", "derrotas",
+    "gols_marcados", "gols_sofridos", "cartoes_vermelhos", "cartoes_amarelos",
+)
+
+
+class ColunasEstatisticas:
     """
-    Dado extraído de Equipe para isolar a responsabilidade de armazenar
-    e atualizar estatísticas.
+    Armazenamento em colunas (struct-of-arrays) das estatísticas de várias equipes:
+    uma array('q') contígua por estatística, indexada pela posição da equipe.
     """
 
+    __slots__ = CAMPOS_ESTATISTICAS + ("colunas", "observadores", "alteracoes")
+
     def __init__(self):
-        self.pontos = 0
-        self.vitorias = 0
-        self.empates = 0
-        self.derrotas = 0
-        self.gols_marcados = 0
-        self.gols_sofridos = 0
-        self.cartoes_vermelhos = 0
-        self.cartoes_amarelos = 0
+        self.colunas = tuple(array("q") for _ in CAMPOS_ESTATISTICAS)
+        (self.pontos, self.vitorias, self.empates, self.derrotas,
+         self.gols_marcados, self.gols_sofridos,
+         self.cartoes_vermelhos, self.cartoes_amarelos) = self.colunas
+        self.observadores = []  # funções chamadas com o índice da linha alterada
+        self.alteracoes = 0     # avisos já feitos; serve de versão das estatísticas
+
+    def __len__(self):
+        return len(self.pontos)
+
+    def adicionar(self, valores=None) -> int:
+        """Acrescenta uma linha (zerada ou com `valores` na ordem de CAMPOS_ESTATISTICAS)."""
+        for coluna, valor in zip(self.colunas, valores or (0,) * len(CAMPOS_ESTATISTICAS)):
+            coluna.append(valor)
+        return len(self.pontos) - 1
+
+    def linha(self, indice: int):
+        return tuple(coluna[indice] for coluna in self.colunas)
+
+    def notificar(self, indice: int):
+        self.alteracoes += 1
+        for observador in self.observadores:
+            observador(indice)
+
+
+def _campo(posicao: int):
+    """Propriedade que lê/escreve a coluna `posicao` na linha da equipe."""
+
+    def ler(self):
+        return self._colunas.colunas[posicao][self._indice]
+
+    def escrever(self, valor):
+        self._colunas.colunas[posicao][self._indice] = valor
+        self._colunas.notificar(self._indice)
+
+    return property(ler, escrever)
+
+
+class _OperacoesEstatisticas:
+    """Operações comuns às estatísticas guardadas em atributos ou em colunas."""
+
+    __slots__ = ()
 
     def registrar_gols(self, gols_marcados: int, gols_sofridos: int):
         self.gols_marcados += gols_marcados
@@ -29,6 +74,19 @@ class EstatisticasEquipe:
     def registrar_derrota(self):
         self.derrotas += 1
 
+    def somar_resultado(self, gols_marcados: int, gols_sofridos: int, sinal: int = 1):
+        """Soma (sinal 1) ou subtrai (sinal -1) os gols e o resultado de uma partida."""
+        self.gols_marcados += sinal * gols_marcados
+        self.gols_sofridos += sinal * gols_sofridos
+        if gols_marcados > gols_sofridos:
+            self.pontos += 3 * sinal
+            self.vitorias += sinal
+        elif gols_marcados == gols_sofridos:
+            self.pontos += sinal
+            self.empates += sinal
+        else:
+            self.derrotas += sinal
+
     def registrar_cartoes(self, vermelhos: int = 0, amarelos: int = 0):
         """Registra cartões recebidos na partida."""
         if vermelhos < 0 or amarelos < 0:
@@ -36,9 +94,88 @@ class EstatisticasEquipe:
         self.cartoes_vermelhos += vermelhos
         self.cartoes_amarelos += amarelos
 
+    def remover_cartoes(self, vermelhos: int = 0, amarelos: int = 0):
+        """Desfaz cartões antes registrados por registrar_cartoes."""
+        if vermelhos < 0 or amarelos < 0:
+            raise ValueError("Quantidade de cartões não pode ser negativa.")
+        self.cartoes_vermelhos -= vermelhos
+        self.cartoes_amarelos -= amarelos
+
     def saldo_de_gols(self) -> int:
         return self.gols_marcados - self.gols_sofridos
 
+    def mover_para(self, colunas: ColunasEstatisticas) -> "EstatisticasEmColunas":
+        """Copia os valores para uma linha nova de `colunas` e retorna a visão dessa linha."""
+        return EstatisticasEmColunas(colunas, colunas.adicionar(self.valores()))
+
+
+class EstatisticasEquipe(_OperacoesEstatisticas):
+    """
+    Dado extraído de Equipe para isolar a responsabilidade de armazenar
+    e atualizar estatísticas.
+
+    Isolada, a equipe guarda os valores em atributos (slots); ao entrar em um
+    Campeonato eles passam para as colunas dele (ver Equipe.mover_para).
+    """
+
+    __slots__ = CAMPOS_ESTATISTICAS
+
+    def __init__(self):
+        self.pontos = 0
+        self.vitorias = 0
+        self.empates = 0
+        self.derrotas = 0
+        self.gols_marcados = 0
+        self.gols_sofridos = 0
+        self.cartoes_vermelhos = 0
+        self.cartoes_amarelos = 0
+
+    def valores(self):
+        """Todas as estatísticas da equipe, na ordem de CAMPOS_ESTATISTICAS."""
+        return (self.pontos, self.vitorias, self.empates, self.derrotas,
+                self.gols_marcados, self.gols_sofridos, self.cartoes_vermelhos, self.cartoes_amarelos)
+
+
+class EstatisticasEmColunas(_OperacoesEstatisticas):
+    """
+    Estatísticas de uma equipe de Campeonato: visão da linha `indice` de
+    ColunasEstatisticas. Cada escrita avisa os observadores das colunas.
+    """
+
+    __slots__ = ("_colunas", "_indice")
+
+    pontos = _campo(0)
+    vitorias = _campo(1)
+    empates = _campo(2)
+    derrotas = _campo(3)
+    gols_marcados = _campo(4)
+    gols_sofridos = _campo(5)
+    cartoes_vermelhos = _campo(6)
+    cartoes_amarelos = _campo(7)
+
+    def __init__(self, colunas: ColunasEstatisticas, indice: int):
+        self._colunas = colunas
+        self._indice = indice
+
+    def somar_resultado(self, gols_marcados: int, gols_sofridos: int, sinal: int = 1):
+        """Como em EstatisticasEquipe, escrevendo nas colunas e avisando os observadores uma vez só."""
+        colunas, indice = self._colunas, self._indice
+        colunas.gols_marcados[indice] += sinal * gols_marcados
+        colunas.gols_sofridos[indice] += sinal * gols_sofridos
+        if gols_marcados > gols_sofridos:
+            colunas.pontos[indice] += 3 * sinal
+            colunas.vitorias[indice] += sinal
+        elif gols_marcados == gols_sofridos:
+            colunas.pontos[indice] += sinal
+            colunas.empates[indice] += sinal
+        else:
+            colunas.derrotas[indice] += sinal
+        colunas.notificar(indice)
+
+    def valores(self):
+        """Todas as estatísticas da equipe, na ordem de CAMPOS_ESTATISTICAS."""
+        return self._colunas.linha(self._indice)
+
 
 class AtualizacaoEstatisticas:
     """
@@ -46,6 +183,8 @@ class AtualizacaoEstatisticas:
     substituindo a lógica direta no método original.
     """
 
+    __slots__ = ("equipe", "gols_marcados", "gols_sofridos")
+
     def __init__(self, equipe, gols_marcados: int, gols_sofridos: int):
         self.equipe = equipe
         self.gols_marcados = gols_marcados
@@ -53,23 +192,16 @@ class AtualizacaoEstatisticas:
 
     def executar(self):
         self._validar_gols()
-        self._atualizar_totais()
-        self._registrar_resultado()
+        self.equipe.estatisticas.somar_resultado(self.gols_marcados, self.gols_sofridos)
 
     def _validar_gols(self):
         if self.gols_marcados < 0 or self.gols_sofridos < 0:
             raise ValueError("Os gols não podem ser negativos.")
 
-    def _atualizar_totais(self):
-        self.equipe.estatisticas.registrar_gols(self.gols_marcados, self.gols_sofridos)
-
-    def _registrar_resultado(self):
-        if self.gols_marcados > self.gols_sofridos:
-            self.equipe.estatisticas.registrar_vitoria()
-        elif self.gols_marcados == self.gols_sofridos:
-            self.equipe.estatisticas.registrar_empate()
-        else:
-            self.equipe.estatisticas.registrar_derrota()
+    def desfazer(self):
+        """Subtrai das estatísticas um resultado antes aplicado por executar."""
+        self._validar_gols()
+        self.equipe.estatisticas.somar_resultado(self.gols_marcados, self.gols_sofridos, sinal=-1)
 
 
 class Equipe:
@@ -77,10 +209,21 @@ class Equipe:
     Representa uma equipe no campeonato, armazenando suas estatísticas.
     """
 
+    __slots__ = ("nome", "estatisticas", "id")
+
     def __init__(self, nome: str):
         self.nome = nome
+        self.id = None  # atribuído pelo RegistroEquipes do campeonato
         self.estatisticas = EstatisticasEquipe()
 
+    def mover_para(self, colunas: ColunasEstatisticas) -> int:
+        """
+        Passa as estatísticas para uma linha nova de `colunas` (as de um Campeonato)
+        e retorna o índice dessa linha; daí em diante leituras e escritas vão às colunas.
+        """
+        self.estatisticas = self.estatisticas.mover_para(colunas)
+        return len(colunas) - 1
+
     def atualizar_estatisticas(self, gols_marcados: int, gols_sofridos: int):
         """
         Atualiza as estatísticas da equipe a partir de um resultado, delegando
@@ -88,6 +231,12 @@ class Equipe:
         """
         AtualizacaoEstatisticas(self, gols_marcados, gols_sofridos).executar()
 
+    def reverter_estatisticas(self, gols_marcados: int, gols_sofridos: int):
+        """
+        Desfaz um resultado antes aplicado por atualizar_estatisticas.
+        """
+        AtualizacaoEstatisticas(self, gols_marcados, gols_sofridos).desfazer()
+
     @property
     def pontos(self):
         return self.estatisticas.pontos
@@ -0,0 +1,154 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+class MetricasGerenciador:
+    """Contadores agregados de todas as competições, atualizados pelos workers."""
+
+    def __init__(self):
+        self._trava = threading.Lock()
+        self.inicio = time.perf_counter()
+        self.partidas = 0
+        self.consultas = 0
+        self.tarefas = 0
+        self.tempo_ocupado = 0.0  # soma do tempo gasto dentro das tarefas (todas as threads)
+        self.partidas_por_competicao: Dict[str, int] = {}
+
+    def registrar(self, competicao: str, partidas: int, consultas: int, duracao: float):
+        with self._trava:
+            self.partidas += partidas
+            self.consultas += consultas
+            self.tarefas += 1
+            self.tempo_ocupado += duracao
+            if partidas:
+                self.partidas_por_competicao[competicao] = self.partidas_por_competicao.get(competicao, 0) + partidas
+
+    def resumo(self) -> dict:
+        """Totais e vazão (por segundo) desde a criação do gerenciador."""
+        with self._trava:
+            decorrido = max(time.perf_counter() - self.inicio, 1e-9)
+            return {
+                "partidas": self.partidas,
+                "consultas": self.consultas,
+                "tarefas": self.tarefas,
+                "competicoes_ativas": len(self.partidas_por_competicao),
+                "partidas_por_segundo": self.partidas / decorrido,
+                "consultas_por_segundo": self.consultas / decorrido,
+                "tempo_medio_tarefa": self.tempo_ocupado / self.tarefas if self.tarefas else 0.0,
+            }
+
+
+class GerenciadorCompeticoes:
+    """
+    Mantém várias competições (um Campeonato cada) com um registro único de clubes.
+
+    Um clube é identificado pelo nome e tem uma Equipe própria em cada competição
+    de que participa, então as estatísticas de cada competição ficam separadas.
+    Operações são executadas por um pool de threads; cada competição tem sua trava,
+    de modo que operações da mesma competição são serializadas e as demais seguem
+    em outras threads enquanto um desempate pesado é calculado.
+
+    Como o trabalho é Python puro, as threads se alternam pelo GIL: o ganho é de
+    isolamento (uma liga lenta não segura a fila das outras), não de paralelismo de CPU.
+    """
+
+    def __init__(self, workers: int = None):
+        self.competicoes: Dict[str, Campeonato] = {}
+        self.clubes: Dict[str, Dict[str, Equipe]] = {}  # clube -> {competição: Equipe}
+        self.metricas = MetricasGerenciador()
+        self._travas: Dict[str, threading.Lock] = {}
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    # REGISTRO
+
+    def adicionar_competicao(self, nome: str, clubes, semente=None) -> Campeonato:
+        """
+        Cria a competição `nome` com os clubes dados (nomes) e sorteia seus jogos. Os clubes
+        só são registrados depois que o campeonato foi criado e sorteado: se algo falha (um
+        clube repetido, por exemplo), o gerenciador fica como estava.
+        """
+        if nome in self.competicoes:
+            raise ValueError(f"A competição {nome} já existe.")
+        campeonato = Campeonato([Equipe(clube) for clube in clubes], semente=semente)
+        campeonato.sortear_jogos()
+        for equipe in campeonato.equipes:
+            self.clubes.setdefault(equipe.nome, {})[nome] = equipe
+        self._travas[nome] = threading.Lock()
+        self.competicoes[nome] = campeonato
+        return campeonato
+
+    def equipe(self, clube: str, competicao: str) -> Equipe:
+        """Equipe do clube na competição."""
+        try:
+            return self.clubes[clube][competicao]
+        except KeyError:
+            raise ValueError(f"O clube {clube} não participa da competição {competicao}.") from None
+
+    def competicoes_do_clube(self, clube: str) -> List[str]:
+        return list(self.clubes.get(clube, ()))
+
+    def _campeonato(self, competicao: str) -> Campeonato:
+        campeonato = self.competicoes.get(competicao)
+        if campeonato is None:
+            raise ValueError(f"Competição desconhecida: {competicao}")
+        return campeonato
+
+    # OPERAÇÕES (assíncronas: retornam Future)
+
+    def _executar(self, competicao: str, operacao, partidas: int = 0, consultas: int = 0) -> Future:
+        campeonato = self._campeonato(competicao)
+        trava = self._travas[competicao]
+
+        def tarefa():
+            inicio = time.perf_counter()
+            with trava:
+                resultado = operacao(campeonato)
+            self.metricas.registrar(competicao, partidas, consultas, time.perf_counter() - inicio)
+            return resultado
+
+        return self._executor.submit(tarefa)
+
+    def processar_partida(self, competicao: str, mandante: str, visitante: str,
+                          gols_mandante: int, gols_visitante: int) -> Future:
+        """Processa um resultado na competição; o Future traz o identificador da partida."""
+        partida = Partida(self.equipe(mandante, competicao), self.equipe(visitante, competicao),
+                          gols_mandante, gols_visitante)
+        return self._executar(competicao, lambda campeonato: campeonato.processar_partida(partida), partidas=1)
+
+    def processar_lote(self, resultados) -> Dict[str, Future]:
+        """
+        Processa (competição, mandante, visitante, gols_m, gols_v) agrupando por competição:
+        uma tarefa com Campeonato.processar_partidas por competição. Retorna {competição: Future}.
+        """
+        por_competicao: Dict[str, list] = {}
+        for competicao, mandante, visitante, gols_m, gols_v in resultados:
+            por_competicao.setdefault(competicao, []).append((mandante, visitante, gols_m, gols_v))
+        return {
+            competicao: self._executar(competicao, lambda campeonato, lote=lote: campeonato.processar_partidas(lote),
+                                       partidas=len(lote))
+            for competicao, lote in por_competicao.items()
+        }
+
+    def classificacao(self, competicao: str) -> Future:
+        """Future com a classificação atual (lista de Equipe) da competição."""
+        return self._executar(competicao, lambda campeonato: campeonato.calcular_classificacao(), consultas=1)
+
+    def classificacoes(self, competicoes=None) -> Dict[str, List[Equipe]]:
+        """Classificação de várias competições (todas por padrão), calculadas no pool."""
+        futuros = {nome: self.classificacao(nome) for nome in (competicoes or list(self.competicoes))}
+        return {nome: futuro.result() for nome, futuro in futuros.items()}
+
+    def encerrar(self, esperar: bool = True):
+        self._executor.shutdown(wait=esperar)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.encerrar()
@@ -0,0 +1,106 @@
+from array import array
+from typing import NamedTuple
+
+
+class LinhaTabela(NamedTuple):
+    """Linha da tabela de classificação em um instante do campeonato."""
+    posicao: int
+    nome: str
+    pontos: int
+    vitorias: int
+    empates: int
+    derrotas: int
+    gols_marcados: int
+    gols_sofridos: int
+    cartoes_vermelhos: int
+    cartoes_amarelos: int
+
+    @property
+    def saldo_de_gols(self) -> int:
+        return self.gols_marcados - self.gols_sofridos
+
+
+class RetratoRodada:
+    """
+    Classificação e estatísticas registradas ao fim de uma rodada.
+
+    `linhas[i]` é a tupla de estatísticas da equipe i (ordem de CAMPOS_ESTATISTICAS);
+    tuplas de equipes que não mudaram são compartilhadas com o retrato anterior.
+    """
+
+    __slots__ = ("rodada", "ordem", "posicoes", "linhas")
+
+    def __init__(self, rodada: int, ordem: array, posicoes: array, linhas: tuple):
+        self.rodada = rodada
+        self.ordem = ordem        # índices das equipes do 1º ao último
+        self.posicoes = posicoes  # índice da equipe -> posição (1 = líder)
+        self.linhas = linhas
+
+
+class HistoricoRodadas:
+    """
+    Guarda um RetratoRodada por rodada encerrada, com acesso direto pelo número.
+
+    As colunas de estatísticas avisam quais equipes mudaram desde o último retrato;
+    só essas ganham tupla nova (cópia na escrita), então as tuplas de estatísticas
+    crescem com o número de partidas. Cada retrato ainda guarda N referências a elas
+    e as arrays `ordem` e `posicoes` de N inteiros, ou seja, a memória continua
+    O(equipes × rodadas), com poucos bytes por equipe e rodada.
+    """
+
+    def __init__(self, colunas):
+        self.colunas = colunas
+        self.retratos = {}
+        self._ultimas_linhas = None  # preenchidas no primeiro retrato
+        self._alteradas = set()
+        colunas.observadores.append(self._alteradas.add)
+
+    def registrar(self, rodada: int, classificacao_indices):
+        """Registra o retrato da `rodada` a partir da ordem atual (índices das equipes)."""
+        if self._ultimas_linhas is None:
+            self._ultimas_linhas = [self.colunas.linha(i) for i in range(len(self.colunas))]
+        else:
+            for indice in self._alteradas:
+                self._ultimas_linhas[indice] = self.colunas.linha(indice)
+        self._alteradas.clear()
+        self._guardar(rodada, classificacao_indices, tuple(self._ultimas_linhas))
+
+    def restaurar(self, rodada: int, classificacao_indices, linhas):
+        """
+        Recoloca um retrato salvo (checkpoint), com as linhas de estatísticas já prontas;
+        linhas iguais às do retrato anterior passam a ser compartilhadas com ele.
+        """
+        anteriores = [r for r in self.retratos if r < rodada]
+        if anteriores:
+            anterior = self.retratos[max(anteriores)].linhas
+            linhas = tuple(antiga if antiga == linha else linha for antiga, linha in zip(anterior, linhas))
+        self._guardar(rodada, classificacao_indices, tuple(linhas))
+
+    def _guardar(self, rodada: int, classificacao_indices, linhas: tuple):
+        ordem = array("I", classificacao_indices)
+        posicoes = array("I", bytes(4 * len(ordem)))
+        for posicao, indice in enumerate(ordem, start=1):
+            posicoes[indice] = posicao
+        self.retratos[rodada] = RetratoRodada(rodada, ordem, posicoes, linhas)
+
+    def descartar(self, rodada: int):
+        """Remove o retrato da `rodada`, se houver (por exemplo, tirado com placares provisórios)."""
+        self.retratos.pop(rodada, None)
+
+    def retrato(self, rodada: int) -> RetratoRodada:
+        if rodada not in self.retratos:
+            raise KeyError(f"Rodada {rodada} ainda não foi registrada.")
+        return self.retratos[rodada]
+
+    def posicao(self, rodada: int, indice: int) -> int:
+        return self.retrato(rodada).posicoes[indice]
+
+    def trajetoria(self, indice: int):
+        """Posições da equipe em cada rodada registrada, em ordem de rodada."""
+        return [self.retratos[r].posicoes[indice] for r in sorted(self.retratos)]
+
+    def tabela(self, rodada: int, equipes):
+        """Tabela completa (LinhaTabela) como estava ao fim da rodada."""
+        retrato = self.retrato(rodada)
+        return [LinhaTabela(posicao, equipes[indice].nome, *retrato.linhas[indice])
+                for posicao, indice in enumerate(retrato.ordem, start=1)]
@@ -0,0 +1,194 @@
+"""
+Instrumentação opcional dos caminhos quentes (classificação, desempates,
+confronto direto, processamento de partidas).
+
+Desativada, não há custo algum: os métodos originais ficam nas classes. `ativar()`
+troca cada método listado em PONTOS_QUENTES por um invólucro que conta chamadas e
+acumula o tempo de parede (inclusivo: chamadas aninhadas contam nos dois níveis);
+`desativar()` devolve os originais.
+
+    with instrumentado():
+        campeonato.calcular_classificacao()
+    print(para_json())
+
+O alcance é o processo inteiro: os métodos são trocados nas classes, então todos os
+campeonatos (de todas as threads) são medidos enquanto houver instrumentação, e as
+métricas são uma só. Trocas e restaurações passam por uma trava. Blocos
+`instrumentado()` podem se aninhar ou correr em threads diferentes: só o primeiro
+zera as métricas e só o último a sair restaura os métodos.
+"""
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+from src.campeonato import Campeonato
+from src.classificacao import TabelaClassificacao
+from src.confrontos import ConfrontosDiretos
+from src.equipe import Equipe
+from src.partida import Partida
+
+PONTOS_QUENTES = (
+    (Campeonato, "processar_partida"),
+    (Campeonato, "processar_partidas"),
+    (Partida, "processar_resultado"),
+    (Equipe, "atualizar_estatisticas"),
+    (Equipe, "reverter_estatisticas"),
+    (Campeonato, "calcular_classificacao"),
+    (Campeonato, "determinar_classificacoes"),
+    (Campeonato, "_aplicar_desempates"),
+    (Campeonato, "_desempatar_grupo"),
+    (Campeonato, "_pontuacao_confronto_direto"),
+    (Campeonato, "_ordenar_por_cartoes"),
+    (TabelaClassificacao, "_reposicionar"),
+    (TabelaClassificacao, "_montar"),
+    (ConfrontosDiretos, "mini_tabela"),
+    (ConfrontosDiretos, "pontuacao"),
+)
+
+_originais = {}   # (classe, método) -> função original
+_metricas = {}    # "Classe.método" -> [chamadas, segundos]
+_trava = threading.RLock()
+_blocos = 0                 # blocos instrumentado() abertos
+_ativado_por_blocos = False  # a instrumentação foi ligada pelo primeiro bloco (e não por ativar())
+
+
+def _nome(classe, metodo: str) -> str:
+    return f"{classe.__name__}.{metodo}"
+
+
+def _envolver(nome: str, funcao):
+    registro = _metricas.setdefault(nome, [0, 0.0])
+    relogio = time.perf_counter
+
+    @functools.wraps(funcao)
+    def medido(*args, **kwargs):
+        inicio = relogio()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            # sem trava: sob várias threads as somas são aproximadas
+            registro[0] += 1
+            registro[1] += relogio() - inicio
+
+    return medido
+
+
+def ativo() -> bool:
+    return bool(_originais)
+
+
+def ativar(pontos=PONTOS_QUENTES):
+    """Instala os invólucros de medição (sem efeito nos pontos já instrumentados)."""
+    with _trava:
+        for classe, metodo in pontos:
+            if (classe, metodo) in _originais:
+                continue
+            original = classe.__dict__[metodo]
+            _originais[(classe, metodo)] = original
+            setattr(classe, metodo, _envolver(_nome(classe, metodo), original))
+
+
+def desativar():
+    """Restaura os métodos originais; as métricas acumuladas são mantidas."""
+    with _trava:
+        for (classe, metodo), original in _originais.items():
+            setattr(classe, metodo, original)
+        _originais.clear()
+
+
+def zerar():
+    for registro in _metricas.values():
+        registro[0], registro[1] = 0, 0.0
+
+
+@contextmanager
+def instrumentado(pontos=PONTOS_QUENTES, zerar_antes: bool = True):
+    """
+    Ativa a instrumentação dentro do bloco. Com outros blocos abertos (aninhados ou em
+    outras threads), não zera as métricas deles e só desativa quando o último sair;
+    se já estava ativa por ativar(), continua ativa depois.
+    """
+    global _blocos, _ativado_por_blocos
+    with _trava:
+        if _blocos == 0:
+            if zerar_antes:
+                zerar()
+            _ativado_por_blocos = not ativo()
+        _blocos += 1
+        ativar(pontos)
+    try:
+        yield
+    finally:
+        with _trava:
+            _blocos -= 1
+            if _blocos == 0 and _ativado_por_blocos:
+                desativar()
+
+
+def instantaneo() -> dict:
+    """{"Classe.método": {"chamadas", "tempo_total", "tempo_medio"}} dos pontos já chamados."""
+    return {
+        nome: {"chamadas": chamadas, "tempo_total": segundos,
+               "tempo_medio": segundos / chamadas}
+        for nome, (chamadas, segundos) in sorted(_metricas.items()) if chamadas
+    }
+
+
+def para_json(**opcoes_json) -> str:
+    return json.dumps({"ativo": ativo(), "pontos": instantaneo()}, **opcoes_json)
+
+
+# CAPTURA COM cProfile / tracemalloc
+
+class Captura:
+    """Resultado de `capturar`: perfil de chamadas e memória alocada no bloco."""
+
+    def __init__(self):
+        self.perfil = None           # cProfile.Profile
+        self.pico_memoria = None     # bytes, acima do que já estava alocado no início
+        self.maiores_alocacoes = []  # (arquivo:linha, bytes) das linhas que mais alocaram
+
+    def relatorio_perfil(self, limite: int = 20, ordem: str = "cumulative") -> str:
+        if self.perfil is None:
+            return ""
+        saida = io.StringIO()
+        pstats.Stats(self.perfil, stream=saida).sort_stats(ordem).print_stats(limite)
+        return saida.getvalue()
+
+    def para_dict(self) -> dict:
+        return {"pico_memoria": self.pico_memoria,
+                "maiores_alocacoes": [{"local": local, "bytes": tamanho} for local, tamanho in self.maiores_alocacoes]}
+
+
+@contextmanager
+def capturar(perfil: bool = True, memoria: bool = True, alocacoes: int = 10):
+    """Executa o bloco sob cProfile e/ou tracemalloc e preenche a Captura devolvida."""
+    captura = Captura()
+    rastreando = memoria and not tracemalloc.is_tracing()
+    if rastreando:
+        tracemalloc.start()
+    if memoria:
+        tracemalloc.reset_peak()
+        inicial, _ = tracemalloc.get_traced_memory()
+        antes = tracemalloc.take_snapshot()
+    if perfil:
+        captura.perfil = cProfile.Profile()
+        captura.perfil.enable()
+    try:
+        yield captura
+    finally:
+        if perfil:
+            captura.perfil.disable()
+        if memoria:
+            captura.pico_memoria = tracemalloc.get_traced_memory()[1] - inicial
+            diferencas = tracemalloc.take_snapshot().compare_to(antes, "lineno")
+            captura.maiores_alocacoes = [(f"{d.traceback[0].filename}:{d.traceback[0].lineno}", d.size_diff)
+                                         for d in diferencas[:alocacoes]]
+        if rastreando:
+            tracemalloc.stop()
@@ -0,0 +1,153 @@
+import csv
+import io
+import json
+from itertools import islice
+from typing import List, NamedTuple
+
+from src.armazem_partidas import validar_partida
+
+# Campos esperados em cada linha (cabeçalho do CSV ou chaves do JSONL)
+CAMPOS = ("mandante", "visitante", "gols_mandante", "gols_visitante")
+
+
+class ErroLinha(NamedTuple):
+    """Linha do arquivo que não pôde ser aproveitada."""
+    linha: int
+    conteudo: str
+    motivo: str
+
+
+class RelatorioCarga:
+    """Resumo de uma carga: partidas aplicadas e linhas rejeitadas."""
+
+    def __init__(self, max_erros: int):
+        self.processadas = 0
+        self.total_erros = 0
+        self.erros: List[ErroLinha] = []  # apenas os primeiros `max_erros`
+        self._max_erros = max_erros
+
+    def registrar_erro(self, erro: ErroLinha):
+        self.total_erros += 1
+        if len(self.erros) < self._max_erros:
+            self.erros.append(erro)
+
+
+class LeitorResultados:
+    """
+    Lê arquivos de resultados (CSV ou JSONL) linha a linha e alimenta um Campeonato
+    em lotes, sem carregar o arquivo inteiro na memória.
+
+    Os nomes das equipes são resolvidos pelo registro do campeonato (campeonato.registro).
+    Linhas inválidas (equipe desconhecida, gols negativos ou que não são inteiros, mesma
+    equipe nos dois lados) são relatadas e a leitura continua. Gols só valem como
+    inteiros de verdade no JSONL e como texto de dígitos no CSV: 1.7, true ou "2" no
+    JSONL e "2.0" no CSV são recusados, não arredondados.
+    """
+
+    def __init__(self, campeonato, tamanho_lote: int = 10_000, competicao: str = None, max_erros: int = 1000):
+        self.campeonato = campeonato
+        self.tamanho_lote = tamanho_lote
+        self.competicao = competicao  # se definido, ignora linhas de outras competições
+        self.max_erros = max_erros
+
+    def carregar(self, origem, formato: str = None) -> RelatorioCarga:
+        """
+        Processa todas as linhas válidas de `origem` (caminho ou arquivo de texto aberto).
+
+        O formato é deduzido da extensão ('.csv' ou '.jsonl') quando não informado.
+        """
+        relatorio = RelatorioCarga(self.max_erros)
+        formato = formato or self._deduzir_formato(origem)
+        resultados = self._validar(self.ler(origem, formato), relatorio, formato)
+        while True:
+            lote = list(islice(resultados, self.tamanho_lote))
+            if not lote:
+                return relatorio
+            relatorio.processadas += self.campeonato.processar_partidas(lote)
+
+    def ler(self, origem, formato: str = None):
+        """Gera (número da linha, texto original, registro como dict) para cada linha de dados."""
+        formato = formato or self._deduzir_formato(origem)
+        if formato not in ("csv", "jsonl"):
+            raise ValueError(f"Formato de arquivo não suportado: {formato}")
+        if isinstance(origem, io.IOBase):
+            yield from self._ler_arquivo(origem, formato)
+            return
+        with open(origem, encoding="utf-8", newline="") as arquivo:
+            yield from self._ler_arquivo(arquivo, formato)
+
+    @staticmethod
+    def _deduzir_formato(origem):
+        nome = str(origem if isinstance(origem, str) else getattr(origem, "name", ""))
+        return nome.rsplit(".", 1)[-1].lower() if "." in nome else None
+
+    @staticmethod
+    def _ler_arquivo(arquivo, formato):
+        if formato == "jsonl":
+            for numero, texto in enumerate(arquivo, start=1):
+                if not texto.strip():
+                    continue
+                try:
+                    registro = json.loads(texto)
+                except json.JSONDecodeError:
+                    registro = None
+                yield numero, texto.rstrip("\n"), registro
+            return
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            return
+        cabecalho = [campo.strip() for campo in cabecalho]
+        for valores in leitor:
+            if not valores:
+                continue
+            registro = dict(zip(cabecalho, valores)) if len(valores) == len(cabecalho) else None
+            yield leitor.line_num, ",".join(valores), registro
+
+    def _validar(self, linhas, relatorio: RelatorioCarga, formato: str):
+        """Converte cada linha em (mandante, visitante, gols_m, gols_v), relatando as inválidas."""
+        for numero, texto, registro in linhas:
+            if not isinstance(registro, dict):
+                relatorio.registrar_erro(ErroLinha(numero, texto, "linha mal formada"))
+                continue
+            if self.competicao is not None and registro.get("competicao", self.competicao) != self.competicao:
+                continue
+            try:
+                resultado = self._converter(numero, registro, formato)
+            except ValueError as erro:
+                relatorio.registrar_erro(ErroLinha(numero, texto, str(erro)))
+                continue
+            yield resultado
+
+    def _converter(self, numero: int, registro, formato: str):
+        """(mandante, visitante, gols_m, gols_v) do registro; ValueError com o motivo se inválido."""
+        faltando = [campo for campo in CAMPOS if campo not in registro]
+        if faltando:
+            raise ValueError(f"campos ausentes: {', '.join(faltando)}")
+        for campo in ("mandante", "visitante"):
+            if not isinstance(registro[campo], str):
+                raise ValueError(f"{campo} deve ser o nome da equipe")
+            if self.campeonato.registro.id_do_nome(registro[campo]) is None:
+                raise ValueError(f"equipe desconhecida: {registro[campo]}")
+        gols = [_gols(registro[campo], numero, formato) for campo in ("gols_mandante", "gols_visitante")]
+        # mesmas verificações de Partida.__init__ e das colunas do armazém de partidas
+        if gols[0] < 0 or gols[1] < 0:
+            raise ValueError("Gols marcados não podem ser negativos.")
+        validar_partida(*gols)
+        if registro["mandante"] == registro["visitante"]:
+            raise ValueError("Uma partida não pode ter a mesma equipe como mandante e visitante.")
+        return registro["mandante"], registro["visitante"], gols[0], gols[1]
+
+
+def _gols(valor, linha: int, formato: str) -> int:
+    """
+    Gols de um registro: int (não bool) no JSONL; no CSV, texto só com dígitos, com sinal de
+    menos opcional para que gols negativos caiam na mensagem própria. ValueError com a linha.
+    """
+    if formato == "csv" and isinstance(valor, str):
+        texto = valor.strip()
+        if texto.removeprefix("-").isdigit() and texto.isascii():
+            return int(texto)
+    elif type(valor) is int:
+        return valor
+    raise ValueError(f"Linha {linha}: gols devem ser números inteiros, não {valor!r}.")
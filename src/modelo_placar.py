@@ -0,0 +1,333 @@
+"""
+Modelo de placar de ataque e defesa (Poisson, com correção de Dixon-Coles opcional)
+ajustado sobre os resultados processados dos campeonatos.
+
+    dados = DadosPartidas()
+    for temporada, campeonato in enumerate(temporadas):
+        dados.adicionar_campeonato(campeonato, tempo=temporada)
+    modelo = ModeloPlacar(meia_vida=3)
+    modelo.ajustar(dados)
+    modelo.matriz_placar("Flamengo", "Palmeiras")
+    campeonato.simular(10_000, modelo=modelo)
+
+Gols do mandante ~ Poisson(mando × ataque[m] × defesa[v]) e do visitante ~
+Poisson(ataque[v] × defesa[m]); `defesa` multiplica os gols do adversário (abaixo
+de 1, a equipe sofre menos que a média). O ajuste é por máxima verossimilhança
+com atualizações multiplicativas em forma fechada (método de Maher), feitas
+sobre somas ponderadas por confronto: cada iteração custa O(confrontos
+distintos), não O(partidas).
+"""
+import bisect
+import math
+from array import array
+from functools import lru_cache
+from operator import itemgetter, mul
+from typing import Dict, List, Tuple
+
+_BAIXOS = ((0, 0), (0, 1), (1, 0), (1, 1))  # placares corrigidos por Dixon-Coles
+
+
+def _nome(equipe) -> str:
+    return equipe if isinstance(equipe, str) else equipe.nome
+
+
+class DadosPartidas:
+    """Resultados em colunas (índices de equipe, gols, instante), acumulados de um ou mais campeonatos."""
+
+    def __init__(self):
+        self.nomes: List[str] = []
+        self._indices: Dict[str, int] = {}
+        self.mandantes = array("l")
+        self.visitantes = array("l")
+        self.gols_mandante = array("l")
+        self.gols_visitante = array("l")
+        self.tempos = array("d")
+
+    def __len__(self):
+        return len(self.mandantes)
+
+    def _indice(self, nome: str) -> int:
+        indice = self._indices.get(nome)
+        if indice is None:
+            indice = self._indices[nome] = len(self.nomes)
+            self.nomes.append(nome)
+        return indice
+
+    def adicionar(self, mandante, visitante, gols_mandante: int, gols_visitante: int, tempo: float = None):
+        """Acrescenta um resultado; sem `tempo`, usa a posição da partida nos dados."""
+        self.mandantes.append(self._indice(_nome(mandante)))
+        self.visitantes.append(self._indice(_nome(visitante)))
+        self.gols_mandante.append(gols_mandante)
+        self.gols_visitante.append(gols_visitante)
+        self.tempos.append(len(self.tempos) if tempo is None else tempo)
+
+    def adicionar_campeonato(self, campeonato, tempo: float = None):
+        """Acrescenta as partidas já processadas (e não desfeitas) do campeonato."""
+        nomes = [e.nome for e in campeonato.equipes]
+        for i, j, gols_m, gols_v in campeonato.partidas.registros():
+            self.adicionar(nomes[i], nomes[j], gols_m, gols_v, tempo)
+
+    def acompanhar(self, campeonato, tempo: float = None):
+        """
+        Acrescenta as partidas seguintes do campeonato à medida que são processadas.
+        Correções e desfeitas não são refletidas nos dados.
+        """
+        nomes = [e.nome for e in campeonato.equipes]
+
+        def ao_processar(_id_partida, i, j, gols_m, gols_v):
+            self.adicionar(nomes[i], nomes[j], gols_m, gols_v, tempo)
+        campeonato.ouvintes_partidas.append(ao_processar)
+        return ao_processar
+
+
+class ModeloPlacar:
+    """
+    Modelo de ataque e defesa por equipe com vantagem de mando, ajustado com
+    `ajustar` e utilizável como `modelo` de Campeonato.simular (sortear_placar).
+
+    Com `meia_vida`, cada partida pesa 0,5 ** (idade / meia_vida), medida nas
+    unidades de DadosPartidas.tempos a partir do resultado mais recente.
+    Com `dixon_coles`, a dependência entre os placares baixos (0x0, 1x0, 0x1, 1x1)
+    é estimada em um segundo passo, com ataque e defesa já fixados.
+    """
+
+    def __init__(self, dixon_coles: bool = True, meia_vida: float = None, max_gols: int = 10):
+        if meia_vida is not None and meia_vida <= 0:
+            raise ValueError("A meia-vida deve ser positiva.")
+        self.dixon_coles = dixon_coles
+        self.meia_vida = meia_vida
+        self.max_gols = max_gols
+        self.ataque: Dict[str, float] = {}
+        self.defesa: Dict[str, float] = {}
+        self.mando = 1.0
+        self.rho = 0.0
+        self.iteracoes = 0
+        self._acumuladas = {}  # (mandante, visitante) -> distribuição acumulada dos placares
+
+    # AJUSTE
+
+    def _pesos(self, dados: DadosPartidas):
+        if self.meia_vida is None:
+            return None
+        referencia = max(dados.tempos)
+        taxa = math.log(2) / self.meia_vida
+        return [math.exp(-taxa * (referencia - t)) for t in dados.tempos]
+
+    @staticmethod
+    def _agregar(dados: DadosPartidas, pesos):
+        """Somas ponderadas por confronto (mandante, visitante): [peso, gols_m, gols_v, n00, n01, n10, n11]."""
+        pares = {}
+        baixos = {placar: 3 + k for k, placar in enumerate(_BAIXOS)}
+        colunas = zip(dados.mandantes, dados.visitantes, dados.gols_mandante, dados.gols_visitante)
+        for k, (i, j, gols_m, gols_v) in enumerate(colunas):
+            w = 1.0 if pesos is None else pesos[k]
+            soma = pares.get((i, j))
+            if soma is None:
+                soma = pares[(i, j)] = [0.0] * 7
+            soma[0] += w
+            soma[1] += w * gols_m
+            soma[2] += w * gols_v
+            posicao = baixos.get((gols_m, gols_v))
+            if posicao is not None:
+                soma[posicao] += w
+        return pares
+
+    def ajustar(self, dados: DadosPartidas, tolerancia: float = 1e-8, max_iteracoes: int = 1000) -> int:
+        """
+        Ajusta o modelo aos dados e retorna o número de iterações. Parâmetros de um
+        ajuste anterior servem de ponto de partida (reajuste rápido após cada rodada).
+        """
+        if not len(dados):
+            raise ValueError("Não há partidas para ajustar o modelo.")
+        n = len(dados.nomes)
+        pares = self._agregar(dados, self._pesos(dados))
+        itens = [(i, j, s[0], s[1], s[2]) for (i, j), s in pares.items()]
+
+        gols_pro = [0.0] * n
+        gols_contra = [0.0] * n
+        gols_casa = 0.0
+        for i, j, _, gols_m, gols_v in itens:
+            gols_pro[i] += gols_m
+            gols_pro[j] += gols_v
+            gols_contra[i] += gols_v
+            gols_contra[j] += gols_m
+            gols_casa += gols_m
+
+        ataque = [self.ataque.get(nome, 1.0) for nome in dados.nomes]
+        defesa = [self.defesa.get(nome, 1.0) for nome in dados.nomes]
+        mando = self.mando
+        for iteracao in range(1, max_iteracoes + 1):
+            exposicao = [0.0] * n
+            for i, j, w, _, _ in itens:
+                exposicao[i] += w * mando * defesa[j]
+                exposicao[j] += w * defesa[i]
+            novo_ataque = [g / e if e else 0.0 for g, e in zip(gols_pro, exposicao)]
+
+            exposicao = [0.0] * n
+            for i, j, w, _, _ in itens:
+                exposicao[j] += w * mando * novo_ataque[i]
+                exposicao[i] += w * novo_ataque[j]
+            nova_defesa = [g / e if e else 0.0 for g, e in zip(gols_contra, exposicao)]
+
+            esperado_casa = sum(w * novo_ataque[i] * nova_defesa[j] for i, j, w, _, _ in itens)
+            novo_mando = gols_casa / esperado_casa if esperado_casa else 1.0
+
+            # ataque e defesa só são identificáveis a menos de um fator comum: média do ataque = 1
+            fator = sum(novo_ataque) / n or 1.0
+            novo_ataque = [a / fator for a in novo_ataque]
+            nova_defesa = [d * fator for d in nova_defesa]
+
+            variacao = max(abs(novo - velho) / (velho or 1.0) for novo, velho in
+                           zip(novo_ataque + nova_defesa + [novo_mando], ataque + defesa + [mando]))
+            ataque, defesa, mando = novo_ataque, nova_defesa, novo_mando
+            if variacao < tolerancia:
+                break
+
+        self.ataque = dict(zip(dados.nomes, ataque))
+        self.defesa = dict(zip(dados.nomes, defesa))
+        self.mando = mando
+        self.rho = self._ajustar_rho(pares, ataque, defesa, mando) if self.dixon_coles else 0.0
+        self.iteracoes = iteracao
+        self._acumuladas.clear()
+        return iteracao
+
+    @staticmethod
+    def _ajustar_rho(pares, ataque, defesa, mando) -> float:
+        """
+        Máximo de Σ n·log τ nos placares baixos. A função é côncava em rho, então
+        basta a bisseção da derivada dentro do intervalo em que todo τ é positivo.
+        """
+        termos = []
+        minimo, maximo = -1.0, 1.0
+        for (i, j), soma in pares.items():
+            if not any(soma[3:]):
+                continue
+            lam, mu = mando * ataque[i] * defesa[j], ataque[j] * defesa[i]
+            termos.append((lam, mu, soma[3], soma[4], soma[5], soma[6]))
+            if lam:
+                minimo = max(minimo, -1 / lam)
+            if mu:
+                minimo = max(minimo, -1 / mu)
+            if lam * mu:
+                maximo = min(maximo, 1 / (lam * mu))
+        if not termos:
+            return 0.0
+
+        def derivada(rho):
+            total = 0.0
+            for lam, mu, n00, n01, n10, n11 in termos:
+                total += (-n00 * lam * mu / (1 - lam * mu * rho) + n01 * lam / (1 + lam * rho)
+                          + n10 * mu / (1 + mu * rho) - n11 / (1 - rho))
+            return total
+
+        margem = 1e-9 * (maximo - minimo)
+        baixo, alto = minimo + margem, maximo - margem
+        for _ in range(100):
+            meio = (baixo + alto) / 2
+            if derivada(meio) > 0:
+                baixo = meio
+            else:
+                alto = meio
+        return (baixo + alto) / 2
+
+    # PREVISÃO
+
+    def medias(self, mandante, visitante) -> Tuple[float, float]:
+        """Gols esperados (mandante, visitante); equipes fora do ajuste valem a média (1,0)."""
+        m, v = _nome(mandante), _nome(visitante)
+        return (self.mando * self.ataque.get(m, 1.0) * self.defesa.get(v, 1.0),
+                self.ataque.get(v, 1.0) * self.defesa.get(m, 1.0))
+
+    def matriz_placar(self, mandante, visitante, max_gols: int = None) -> List[List[float]]:
+        """P[gols_mandante][gols_visitante] até `max_gols` (a massa além do limite fica de fora)."""
+        limite = self.max_gols if max_gols is None else max_gols
+        lam, mu = self.medias(mandante, visitante)
+        poisson_m = _poisson(lam, limite)
+        poisson_v = _poisson(mu, limite)
+        matriz = [[pm * pv for pv in poisson_v] for pm in poisson_m]
+        if self.rho and limite >= 1:
+            rho = self.rho
+            matriz[0][0] *= 1 - lam * mu * rho
+            matriz[0][1] *= 1 + lam * rho
+            matriz[1][0] *= 1 + mu * rho
+            matriz[1][1] *= 1 - rho
+        return matriz
+
+    def probabilidades(self, mandante, visitante) -> Tuple[float, float, float]:
+        """(vitória do mandante, empate, vitória do visitante)."""
+        matriz = self.matriz_placar(mandante, visitante)
+        vitoria = empate = derrota = 0.0
+        for x, linha in enumerate(matriz):
+            vitoria += sum(linha[:x])
+            empate += linha[x]
+            derrota += sum(linha[x + 1:])
+        return vitoria, empate, derrota
+
+    def sortear_placar(self, mandante: str, visitante: str, rng) -> Tuple[int, int]:
+        """
+        Sorteia (gols_mandante, gols_visitante) pela matriz do confronto (interface de ModeloPoisson),
+        condicionada a placares até `max_gols`: a massa truncada se reparte proporcionalmente.
+        """
+        acumulada = self._acumulada(mandante, visitante)
+        posicao = min(bisect.bisect_right(acumulada, rng.random() * acumulada[-1]), len(acumulada) - 1)
+        return divmod(posicao, self.max_gols + 1)
+
+    def sortear_placares(self, confrontos, rng) -> List[Tuple[int, int]]:
+        """
+        sortear_placar para cada (mandante, visitante) de `confrontos`, com os mesmos números de
+        `rng` na mesma ordem; as buscas e a conversão em placar rodam em map, sem laço por jogo.
+        """
+        acumuladas = [self._acumulada(mandante, visitante) for mandante, visitante in confrontos]
+        sorteio = rng.random
+        alvos = map(mul, [sorteio() for _ in acumuladas], map(itemgetter(-1), acumuladas))
+        return list(map(_placares_por_posicao(self.max_gols).__getitem__,
+                        map(bisect.bisect_right, acumuladas, alvos)))
+
+    def _acumulada(self, mandante: str, visitante: str) -> List[float]:
+        acumulada = self._acumuladas.get((mandante, visitante))
+        if acumulada is None:
+            acumulada = []
+            total = 0.0
+            for linha in self.matriz_placar(mandante, visitante):
+                for p in linha:
+                    total += p
+                    acumulada.append(total)
+            self._acumuladas[(mandante, visitante)] = acumulada
+        return acumulada
+
+    def log_verossimilhanca(self, dados: DadosPartidas) -> float:
+        """Log-verossimilhança (sem pesos) dos resultados sob os parâmetros atuais."""
+        total = 0.0
+        nomes = dados.nomes
+        for i, j, gols_m, gols_v in zip(dados.mandantes, dados.visitantes, dados.gols_mandante, dados.gols_visitante):
+            lam, mu = self.medias(nomes[i], nomes[j])
+            total += _log_poisson(gols_m, lam) + _log_poisson(gols_v, mu)
+            if self.rho and gols_m <= 1 and gols_v <= 1:
+                total += math.log({(0, 0): 1 - lam * mu * self.rho, (0, 1): 1 + lam * self.rho,
+                                   (1, 0): 1 + mu * self.rho, (1, 1): 1 - self.rho}[(gols_m, gols_v)])
+        return total
+
+
+def _poisson(media: float, limite: int) -> List[float]:
+    termo = math.exp(-media)
+    probabilidades = []
+    for gols in range(limite + 1):
+        probabilidades.append(termo)
+        termo *= media / (gols + 1)
+    return probabilidades
+
+
+@lru_cache(maxsize=8)
+def _placares_por_posicao(max_gols: int) -> Tuple[Tuple[int, int], ...]:
+    """
+    Placar de cada posição da acumulada achatada, com uma posição a mais para a busca que cai
+    além da última (arredondamento), como o min de sortear_placar.
+    """
+    ultima = (max_gols + 1) ** 2 - 1
+    return tuple(divmod(min(posicao, ultima), max_gols + 1) for posicao in range(ultima + 2))
+
+
+def _log_poisson(gols: int, media: float) -> float:
+    if media <= 0:
+        return 0.0 if gols == 0 else -math.inf
+    return gols * math.log(media) - media - math.lgamma(gols + 1)
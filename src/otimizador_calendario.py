@@ -0,0 +1,263 @@
+import random
+import time
+from typing import List, Tuple
+
+
+# Peso de cada violação de restrição obrigatória na função objetivo; maior que
+# qualquer número possível de quebras, então nenhuma troca de quebras compensa uma violação.
+PESO_VIOLACAO = 1_000_000
+
+_FORA, _CASA, _FOLGA = 0, 1, 2
+
+
+class ResultadoOtimizacao:
+    """Calendário encontrado pelo otimizador e o valor de cada parte do objetivo."""
+
+    def __init__(self, rodadas: List[List[Tuple]], quebras: int, violacoes: int, iteracoes: int):
+        self.rodadas = rodadas
+        self.quebras = quebras        # jogos seguidos em casa (ou fora) somados entre as equipes
+        self.violacoes = violacoes    # restrições obrigatórias não atendidas
+        self.iteracoes = iteracoes
+
+    @property
+    def objetivo(self) -> int:
+        return self.quebras + PESO_VIOLACAO * self.violacoes
+
+
+class OtimizadorCalendario:
+    """
+    Busca local sobre o calendário de turno e returno espelhado.
+
+    Parte do calendário do campeonato: o sorteado, com os mandos canônicos do
+    método do círculo, ou as rodadas definidas nele (por exemplo, por uma otimização
+    anterior), que precisam formar um turno e returno espelhado. Sem rodadas, ou com
+    rodadas em outro formato, gera ValueError. Aplica três movimentos, cada um
+    avaliado só nas células (equipe, rodada) que ele altera:
+
+    - inverter o mando de um confronto (no turno e no returno);
+    - trocar duas rodadas do turno de lugar (as do returno acompanham);
+    - trocar duas equipes de papel no calendário inteiro (só muda as restrições).
+
+    Movimentos que não pioram o objetivo são aceitos, então o estado atual é sempre
+    o melhor encontrado. Sem restrições o ponto de partida já atinge o mínimo de
+    3n - 6 quebras do returno espelhado (n par), e a busca termina de imediato.
+
+    Restrições obrigatórias (rodadas numeradas a partir de 1):
+
+    - `estadios_compartilhados`: pares de equipes que não podem jogar em casa na mesma rodada;
+    - `mandos_bloqueados`: {equipe: rodadas em que ela não pode ser mandante};
+    - `classicos`: pares de equipes cujos confrontos não podem cair na mesma rodada.
+    """
+
+    def __init__(self, campeonato, estadios_compartilhados=(), mandos_bloqueados=None, classicos=(), semente=None):
+        self.campeonato = campeonato
+        self.rng = random.Random(semente)
+        calendario = campeonato.calendario
+        self.n = len(campeonato.equipes)
+        # turno de um round-robin: n - 1 rodadas, ou n com folga
+        self.m = self.n - 1 + self.n % 2
+        self.total_rodadas = 2 * self.m
+        indice = campeonato.registro.indice
+
+        # casa[t][r]: mando da equipe t na rodada r; adversarios[t][r]: adversário no turno (-1 na folga)
+        self.casa = [bytearray([_FOLGA]) * self.total_rodadas for _ in range(self.n)]
+        self.adversarios = [[-1] * self.m for _ in range(self.n)]
+        if calendario is not None:
+            self._carregar_calendario(calendario, indice)
+        else:
+            self._carregar_rodadas(campeonato.rodadas, indice)
+
+        self.estadios = [[] for _ in range(self.n)]  # equipe -> parceiras de estádio
+        for a, b in estadios_compartilhados:
+            i, j = indice(a), indice(b)
+            self.estadios[i].append(j)
+            self.estadios[j].append(i)
+        self.bloqueados = [set() for _ in range(self.n)]
+        for equipe, rodadas in (mandos_bloqueados or {}).items():
+            for numero in rodadas:
+                if not 1 <= numero <= self.total_rodadas:
+                    raise ValueError(f"Rodada {numero} fora do calendário.")
+                self.bloqueados[indice(equipe)].add(numero - 1)
+        self.classicos = [(indice(a), indice(b)) for a, b in classicos]
+        self._com_restricoes = bool(estadios_compartilhados or mandos_bloqueados or classicos)
+        # equipes com restrição de mando: metade das inversões é sorteada entre elas
+        self._restritas = [t for t in range(self.n) if self.estadios[t] or self.bloqueados[t]]
+
+        todas = range(self.total_rodadas)
+        self.quebras, self.violacoes = self._custo(range(self.n), todas, self._limites(todas))
+        # limite inferior de quebras do returno espelhado para n par (de Werra)
+        self.minimo_quebras = 3 * self.n - 6 if self.n % 2 == 0 else 0
+
+    def _carregar_calendario(self, calendario, indice):
+        """Confrontos do calendário sorteado, com os mandos canônicos do método do círculo."""
+        for r in range(self.m):
+            for s in range(calendario.n // 2):
+                a = calendario.equipe_na_posicao(s, r)
+                b = calendario.equipe_na_posicao(calendario.n - 1 - s, r)
+                if a is None or b is None:
+                    continue
+                # mandos canônicos do método do círculo: n - 2 quebras por turno
+                mandante_em_s = r % 2 == 0 if s == 0 else s % 2 == 1
+                i, j = (indice(a), indice(b)) if mandante_em_s else (indice(b), indice(a))
+                self._definir_jogo(r, i, j)
+
+    def _carregar_rodadas(self, rodadas, indice):
+        """Mandos e adversários das rodadas definidas no campeonato, se formam um turno e returno espelhado."""
+        if not rodadas:
+            raise ValueError("O campeonato não tem rodadas: sorteie os jogos antes de otimizar o calendário.")
+        formato = ValueError("As rodadas do campeonato não formam um turno e returno espelhado, "
+                             "único formato que o otimizador reorganiza.")
+        if len(rodadas) != self.total_rodadas:
+            raise formato
+        confrontos = set()
+        for r, (ida, volta) in enumerate(zip(rodadas[:self.m], rodadas[self.m:])):
+            jogos = [(indice(mandante), indice(visitante)) for mandante, visitante in ida]
+            if sorted((j, i) for i, j in jogos) != sorted((indice(m), indice(v)) for m, v in volta):
+                raise formato
+            for i, j in jogos:
+                if i == j or self.adversarios[i][r] >= 0 or self.adversarios[j][r] >= 0:
+                    raise formato
+                self._definir_jogo(r, i, j)
+                confrontos.add((min(i, j), max(i, j)))
+        if len(confrontos) != self.n * (self.n - 1) // 2:
+            raise formato
+
+    def _definir_jogo(self, r: int, i: int, j: int):
+        """i recebe j na rodada r do turno; no returno os mandos se invertem."""
+        self.adversarios[i][r], self.adversarios[j][r] = j, i
+        self.casa[i][r], self.casa[j][r] = _CASA, _FORA
+        self.casa[i][r + self.m], self.casa[j][r + self.m] = _FORA, _CASA
+
+    # AVALIAÇÃO
+
+    def _limites(self, rodadas):
+        """Passagens k -> k + 1 entre rodadas em que uma quebra pode mudar."""
+        ultima = self.total_rodadas - 1
+        return {k for r in rodadas for k in (r - 1, r) if 0 <= k < ultima}
+
+    def _custo(self, equipes, rodadas, limites, inclui_classicos: bool = True) -> Tuple[int, int]:
+        """(quebras, violações) das parcelas que envolvem alguma célula (equipe, rodada) dada."""
+        casa = self.casa
+        quebras = 0
+        violacoes = 0
+        pares = set()
+        for t in equipes:
+            linha = casa[t]
+            for k in limites:
+                if linha[k] == linha[k + 1] != _FOLGA:
+                    quebras += 1
+            bloqueados = self.bloqueados[t]
+            if bloqueados:
+                violacoes += sum(1 for r in rodadas if r in bloqueados and linha[r] == _CASA)
+            for parceira in self.estadios[t]:
+                pares.add((min(t, parceira), max(t, parceira)))
+        for a, b in pares:
+            linha_a, linha_b = casa[a], casa[b]
+            violacoes += sum(1 for r in rodadas if linha_a[r] == _CASA and linha_b[r] == _CASA)
+        if inclui_classicos and self.classicos:
+            violacoes += self._violacoes_classicos()
+        return quebras, violacoes
+
+    def _violacoes_classicos(self) -> int:
+        """Clássicos excedentes por rodada (contados no turno e no returno)."""
+        por_rodada = {}
+        for a, b in self.classicos:
+            r = self.adversarios[a].index(b)
+            por_rodada[r] = por_rodada.get(r, 0) + 1
+        return 2 * sum(quantidade - 1 for quantidade in por_rodada.values())
+
+    # MOVIMENTOS (cada um é sua própria inversa)
+
+    def _inverter_mando(self, r: int, i: int):
+        j = self.adversarios[i][r]
+        if self.casa[i][r] == _CASA:
+            self._definir_jogo(r, j, i)
+        else:
+            self._definir_jogo(r, i, j)
+
+    def _trocar_rodadas(self, r1: int, r2: int):
+        m = self.m
+        for linha in self.casa:
+            linha[r1], linha[r2] = linha[r2], linha[r1]
+            linha[r1 + m], linha[r2 + m] = linha[r2 + m], linha[r1 + m]
+        for linha in self.adversarios:
+            linha[r1], linha[r2] = linha[r2], linha[r1]
+
+    def _trocar_equipes(self, a: int, b: int):
+        casa, adversarios = self.casa, self.adversarios
+        casa[a], casa[b] = casa[b], casa[a]
+        adversarios[a], adversarios[b] = adversarios[b], adversarios[a]
+        for r in range(self.m):
+            x, y = adversarios[a][r], adversarios[b][r]
+            if x == a:  # confronto entre as duas: continua entre as duas
+                adversarios[a][r], adversarios[b][r] = b, a
+                continue
+            if x >= 0:
+                adversarios[x][r] = a
+            if y >= 0:
+                adversarios[y][r] = b
+
+    def _sortear_movimento(self):
+        """Retorna (aplicar, equipes, rodadas, passagens afetadas, muda clássicos)."""
+        n, m, rng = self.n, self.m, self.rng
+        sorteio = rng.random()
+        if sorteio < 0.8:
+            r = rng.randrange(m)
+            i = rng.choice(self._restritas) if self._restritas and sorteio < 0.4 else rng.randrange(n)
+            j = self.adversarios[i][r]
+            if j < 0:
+                return None
+            rodadas = (r, r + m)
+            return (lambda: self._inverter_mando(r, i)), (i, j), rodadas, self._limites(rodadas), False
+        if sorteio < 0.9 or not self._com_restricoes:
+            r1, r2 = rng.sample(range(m), 2)
+            rodadas = (r1, r2, r1 + m, r2 + m)
+            return (lambda: self._trocar_rodadas(r1, r2)), range(n), rodadas, self._limites(rodadas), False
+        a, b = rng.sample(range(n), 2)
+        # as linhas só trocam de dono: as quebras não mudam, apenas as restrições
+        return (lambda: self._trocar_equipes(a, b)), (a, b), range(self.total_rodadas), (), True
+
+    # BUSCA
+
+    def otimizar(self, tempo_limite: float = 1.0, max_iteracoes: int = None,
+                 paciencia: int = 20_000) -> ResultadoOtimizacao:
+        """
+        Melhora o calendário até esgotar `tempo_limite` segundos (ou `max_iteracoes`),
+        passar `paciencia` iterações sem melhora ou atingir o mínimo possível.
+        """
+        if self.n < 3 or self.m < 2:
+            return self._resultado(0)
+        limite = time.perf_counter() + tempo_limite
+        iteracoes = ultima_melhora = 0
+        while self.violacoes or self.quebras > self.minimo_quebras:
+            if max_iteracoes is not None and iteracoes >= max_iteracoes:
+                break
+            if iteracoes - ultima_melhora >= paciencia:
+                break
+            if iteracoes % 256 == 0 and time.perf_counter() >= limite:
+                break
+            iteracoes += 1
+            movimento = self._sortear_movimento()
+            if movimento is None:
+                continue
+            aplicar, equipes, rodadas, limites, classicos = movimento
+            quebras_antes, violacoes_antes = self._custo(equipes, rodadas, limites, classicos)
+            aplicar()
+            quebras_depois, violacoes_depois = self._custo(equipes, rodadas, limites, classicos)
+            delta = (quebras_depois - quebras_antes) + PESO_VIOLACAO * (violacoes_depois - violacoes_antes)
+            if delta > 0:
+                aplicar()  # desfaz
+                continue
+            if delta < 0:
+                ultima_melhora = iteracoes
+            self.quebras += quebras_depois - quebras_antes
+            self.violacoes += violacoes_depois - violacoes_antes
+        return self._resultado(iteracoes)
+
+    def _resultado(self, iteracoes: int) -> ResultadoOtimizacao:
+        equipes = self.campeonato.equipes
+        ida = [[(equipes[t], equipes[self.adversarios[t][r]]) for t in range(self.n)
+                if self.casa[t][r] == _CASA]
+               for r in range(self.m)]
+        rodadas = ida + [[(visitante, mandante) for mandante, visitante in rodada] for rodada in ida]
+        return ResultadoOtimizacao(rodadas, self.quebras, self.violacoes, iteracoes)
@@ -1,23 +1,34 @@
 class Partida:
     """
     Representa uma partida entre duas equipes, incluindo o placar e o processamento do resultado.
+
+    Usa __slots__: arquivos com milhões de partidas as guardam em ArmazemPartidas
+    e só criam objetos Partida ao consultá-las.
     """
 
-    def __init__(self, mandante, visitante, gols_mandante, gols_visitante):
+    __slots__ = ("mandante", "visitante", "gols_mandante", "gols_visitante", "cartoes_mandante", "cartoes_visitante")
+
+    def __init__(self, mandante, visitante, gols_mandante, gols_visitante, cartoes_mandante=(0, 0),
+                 cartoes_visitante=(0, 0)):
         """
-        Inicializa a partida com as equipes e os gols marcados.
+        Inicializa a partida com as equipes, os gols marcados e, opcionalmente,
+        os cartões (vermelhos, amarelos) recebidos por cada lado.
         """
         # Validações básicas: não aceitamos gols negativos nem o mesmo time em ambas as posições
         if gols_mandante < 0 or gols_visitante < 0:
             raise ValueError("Gols marcados não podem ser negativos.")
         if mandante == visitante:
             raise ValueError("Uma partida não pode ter a mesma equipe como mandante e visitante.")
+        if min(cartoes_mandante) < 0 or min(cartoes_visitante) < 0:
+            raise ValueError("Quantidade de cartões não pode ser negativa.")
 
         # Atribui campos — objetos mandante/visitante devem ser instâncias de Equipe
         self.mandante = mandante
         self.visitante = visitante
         self.gols_mandante = gols_mandante
         self.gols_visitante = gols_visitante
+        self.cartoes_mandante = tuple(cartoes_mandante)
+        self.cartoes_visitante = tuple(cartoes_visitante)
 
     def processar_resultado(self):
         """
@@ -28,6 +39,21 @@ class Partida:
         # não altera o resultado final porque cada chamada atualiza o objeto correspondente.
         self.mandante.atualizar_estatisticas(self.gols_mandante, self.gols_visitante)
         self.visitante.atualizar_estatisticas(self.gols_visitante, self.gols_mandante)
+        if any(self.cartoes_mandante):
+            self.mandante.estatisticas.registrar_cartoes(*self.cartoes_mandante)
+        if any(self.cartoes_visitante):
+            self.visitante.estatisticas.registrar_cartoes(*self.cartoes_visitante)
+
+    def desfazer_resultado(self):
+        """
+        Desfaz nas estatísticas das equipes um resultado antes aplicado por processar_resultado.
+        """
+        self.mandante.reverter_estatisticas(self.gols_mandante, self.gols_visitante)
+        self.visitante.reverter_estatisticas(self.gols_visitante, self.gols_mandante)
+        if any(self.cartoes_mandante):
+            self.mandante.estatisticas.remover_cartoes(*self.cartoes_mandante)
+        if any(self.cartoes_visitante):
+            self.visitante.estatisticas.remover_cartoes(*self.cartoes_visitante)
 
     def __str__(self):
         """
@@ -0,0 +1,136 @@
+import math
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+TAXA_EMPATE_PADRAO = 0.28
+
+
+class MotorRating:
+    """
+    Rating no estilo Elo das equipes de um Campeonato, atualizado a cada partida.
+
+    Ligado ao campeonato como ouvinte de processar_partida/processar_partidas, faz
+    uma atualização O(1) por jogo: a expectativa do mandante inclui a vantagem de
+    mando e o ajuste é multiplicado por um peso que cresce com a diferença de gols.
+
+    Para vitória/empate/derrota, o empate recebe `taxa_empate` × 4E(1 - E) da
+    probabilidade (máximo em jogos equilibrados) e o restante da expectativa E do
+    mandante vira vitória. Sem `taxa_empate`, ela é estimada das partidas já
+    processadas (TAXA_EMPATE_PADRAO se ainda não há nenhuma); uma taxa informada
+    é mantida. Correções e desfeitas de partidas não são revertidas no rating;
+    use reajustar() para recalcular sobre o histórico atual.
+    """
+
+    def __init__(self, campeonato, k: float = 20.0, vantagem_mando: float = 65.0,
+                 rating_inicial: float = 1500.0, taxa_empate: Optional[float] = None):
+        if taxa_empate is not None and not 0 <= taxa_empate <= 0.5:
+            raise ValueError("A taxa de empate deve estar entre 0 e 0,5.")
+        self.campeonato = campeonato
+        self.k = k
+        self.vantagem_mando = vantagem_mando
+        self.rating_inicial = rating_inicial
+        self.taxa_empate = TAXA_EMPATE_PADRAO if taxa_empate is None else taxa_empate
+        self.ratings = array("d", [rating_inicial] * len(campeonato.equipes))
+        self.jogos = 0
+        if any(campeonato.partidas.registros()):
+            self.reajustar(estimar_empate=taxa_empate is None)
+        campeonato.ouvintes_partidas.append(self._ao_processar)
+
+    def desligar(self):
+        """Para de acompanhar as partidas do campeonato."""
+        self.campeonato.ouvintes_partidas.remove(self._ao_processar)
+
+    # ATUALIZAÇÃO
+
+    @staticmethod
+    def peso_margem(diferenca_gols: int) -> float:
+        """Multiplicador do ajuste pela diferença de gols (1; 1,5; (11 + d) / 8 a partir de 3)."""
+        d = abs(diferenca_gols)
+        if d <= 1:
+            return 1.0
+        if d == 2:
+            return 1.5
+        return (11 + d) / 8
+
+    def expectativa(self, i: int, j: int) -> float:
+        """Pontuação esperada (vitória = 1, empate = 0,5) do mandante i contra j."""
+        return 1 / (1 + 10 ** ((self.ratings[j] - self.ratings[i] - self.vantagem_mando) / 400))
+
+    def _ao_processar(self, _id_partida, i: int, j: int, gols_mandante: int, gols_visitante: int):
+        resultado = 1.0 if gols_mandante > gols_visitante else 0.0 if gols_mandante < gols_visitante else 0.5
+        ajuste = self.k * self.peso_margem(gols_mandante - gols_visitante) * (resultado - self.expectativa(i, j))
+        self.ratings[i] += ajuste
+        self.ratings[j] -= ajuste
+        self.jogos += 1
+
+    def reajustar(self, jogos=None, estimar_empate: bool = True):
+        """
+        Recalcula os ratings do zero sobre `jogos` (índices mandante, visitante, gols),
+        por padrão o histórico de partidas processadas do campeonato, em ordem.
+
+        O laço usa só variáveis locais e tabelas pré-calculadas de margem, para que
+        décadas de resultados (centenas de milhares de jogos) levem poucos segundos.
+        Com `estimar_empate`, a taxa de empate é ajustada à frequência observada.
+        """
+        if jogos is None:
+            jogos = list(self.campeonato.partidas.registros())
+        ratings = [self.rating_inicial] * len(self.campeonato.equipes)
+        k, mando = self.k, self.vantagem_mando
+        pesos = [self.peso_margem(d) for d in range(31)]
+        empates = 0
+        forma_empate = 0.0  # soma de 4E(1 - E), para estimar a taxa de empate
+        for i, j, gols_m, gols_v in jogos:
+            esperado = 1 / (1 + 10 ** ((ratings[j] - ratings[i] - mando) / 400))
+            forma_empate += 4 * esperado * (1 - esperado)
+            diferenca = gols_m - gols_v
+            if diferenca > 0:
+                resultado = 1.0
+            elif diferenca < 0:
+                resultado = 0.0
+                diferenca = -diferenca
+            else:
+                resultado = 0.5
+                empates += 1
+            ajuste = k * (pesos[diferenca] if diferenca < 31 else self.peso_margem(diferenca)) * (resultado - esperado)
+            ratings[i] += ajuste
+            ratings[j] -= ajuste
+        self.ratings = array("d", ratings)
+        self.jogos = len(jogos)
+        if estimar_empate and forma_empate > 0:
+            self.taxa_empate = min(empates / forma_empate, 0.5)
+
+    # CONSULTAS
+
+    def rating(self, equipe) -> float:
+        return self.ratings[self.campeonato._indice(equipe)]
+
+    def tabela(self) -> List[Tuple[str, float]]:
+        """(nome, rating) do maior para o menor."""
+        return sorted(((e.nome, r) for e, r in zip(self.campeonato.equipes, self.ratings)),
+                      key=lambda item: item[1], reverse=True)
+
+    def probabilidades(self, mandante, visitante) -> Tuple[float, float, float]:
+        """(vitória do mandante, empate, vitória do visitante)."""
+        esperado = self.expectativa(self.campeonato._indice(mandante), self.campeonato._indice(visitante))
+        empate = self.taxa_empate * 4 * esperado * (1 - esperado)
+        return esperado - empate / 2, empate, 1 - esperado - empate / 2
+
+    def probabilidades_rodada(self, numero: int) -> List[Tuple]:
+        """(mandante, visitante, p_vitoria, p_empate, p_derrota) de cada jogo da rodada `numero` (1 = primeira)."""
+        return [(mandante, visitante, *self.probabilidades(mandante, visitante))
+                for mandante, visitante in self.campeonato.rodadas[numero - 1]]
+
+    def probabilidades_restantes(self) -> Dict[Tuple[str, str], Tuple[float, float, float]]:
+        """Probabilidades de todos os jogos ainda não disputados, por (nome do mandante, nome do visitante)."""
+        return {(mandante.nome, visitante.nome): self.probabilidades(mandante, visitante)
+                for mandante, visitante in self.campeonato.jogos_restantes()}
+
+    def log_perda(self, jogos) -> float:
+        """Perda logarítmica média das probabilidades atuais sobre `jogos` (avaliação do modelo)."""
+        equipes = self.campeonato.equipes
+        total = 0.0
+        for i, j, gols_m, gols_v in jogos:
+            vitoria, empate, derrota = self.probabilidades(equipes[i], equipes[j])
+            p = vitoria if gols_m > gols_v else derrota if gols_m < gols_v else empate
+            total -= math.log(max(p, 1e-12))
+        return total / len(jogos) if jogos else 0.0
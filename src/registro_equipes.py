@@ -0,0 +1,78 @@
+from typing import Dict
+
+
+class RegistroEquipes:
+    """
+    Identidade das equipes de um campeonato: cada Equipe recebe em `equipe.id`
+    um inteiro estável (sua posição na lista, a mesma linha das colunas de
+    estatísticas), e as estruturas internas usam esse id em vez do nome.
+
+    Funciona como uma sequência de equipes indexada pelo id; a busca por nome
+    usa um único dicionário, montado na criação.
+
+    Uma equipe pertence a um só registro: `equipe.id` é um campo único (assim como
+    a linha de estatísticas, que passa para as colunas do campeonato), e registrá-la
+    de novo gera ValueError. Outro campeonato precisa de objetos Equipe novos.
+    """
+
+    __slots__ = ("equipes", "_por_nome", "_por_chave")
+
+    def __init__(self, equipes):
+        self.equipes = list(equipes)
+        self._por_nome: Dict[str, int] = {}
+        for id_equipe, equipe in enumerate(self.equipes):
+            if equipe.id is not None:
+                raise ValueError(f"A equipe {equipe.nome} já pertence a outro campeonato.")
+            if equipe.nome in self._por_nome:
+                raise ValueError(f"Equipe repetida no campeonato: {equipe.nome}")
+            self._por_nome[equipe.nome] = id_equipe
+        # só depois de validar todas, para um erro não deixar equipes presas a este registro
+        for equipe in self.equipes:
+            equipe.id = self._por_nome[equipe.nome]
+        self._por_chave = None  # objeto Equipe ou nome -> id, montado no primeiro lote (ids)
+
+    def __len__(self):
+        return len(self.equipes)
+
+    def __iter__(self):
+        return iter(self.equipes)
+
+    def __getitem__(self, id_equipe: int):
+        return self.equipes[id_equipe]
+
+    def __contains__(self, equipe):
+        return self.procurar(equipe) is not None
+
+    def indice(self, equipe) -> int:
+        """Id da equipe; ValueError se ela não pertence a este registro."""
+        id_equipe = equipe.id
+        if id_equipe is None or id_equipe >= len(self.equipes) or self.equipes[id_equipe] is not equipe:
+            raise ValueError(f"A equipe {equipe.nome} não participa do campeonato.")
+        return id_equipe
+
+    def id_do_nome(self, nome: str):
+        """Id da equipe chamada `nome`, ou None."""
+        return self._por_nome.get(nome)
+
+    def por_nome(self, nome: str):
+        """Equipe chamada `nome`; ValueError se não houver."""
+        id_equipe = self._por_nome.get(nome)
+        if id_equipe is None:
+            raise ValueError(f"A equipe {nome} não participa do campeonato.")
+        return self.equipes[id_equipe]
+
+    def ids(self, chaves):
+        """Lista com o id de cada Equipe ou nome de `chaves` (None para os de fora do registro)."""
+        if self._por_chave is None:
+            self._por_chave = {equipe: equipe.id for equipe in self.equipes}
+            self._por_chave.update(self._por_nome)
+        return list(map(self._por_chave.get, chaves))
+
+    def procurar(self, chave):
+        """Id de uma Equipe ou de um nome, ou None se não pertencer ao registro."""
+        if isinstance(chave, str):
+            return self._por_nome.get(chave)
+        id_equipe = getattr(chave, "id", None)
+        if id_equipe is None or id_equipe >= len(self.equipes) or self.equipes[id_equipe] is not chave:
+            return None
+        return id_equipe
@@ -0,0 +1,254 @@
+import bisect
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, NamedTuple, Tuple
+
+from src.campeonato import Campeonato, ZONAS
+from src.confrontos import ConfrontosDiretos
+from src.equipe import CAMPOS_ESTATISTICAS, Equipe
+from src.partida import Partida
+
+# Espaçamento entre sementes de temporadas: a temporada t usa semente * PASSO + t,
+# de modo que o resultado não depende de como as temporadas são divididas.
+_PASSO_SEMENTE = 1_000_003
+
+
+class ModeloPoisson:
+    """
+    Modelo de placar simples: gols de mandante e visitante seguem distribuições
+    de Poisson independentes com médias fixas.
+    """
+
+    def __init__(self, media_mandante: float = 1.5, media_visitante: float = 1.1):
+        if media_mandante <= 0 or media_visitante <= 0:
+            raise ValueError("As médias de gols devem ser positivas.")
+        self.media_mandante = media_mandante
+        self.media_visitante = media_visitante
+        self._acumulada_mandante = _acumulada_poisson(media_mandante)
+        self._acumulada_visitante = _acumulada_poisson(media_visitante)
+
+    def sortear_placar(self, mandante: str, visitante: str, rng: random.Random) -> Tuple[int, int]:
+        """Sorteia (gols_mandante, gols_visitante) para o confronto."""
+        return (bisect.bisect_right(self._acumulada_mandante, rng.random()),
+                bisect.bisect_right(self._acumulada_visitante, rng.random()))
+
+    def sortear_placares(self, confrontos, rng: random.Random) -> List[Tuple[int, int]]:
+        """
+        sortear_placar para cada (mandante, visitante) de `confrontos`, com os mesmos números de
+        `rng` na mesma ordem; as buscas rodam em map, sem laço por jogo.
+        """
+        sorteio = rng.random
+        numeros = [sorteio() for _ in range(2 * len(confrontos))]
+        jogos = len(confrontos)
+        return list(zip(map(bisect.bisect_right, repeat(self._acumulada_mandante, jogos), numeros[0::2]),
+                        map(bisect.bisect_right, repeat(self._acumulada_visitante, jogos), numeros[1::2])))
+
+
+def _acumulada_poisson(media: float, limite: int = 30) -> List[float]:
+    """Função de distribuição acumulada truncada, para amostragem por inversão."""
+    termo = math.exp(-media)
+    acumulada = []
+    total = 0.0
+    for gols in range(limite):
+        total += termo
+        acumulada.append(total)
+        termo *= media / (gols + 1)
+    return acumulada
+
+
+class _EstadoInicial(NamedTuple):
+    """Retrato serializável do campeonato enviado a cada processo."""
+    nomes: Tuple[str, ...]
+    estatisticas: Tuple[Tuple[int, ...], ...]
+    confrontos: ConfrontosDiretos
+    jogos: Tuple[Tuple[int, int], ...]
+
+
+class ResultadoSimulacao:
+    """
+    Agrega as posições finais de todas as temporadas simuladas.
+    """
+
+    def __init__(self, nomes, contagem_posicoes: List[List[int]], n_temporadas: int):
+        self.nomes = list(nomes)
+        self.contagem_posicoes = contagem_posicoes  # [equipe][posição] -> ocorrências
+        self.n_temporadas = n_temporadas
+
+    def distribuicao_posicoes(self) -> Dict[str, List[float]]:
+        """Probabilidade de cada equipe terminar em cada posição (1ª posição no índice 0)."""
+        return {
+            nome: [c / self.n_temporadas for c in contagem]
+            for nome, contagem in zip(self.nomes, self.contagem_posicoes)
+        }
+
+    def probabilidades_zonas(self) -> Dict[str, Dict[str, float]]:
+        """Probabilidade de título e de cada zona de determinar_classificacoes."""
+        posicoes = range(len(self.nomes))
+        faixas = {"titulo": posicoes[:1]}
+        faixas.update({zona: posicoes[faixa] for zona, faixa in ZONAS.items()})
+        return {
+            nome: {zona: sum(contagem[p] for p in faixa) / self.n_temporadas for zona, faixa in faixas.items()}
+            for nome, contagem in zip(self.nomes, self.contagem_posicoes)
+        }
+
+
+class SimuladorTemporadas:
+    """
+    Simulação de Monte Carlo do restante da temporada, dividida entre processos.
+    """
+
+    def __init__(self, campeonato: Campeonato, modelo=None):
+        self.modelo = modelo if modelo is not None else ModeloPoisson()
+        self.estado = self._capturar_estado(campeonato)
+
+    @staticmethod
+    def _capturar_estado(campeonato: Campeonato) -> _EstadoInicial:
+        indice = campeonato.registro.indice
+        return _EstadoInicial(
+            nomes=tuple(e.nome for e in campeonato.equipes),
+            estatisticas=tuple(tuple(getattr(e, campo) for campo in CAMPOS_ESTATISTICAS) for e in campeonato.equipes),
+            confrontos=campeonato.confrontos.copiar(),
+            jogos=tuple((indice(m), indice(v)) for m, v in campeonato.jogos_restantes()),
+        )
+
+    def executar(self, n_temporadas: int, workers=None, semente: int = 0, motor: str = "objetos") -> ResultadoSimulacao:
+        """
+        Executa `n_temporadas` simulações. Com workers=1 roda no próprio processo;
+        com workers=None usa todos os núcleos disponíveis.
+
+        motor="objetos" processa cada jogo com Partida/Equipe; motor="lote" sorteia os
+        placares da temporada de uma vez e acumula as estatísticas em listas de inteiros
+        (vazão medida em _simular_bloco_em_lote). Para a mesma semente os dois motores
+        produzem exatamente as mesmas classificações.
+        """
+        if n_temporadas <= 0:
+            raise ValueError("O número de temporadas deve ser positivo.")
+        if motor not in _MOTORES:
+            raise ValueError(f"Motor de simulação desconhecido: {motor}")
+        simular_bloco = _MOTORES[motor]
+        workers = workers or os.cpu_count() or 1
+        blocos = self._dividir(n_temporadas, workers)
+        if workers == 1:
+            parciais = [simular_bloco(self.estado, self.modelo, inicio, qtd, semente) for inicio, qtd in blocos]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futuros = [
+                    executor.submit(simular_bloco, self.estado, self.modelo, inicio, qtd, semente)
+                    for inicio, qtd in blocos
+                ]
+                parciais = [f.result() for f in futuros]
+        return ResultadoSimulacao(self.estado.nomes, _somar_contagens(parciais), n_temporadas)
+
+    @staticmethod
+    def _dividir(n_temporadas: int, workers: int):
+        """Divide as temporadas em blocos contíguos (alguns por worker, para balancear carga)."""
+        n_blocos = min(n_temporadas, workers * 4)
+        base, resto = divmod(n_temporadas, n_blocos)
+        blocos = []
+        inicio = 0
+        for b in range(n_blocos):
+            qtd = base + (1 if b < resto else 0)
+            blocos.append((inicio, qtd))
+            inicio += qtd
+        return blocos
+
+
+def _reconstruir(estado: _EstadoInicial) -> Campeonato:
+    """Cria um campeonato novo com as estatísticas e confrontos do estado inicial."""
+    equipes = []
+    for nome, linha in zip(estado.nomes, estado.estatisticas):
+        equipe = Equipe(nome)
+        for campo, valor in zip(CAMPOS_ESTATISTICAS, linha):
+            setattr(equipe, campo, valor)
+        equipes.append(equipe)
+    campeonato = Campeonato(equipes)
+    campeonato.confrontos = estado.confrontos.copiar()
+    return campeonato
+
+
+def _simular_temporada(estado: _EstadoInicial, modelo, temporada: int, semente: int) -> List[int]:
+    """Simula uma temporada com objetos Partida/Equipe e retorna os índices na ordem final."""
+    rng = random.Random(semente * _PASSO_SEMENTE + temporada)
+    campeonato = _reconstruir(estado)
+    for i, j in estado.jogos:
+        gols_m, gols_v = modelo.sortear_placar(estado.nomes[i], estado.nomes[j], rng)
+        campeonato.processar_partida(Partida(campeonato.equipes[i], campeonato.equipes[j], gols_m, gols_v))
+    return [equipe.id for equipe in campeonato.calcular_classificacao()]
+
+
+def _simular_bloco(estado: _EstadoInicial, modelo, inicio: int, quantidade: int, semente: int):
+    """Simula as temporadas [inicio, inicio + quantidade) e conta as posições finais."""
+    n = len(estado.nomes)
+    contagem = [[0] * n for _ in range(n)]
+    for temporada in range(inicio, inicio + quantidade):
+        for posicao, i in enumerate(_simular_temporada(estado, modelo, temporada, semente)):
+            contagem[i][posicao] += 1
+    return contagem
+
+
+def _simular_bloco_em_lote(estado: _EstadoInicial, modelo, inicio: int, quantidade: int, semente: int):
+    """
+    Versão em lote de _simular_bloco: sem criar Partida nem Equipe, cada temporada sorteia
+    todos os placares de uma vez (modelo.sortear_placares, quando existe) e acumula pontos,
+    vitórias e gols em quatro listas de N inteiros.
+
+    Cada temporada mantém seu próprio gerador e consome números na mesma ordem que
+    _simular_temporada. Temporadas que terminam com empate nos critérios básicos são
+    refeitas pelo caminho de objetos, que aplica confronto direto, cartões e sorteio.
+
+    Vazão medida (CPython 3.11, um núcleo, 20 equipes, ModeloPoisson): cerca de 2,5 mil
+    temporadas/s com as 38 rodadas por jogar e 8 mil com 10 rodadas, contra 220 e 860 do
+    caminho de objetos. A meta de 100 mil temporadas em poucos segundos não é atingida: as
+    100 mil temporadas completas levam uns 40 s num núcleo (os workers dividem isso no máximo
+    pelo número de núcleos), já que o sorteio por temporada (um gerador cada, para não
+    depender da divisão em blocos) e a soma jogo a jogo continuam em Python, sem NumPy.
+    """
+    n = len(estado.nomes)
+    sortear = getattr(modelo, "sortear_placares", None)
+    if sortear is None:
+        def sortear(confrontos, rng):
+            return [modelo.sortear_placar(mandante, visitante, rng) for mandante, visitante in confrontos]
+    confrontos = [(estado.nomes[i], estado.nomes[j]) for i, j in estado.jogos]
+    iniciais = [[linha[campo] for linha in estado.estatisticas] for campo in (0, 1, 4, 5)]
+    contagem = [[0] * n for _ in range(n)]
+    equipes = range(n)
+
+    for temporada in range(inicio, inicio + quantidade):
+        rng = random.Random(semente * _PASSO_SEMENTE + temporada)
+        pontos, vitorias, gols_pro, gols_contra = (coluna[:] for coluna in iniciais)
+        for (m, v), (gols_m, gols_v) in zip(estado.jogos, sortear(confrontos, rng)):
+            gols_pro[m] += gols_m
+            gols_contra[m] += gols_v
+            gols_pro[v] += gols_v
+            gols_contra[v] += gols_m
+            if gols_m > gols_v:
+                pontos[m] += 3
+                vitorias[m] += 1
+            elif gols_m < gols_v:
+                pontos[v] += 3
+                vitorias[v] += 1
+            else:
+                pontos[m] += 1
+                pontos[v] += 1
+        chaves = list(zip(pontos, vitorias, map(int.__sub__, gols_pro, gols_contra), gols_pro))
+        ordem = sorted(equipes, key=chaves.__getitem__, reverse=True)
+        if any(chaves[a] == chaves[b] for a, b in zip(ordem, ordem[1:])):
+            ordem = _simular_temporada(estado, modelo, temporada, semente)
+        for posicao, e in enumerate(ordem):
+            contagem[e][posicao] += 1
+    return contagem
+
+
+_MOTORES = {"objetos": _simular_bloco, "lote": _simular_bloco_em_lote}
+
+
+def _somar_contagens(parciais):
+    total = [linha[:] for linha in parciais[0]]
+    for parcial in parciais[1:]:
+        for linha_total, linha in zip(total, parcial):
+            for p, c in enumerate(linha):
+                linha_total[p] += c
+    return total
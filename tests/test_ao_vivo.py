@@ -0,0 +1,206 @@
+import asyncio
+import json
+
+import pytest
+
+from src.ao_vivo import EventoPlacar, ServicoAoVivo, eventos_de_arquivo, gerar_carga, medir_latencia
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+
+
+def novo_campeonato():
+    camp = Campeonato([Equipe(nome) for nome in ("A", "B", "C", "D")], semente=1)
+    camp.sortear_jogos()
+    return camp
+
+
+async def fonte(eventos):
+    for evento in eventos:
+        yield evento
+
+
+def coletar(servico, fonte_eventos, tamanho_fila=16):
+    async def principal():
+        fila = servico.assinar(tamanho_fila)
+        await servico.executar(fonte_eventos)
+        itens = []
+        while not fila.empty():
+            itens.append(fila.get_nowait())
+        return itens
+
+    return asyncio.run(principal())
+
+
+def test_eventos_do_mesmo_jogo_sao_agrupados_e_corrigidos():
+    camp = novo_campeonato()
+    servico = ServicoAoVivo(camp, janela=0.01)
+    eventos = [EventoPlacar("A", "B", 1, 0), EventoPlacar("A", "B", 1, 1), EventoPlacar("C", "D", 0, 1),
+               EventoPlacar("A", "B", 2, 1, encerrada=True)]
+    itens = coletar(servico, fonte(eventos))
+    assert itens[-1] is None
+    ultima = itens[-2]
+    assert ultima.classificacao[:2] == (("A", 3), ("D", 3))
+    assert len(ultima.instantes) == 4 and servico.agrupados == 2
+    assert camp.equipes[0].gols_marcados == 2 and camp.equipes[1].pontos == 0
+    assert len(camp.partidas_processadas) == 2
+    assert ultima.zonas == camp.determinar_classificacoes()
+
+
+def test_placar_provisorio_e_corrigido_entre_publicacoes():
+    camp = novo_campeonato()
+    servico = ServicoAoVivo(camp, janela=0)
+
+    async def espacados():
+        for evento in (EventoPlacar("A", "B", 1, 0), EventoPlacar("A", "B", 1, 2, encerrada=True),
+                       EventoPlacar("A", "B", 5, 0), EventoPlacar("X", "B", 1, 0)):
+            yield evento
+            await asyncio.sleep(0.005)
+
+    itens = coletar(servico, espacados())
+    assert [dict(item.classificacao)["A"] for item in itens[:2]] == [3, 0]
+    assert servico.aplicados == 2 and servico.rejeitados == 2
+    assert camp.equipes[1].pontos == 3
+
+
+async def espacados(total=5):
+    for gols in range(total):
+        yield EventoPlacar("A", "B", gols, 0)
+        await asyncio.sleep(0.002)
+
+
+def test_retrato_da_rodada_so_com_os_placares_finais():
+    camp = novo_campeonato()
+    (m1, v1), (m2, v2) = camp.rodadas[0]
+    servico = ServicoAoVivo(camp, janela=0)
+    retratos = []
+
+    async def espacados_com_retrato():
+        for evento in (EventoPlacar(m1.nome, v1.nome, 1, 0), EventoPlacar(m2.nome, v2.nome, 0, 0),
+                       EventoPlacar(m1.nome, v1.nome, 1, 2, encerrada=True),
+                       EventoPlacar(m2.nome, v2.nome, 0, 1, encerrada=True)):
+            yield evento
+            await asyncio.sleep(0.005)
+            retratos.append(1 in camp.historico.retratos)
+
+    coletar(servico, espacados_com_retrato())
+    # a rodada se completa no segundo evento, mas com placares provisórios
+    assert retratos == [False, False, False, True]
+    tabela = {linha.nome: linha.pontos for linha in camp.tabela_apos_rodada(1)}
+    assert tabela[v1.nome] == 3 and tabela[m1.nome] == 0 and tabela[v2.nome] == 3
+    assert len(camp.trajetoria(v1)) == 1
+
+
+def test_assinante_lento_segura_o_servico_sem_perder_atualizacoes():
+    camp = novo_campeonato()
+    servico = ServicoAoVivo(camp, janela=0)
+
+    async def principal():
+        fila = servico.assinar(tamanho_fila=1)
+        recebidas = []
+
+        async def assinante():
+            while (atualizacao := await fila.get()) is not None:
+                recebidas.append(atualizacao)
+                await asyncio.sleep(0.01)
+
+        tarefa = asyncio.create_task(assinante())
+        await servico.executar(espacados())
+        await tarefa
+        return recebidas
+
+    recebidas = asyncio.run(principal())
+    assert [item.sequencia for item in recebidas] == list(range(1, len(recebidas) + 1))
+    assert sum(len(item.instantes) for item in recebidas) == 5
+    assert servico.esperas >= 1 and servico.descartadas == 0
+    assert camp.equipes[0].gols_marcados == 4
+
+
+def test_assinante_parado_gera_timeout():
+    servico = ServicoAoVivo(novo_campeonato(), janela=0, espera_assinante=0.02)
+    with pytest.raises(asyncio.TimeoutError, match="fila cheia"):
+        coletar(servico, espacados(), tamanho_fila=1)
+    assert servico.descartadas == 0
+
+
+def test_descarte_das_atualizacoes_antigas_so_quando_pedido():
+    servico = ServicoAoVivo(novo_campeonato(), janela=0, espera_assinante=0.02)
+
+    async def principal():
+        fila = servico.assinar(tamanho_fila=1, descartar_antigas=True)
+        await servico.executar(espacados())
+        return [fila.get_nowait()]
+
+    assert asyncio.run(principal()) == [None]
+    assert servico.descartadas >= 4 and servico.esperas == 0
+
+
+def test_arquivo_e_gerador_de_carga(tmp_path):
+    camp = novo_campeonato()
+    caminho = tmp_path / "eventos.jsonl"
+    caminho.write_text("\n".join(json.dumps({"mandante": m.nome, "visitante": v.nome, "gols_mandante": 1,
+                                             "gols_visitante": 0}) for m, v in camp.rodadas[0]) + "\n",
+                       encoding="utf-8")
+    coletar(ServicoAoVivo(camp), eventos_de_arquivo(str(caminho)))
+    assert len(camp.partidas_processadas) == 2
+
+    camp = Campeonato([Equipe(f"T{i}") for i in range(20)], semente=2)
+    camp.sortear_jogos()
+    servico = ServicoAoVivo(camp, janela=0.001)
+    metricas = asyncio.run(medir_latencia(servico, gerar_carga(camp, eventos_por_segundo=5000, total=200)))
+    assert metricas["eventos"] == 200
+    assert 0 <= metricas["p50_ms"] <= metricas["p95_ms"] <= metricas["p99_ms"] <= metricas["max_ms"]
+
+
+def test_linhas_malformadas_sao_rejeitadas_sem_parar_o_servico(tmp_path):
+    camp = novo_campeonato()
+    (m1, v1), (m2, v2) = camp.rodadas[0]
+    m3, v3 = camp.rodadas[1][0]
+    caminho = tmp_path / "eventos.jsonl"
+    caminho.write_text("\n".join([
+        json.dumps({"mandante": m1.nome, "visitante": v1.nome, "gols_mandante": 1, "gols_visitante": 0}),
+        "{não é json",
+        json.dumps({"mandante": m2.nome, "visitante": v2.nome}),
+        json.dumps([m2.nome, v2.nome, 1, 0]),
+        json.dumps({"mandante": ["A"], "visitante": v2.nome, "gols_mandante": 1, "gols_visitante": 0}),
+        json.dumps({"mandante": m3.nome, "visitante": v3.nome, "gols_mandante": 70_000, "gols_visitante": 0}),
+        json.dumps({"mandante": m2.nome, "visitante": v2.nome, "gols_mandante": 0, "gols_visitante": 2}),
+    ]) + "\n", encoding="utf-8")
+    servico = ServicoAoVivo(camp)
+    itens = coletar(servico, eventos_de_arquivo(str(caminho)))
+    assert itens[-1] is None
+    assert servico.rejeitados == 5 and len(camp.partidas_processadas) == 2
+
+
+def test_gols_que_nao_sao_inteiros_sao_rejeitados(tmp_path):
+    camp = novo_campeonato()
+    (m1, v1), (m2, v2) = camp.rodadas[0]
+    caminho = tmp_path / "eventos.jsonl"
+    caminho.write_text("\n".join(json.dumps({"mandante": m1.nome, "visitante": v1.nome, "gols_mandante": gols,
+                                             "gols_visitante": 0}) for gols in (1.7, "2", True, 2.0)) + "\n"
+                       + json.dumps({"mandante": m2.nome, "visitante": v2.nome, "gols_mandante": 0,
+                                     "gols_visitante": False}) + "\n", encoding="utf-8")
+    servico = ServicoAoVivo(camp)
+    assert coletar(servico, eventos_de_arquivo(str(caminho))) == [None]
+    assert servico.rejeitados == 5 and servico.aplicados == 0
+    assert not camp.partidas_processadas
+
+
+def test_assinantes_recebem_fim_quando_a_fonte_falha():
+    camp = novo_campeonato()
+    servico = ServicoAoVivo(camp, janela=0)
+
+    async def quebrada():
+        yield EventoPlacar("A", "B", 1, 0)
+        await asyncio.sleep(0.002)
+        raise ConnectionError("feed caiu")
+
+    async def principal():
+        fila = servico.assinar()
+        try:
+            await servico.executar(quebrada())
+        except ConnectionError:
+            pass
+        return [fila.get_nowait() for _ in range(fila.qsize())]
+
+    itens = asyncio.run(principal())
+    assert itens[-1] is None and len(itens) == 2
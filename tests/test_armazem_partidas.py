@@ -0,0 +1,137 @@
+import pytest
+
+from src import checkpoint
+from src.armazem_partidas import ArmazemPartidas
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def campeonato_sorteado(n=4):
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n)], semente=5)
+    camp.sortear_jogos()
+    return camp
+
+
+def test_partida_compacta_com_cartoes():
+    a, b = Equipe("A"), Equipe("B")
+    partida = Partida(a, b, 1, 0, cartoes_visitante=(1, 3))
+    assert not hasattr(partida, "__dict__")
+    partida.processar_resultado()
+    assert (b.cartoes_vermelhos, b.cartoes_amarelos) == (1, 3)
+    assert (a.cartoes_vermelhos, a.cartoes_amarelos) == (0, 0)
+    with pytest.raises(ValueError):
+        Partida(a, b, 1, 0, cartoes_mandante=(-1, 0))
+
+
+def test_armazem_guarda_colunas_e_recria_partidas():
+    camp = campeonato_sorteado()
+    assert camp.partidas.bytes_por_partida() == 20
+    (a, b), (c, d) = camp.rodadas[0]
+    primeiro = camp.processar_partida(Partida(a, b, 2, 1, cartoes_mandante=(0, 2)))
+    camp.processar_partidas([(c, d, 0, 0), (b, a, 1, 1)])
+    assert len(camp.partidas) == 3
+    assert str(camp.partidas[primeiro]) == f"{a.nome} 2 x 1 {b.nome}"
+    assert camp.partidas.cartoes(primeiro) == ((0, 2), (0, 0))
+    assert [str(p) for p in camp.partidas[1:]] == [f"{c.nome} 0 x 0 {d.nome}", f"{b.nome} 1 x 1 {a.nome}"]
+
+    camp.desfazer_partida(primeiro)
+    assert a.cartoes_amarelos == 0
+    assert len(camp.partidas_processadas) == 2
+    with pytest.raises(ValueError):
+        camp.partidas[primeiro]
+
+
+def test_visoes_por_rodada_e_equipe_sem_copia():
+    camp = campeonato_sorteado()
+    for mandante, visitante in camp.rodadas[0] + camp.rodadas[1]:
+        camp.processar_partida(Partida(mandante, visitante, 1, 0))
+    rodada = camp.partidas_da_rodada(2)
+    assert [(p.mandante, p.visitante) for p in rodada] == camp.rodadas[1]
+    equipe = camp.equipes[0]
+    visao = camp.partidas_da_equipe(equipe)
+    assert len(visao) == 2
+    assert all(equipe in (p.mandante, p.visitante) for p in visao)
+
+    # a visão compartilha o índice: partidas novas não entram nela, desfeitas saem
+    mandante, visitante = camp.rodadas[2][0]
+    camp.processar_partida(Partida(mandante, visitante, 0, 0))
+    camp.desfazer_partida(0)
+    assert len(rodada) == 2
+    assert len(camp.partidas_da_rodada(1)) == 1
+    assert len(camp.partidas_da_rodada(3)) == 1
+    assert list(camp.partidas_da_rodada(9)) == []
+
+
+def test_checkpoint_preserva_cartoes_e_rodadas():
+    camp = campeonato_sorteado()
+    (a, b), (c, d) = camp.rodadas[0]
+    camp.processar_partida(Partida(a, b, 0, 1, cartoes_visitante=(2, 1)))
+    camp.processar_partida(Partida(c, d, 3, 3))
+    restaurado = checkpoint.de_bytes(checkpoint.para_bytes(camp))
+    assert restaurado.partidas.cartoes(0) == ((0, 0), (2, 1))
+    assert [str(p) for p in restaurado.partidas_da_rodada(1)] == [str(p) for p in camp.partidas_da_rodada(1)]
+
+
+def test_milhoes_de_partidas_em_colunas():
+    armazem = ArmazemPartidas([Equipe(f"T{i}") for i in range(20)])
+    jogos = [(k % 20, (k + 1) % 20, k % 4, k % 3) for k in range(200_000)]
+    armazem.estender(*zip(*jogos), [k % 38 for k in range(len(jogos))])
+    assert sum(len(coluna) * coluna.itemsize for coluna in armazem.colunas) == 20 * len(jogos)
+    assert len(armazem.da_equipe(0)) == 20_000
+    assert len(armazem.da_rodada(37)) == len(range(37, len(jogos), 38))
+
+
+def test_valores_fora_das_colunas_nao_alteram_o_campeonato():
+    camp = campeonato_sorteado()
+    (a, b), _ = camp.rodadas[0]
+    antes = (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao)
+    with pytest.raises(ValueError):
+        camp.processar_partida(Partida(a, b, 70_000, 0))
+    with pytest.raises(ValueError):
+        camp.processar_partida(Partida(a, b, 1, 0, cartoes_mandante=(0, 300)))
+    with pytest.raises(ValueError):
+        camp.processar_partida(Partida(a, b, -1, 0))
+    with pytest.raises(ValueError):
+        camp.processar_partidas([(a, b, 0, 70_000)])
+    assert (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao) == antes
+    assert len(camp.partidas) == 0 and len(camp.jogos_restantes()) == 12
+
+    # a correção é validada no Campeonato, antes de tocar estatísticas ou armazém
+    id_partida = camp.processar_partida(Partida(a, b, 1, 0))
+    depois = (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao)
+    for placar in ((-1, 0), (0, 70_000)):
+        with pytest.raises(ValueError):
+            camp.corrigir_partida(id_partida, *placar)
+    assert (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao) == depois
+    assert camp.partidas.registro(id_partida)[2:] == (1, 0)
+    camp.desfazer_partida(id_partida)
+
+    armazem = camp.partidas
+    with pytest.raises(ValueError):
+        armazem.adicionar(0, 1, 1, 0, cartoes_visitante=(1, 256))
+    assert {len(coluna) for coluna in armazem.colunas} == {1}
+    # rodadas de ligas muito grandes cabem na coluna
+    id_partida = armazem.adicionar(0, 1, 1, 0, rodada=40_000)
+    assert armazem.rodada(id_partida) == 40_000
+
+
+def test_placares_que_nao_sao_inteiros_sao_recusados_sem_alterar_nada():
+    camp = campeonato_sorteado()
+    (a, b), _ = camp.rodadas[0]
+    antes = (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao, dict(camp.historico_confrontos))
+    for placar in ((1.5, 0), (1.0, 0), (True, 0), (0, "2")):
+        if placar[1] != "2":  # Partida já recusa comparar texto com zero
+            with pytest.raises(ValueError):
+                camp.processar_partida(Partida(a, b, *placar))
+        with pytest.raises(ValueError, match="^Resultado 1: gols marcados devem ser números inteiros"):
+            camp.processar_partidas([(a, b, 2, 0), (b, a, *placar)])
+    with pytest.raises(ValueError):
+        camp.processar_partida(Partida(a, b, 1, 0, cartoes_mandante=(0.0, 1)))
+    assert (a.estatisticas.valores(), b.estatisticas.valores(), camp.versao, dict(camp.historico_confrontos)) == antes
+    assert len(camp.partidas) == 0 and len(camp.jogos_restantes()) == 12
+
+    id_partida = camp.processar_partida(Partida(a, b, 1, 0))
+    with pytest.raises(ValueError):
+        camp.corrigir_partida(id_partida, 2.0, 0)
+    assert camp.partidas.registro(id_partida)[2:] == (1, 0)
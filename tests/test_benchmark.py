@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from src import benchmark
+
+
+def test_medicoes_baseline_e_regressao(tmp_path):
+    medicoes = benchmark.executar(tamanhos=(20,), repeticoes=1)
+    assert {m.cenario for m in medicoes} == set(benchmark.CENARIOS)
+    assert all(m.tamanho == 20 and m.tempo > 0 and m.memoria >= 0 for m in medicoes)
+
+    caminho = str(tmp_path / "baseline.json")
+    benchmark.salvar_baseline(medicoes, caminho)
+    baseline = benchmark.carregar_baseline(caminho)
+    assert set(baseline["20"]) == set(benchmark.CENARIOS)
+    assert benchmark.comparar(medicoes, baseline) == []
+
+    baseline["20"]["processar_partida"]["tempo"] = medicoes[1].tempo / 10
+    regressoes = benchmark.comparar(medicoes, baseline, limiar=0.25, folga_tempo=0)
+    assert len(regressoes) == 1 and regressoes[0].startswith("processar_partida N=20: tempo")
+
+
+def test_linha_de_comando(tmp_path, capsys):
+    caminho = str(tmp_path / "baseline.json")
+    argumentos = ["--tamanhos", "20", "--cenarios", "calcular_classificacao", "--repeticoes", "1",
+                  "--baseline", caminho]
+    assert benchmark.main(argumentos + ["--salvar"]) == 0
+    with open(caminho, encoding="utf-8") as arquivo:
+        assert list(json.load(arquivo)["20"]) == ["calcular_classificacao"]
+    assert benchmark.main(argumentos + ["--limiar", "1000"]) == 0
+    assert "calcular_classificacao" in capsys.readouterr().out
+
+
+def test_baseline_de_referencia_versionada():
+    baseline = benchmark.carregar_baseline()
+    assert set(baseline) == {str(tamanho) for tamanho in benchmark.TAMANHOS}
+    assert all(set(cenarios) == set(benchmark.CENARIOS) for cenarios in baseline.values())
+
+
+@pytest.mark.desempenho
+def test_processar_partida_perto_do_laco_de_referencia():
+    assert benchmark.razao_processar_partida(partidas=20_000) < 4
+
+
+@pytest.mark.desempenho
+@pytest.mark.xfail(reason="meta de 10x ainda não atingida: o lote mede cerca de 3.5x", strict=False)
+def test_lote_mais_rapido_que_partida_a_partida():
+    assert benchmark.razao_processar_partidas(partidas=20_000) >= 10
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from src.calendario import CalendarioRoundRobin
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def ordem_sorteada(n_equipes, semente):
+    """Equipes registradas em um campeonato (com id), com folga se ímpar, em ordem embaralhada."""
+    ordem = Campeonato([Equipe(f"T{i}") for i in range(n_equipes)]).equipes + ([None] if n_equipes % 2 else [])
+    random.Random(semente).shuffle(ordem)
+    return ordem
+
+
+def rodadas_por_rotacao(ordem):
+    """Referência: rotação explícita da lista (primeiro elemento fixo) e returno invertido."""
+    n = len(ordem)
+    ida = []
+    lista = ordem[:]
+    for _ in range(n - 1):
+        ida.append([(lista[s], lista[n - 1 - s]) for s in range(n // 2)
+                    if lista[s] is not None and lista[n - 1 - s] is not None])
+        lista = [lista[0]] + [lista[-1]] + lista[1:-1]
+    return ida + [[(v, m) for m, v in rodada] for rodada in ida]
+
+
+@pytest.mark.parametrize("n_equipes", [2, 3, 4, 7, 10, 21])
+def test_calendario_igual_a_rotacao_explicita(n_equipes):
+    ordem = ordem_sorteada(n_equipes, semente=n_equipes)
+    calendario = CalendarioRoundRobin(ordem)
+    esperadas = rodadas_por_rotacao(ordem)
+    assert list(calendario) == esperadas
+    assert len(calendario) == len(esperadas)
+    assert calendario[3 % len(esperadas)] == esperadas[3 % len(esperadas)]
+    assert calendario[-1] == esperadas[-1]
+
+
+@pytest.mark.parametrize("n_equipes", [4, 7, 12])
+def test_rodada_do_jogo_e_jogos_da_equipe(n_equipes):
+    ordem = ordem_sorteada(n_equipes, semente=1)
+    calendario = CalendarioRoundRobin(ordem)
+    rodadas = rodadas_por_rotacao(ordem)
+    for numero, rodada in enumerate(rodadas):
+        for mandante, visitante in rodada:
+            assert calendario.rodada_do_jogo(mandante, visitante) == numero
+    for equipe in (e for e in ordem if e is not None):
+        esperados = [(numero, m, v) for numero, rodada in enumerate(rodadas)
+                     for m, v in rodada if equipe in (m, v)]
+        assert calendario.jogos_da_equipe(equipe) == esperados
+    assert calendario.rodada_do_jogo(ordem[0], ordem[0]) is None
+    # mesmo id, outro campeonato: o calendário é indexado por id, mas confere a equipe
+    intrusa = next(e for e in ordem_sorteada(n_equipes, semente=2) if e is not None)
+    assert calendario.rodada_do_jogo(intrusa, next(e for e in ordem if e is not None and e.id != intrusa.id)) is None
+    with pytest.raises(ValueError):
+        calendario.jogos_da_equipe(intrusa)
+
+
+def test_rodada_fora_do_calendario():
+    calendario = CalendarioRoundRobin(Campeonato([Equipe("A"), Equipe("B")]).equipes)
+    with pytest.raises(IndexError):
+        calendario[2]
+    with pytest.raises(ValueError):
+        CalendarioRoundRobin(Campeonato([Equipe("A")]).equipes)
+    with pytest.raises(ValueError):
+        CalendarioRoundRobin([Equipe("A"), Equipe("B")])  # equipes sem id
+
+
+def test_sorteio_nao_materializa_rodadas_ao_processar():
+    equipes = [Equipe(f"T{i}") for i in range(600)]
+    camp = Campeonato(equipes, semente=3)
+    camp.sortear_jogos()
+    rodada = camp.calendario[10]
+    for mandante, visitante in rodada:
+        camp.processar_partida(Partida(mandante, visitante, 1, 0))
+    assert camp._rodadas is None
+    assert camp.historico.retratos.keys() == {11}
+    assert len(camp.rodadas) == 2 * 599  # materializada só agora
+    assert camp.rodadas[10] == rodada
+
+
+def test_desfazer_com_calendario_sob_demanda():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(5)], semente=2)
+    camp.sortear_jogos()
+    ids = [camp.processar_partida(Partida(m, v, 2, 1)) for m, v in camp.calendario[0]]
+    camp.desfazer_partida(ids[0])
+    camp.historico.retratos.clear()
+    assert camp.jogos_restantes()[0] == camp.calendario[0][0]
+    camp.processar_partida(Partida(*camp.calendario[0][0], 0, 0))
+    assert 1 in camp.historico.retratos
@@ -1,5 +1,12 @@
+import csv
+import io
+import json
+import random
+
+import pytest
+
 from src.equipe import Equipe
-from src.campeonato import Campeonato 
+from src.campeonato import Campeonato, ClassificacaoPrinter
 from src.partida import Partida
 
 def test_sortear_jogos():
@@ -58,8 +65,8 @@ def test_desempate_por_numero_de_vitorias_mesmos_pontos():
     camp.sortear_jogos()
 
     # pega referências às Equipes já criadas dentro do Campeonato
-    A = next(e for e in camp.equipes if e.nome == "A")
-    B = next(e for e in camp.equipes if e.nome == "B")
+    A = camp.registro.por_nome("A")
+    B = camp.registro.por_nome("B")
 
     # escolhe oponentes diferentes para A
     oponentes_A = [e for e in camp.equipes if e.nome not in ("A", "B")][:2]
@@ -222,3 +229,247 @@ def test_desempate_por_cartoes_e_sorteio_final():
     assert tabela[0].nome == 'C'
     assert tabela[1].nome == 'B'
 
+
+
+def test_campeonato_armazena_estatisticas_em_colunas():
+    a = Equipe('A')
+    a.pontos = 4
+    b = Equipe('B')
+    camp = Campeonato([a, b])
+    colunas = camp.colunas_estatisticas
+    assert list(colunas.pontos) == [4, 0]
+    Partida(b, a, 1, 0).processar_resultado()
+    assert list(colunas.pontos) == [4, 3]
+    assert list(colunas.derrotas) == [1, 0]
+
+
+def _empatar(*equipes):
+    for t in equipes:
+        t.pontos = 6
+        t.vitorias = 2
+        t.gols_marcados = 5
+        t.gols_sofridos = 3
+
+
+def test_desempate_confronto_direto_entre_tres_times():
+    a, b, c = Equipe('A'), Equipe('B'), Equipe('C')
+    camp = Campeonato([a, b, c])
+    _empatar(a, b, c)
+    # mini-tabela: C 4 pts, B 3 pts, A 1 pt
+    camp.registrar_confronto(a, b, 0, 1)
+    camp.registrar_confronto(b, c, 0, 0)
+    camp.registrar_confronto(c, a, 1, 1)
+    camp.registrar_confronto(c, a, 2, 0)
+    tabela = camp.calcular_classificacao()
+    assert [t.nome for t in tabela] == ['C', 'B', 'A']
+
+
+def test_desempate_confronto_direto_reaplicado_ao_subgrupo():
+    a, b, c = Equipe('A'), Equipe('B'), Equipe('C')
+    camp = Campeonato([a, b, c])
+    _empatar(a, b, c)
+    # ciclo: todos com 3 pts e saldo 0 na mini-tabela; A fica atrás por gols pró,
+    # B e C seguem empatados e o confronto direto entre os dois decide (C venceu B)
+    camp.registrar_confronto(a, c, 1, 0)
+    camp.registrar_confronto(b, a, 1, 0)
+    camp.registrar_confronto(c, b, 2, 1)
+    tabela = camp.calcular_classificacao()
+    assert [t.nome for t in tabela] == ['C', 'B', 'A']
+    assert tabela == camp._classificacao_completa()
+
+
+def test_processar_partidas_em_lote_equivale_ao_processamento_individual():
+    rng = random.Random(3)
+    nomes = [f"T{i}" for i in range(8)]
+    individual = Campeonato([Equipe(n) for n in nomes])
+    lote = Campeonato([Equipe(n) for n in nomes])
+    resultados = []
+    for _ in range(60):
+        m, v = rng.sample(range(8), 2)
+        resultados.append((m, v, rng.randint(0, 3), rng.randint(0, 3)))
+    for m, v, gm, gv in resultados:
+        individual.processar_partida(Partida(individual.equipes[m], individual.equipes[v], gm, gv))
+    # mistura objetos Equipe e nomes
+    assert lote.processar_partidas((lote.equipes[m], nomes[v], gm, gv) for m, v, gm, gv in resultados) == 60
+    for a, b in zip(individual.equipes, lote.equipes):
+        assert str(a) == str(b)
+    assert dict(individual.historico_confrontos) == dict(lote.historico_confrontos)
+    assert [t.nome for t in individual.calcular_classificacao()] == [t.nome for t in lote.calcular_classificacao()]
+    assert len(lote.partidas_processadas) == 60
+
+
+def test_processar_partidas_invalidas_nao_alteram_nada():
+    a, b = Equipe('A'), Equipe('B')
+    camp = Campeonato([a, b])
+    for invalido in [('A', 'B', -1, 0), ('A', 'A', 1, 0), ('A', 'X', 1, 0), (a, 'B', 70_000, 0), ('A', 'B', 1)]:
+        with pytest.raises(ValueError, match="^Resultado 1:"):
+            camp.processar_partidas([('A', 'B', 2, 0), invalido])
+    assert a.pontos == 0 and b.gols_marcados == 0
+    assert dict(camp.historico_confrontos) == {}
+
+
+def _estado(camp):
+    return ([str(e) for e in camp.equipes], dict(camp.historico_confrontos),
+            [t.nome for t in camp.calcular_classificacao()])
+
+
+def test_corrigir_partida_equivale_a_ter_processado_o_placar_correto():
+    rng = random.Random(9)
+    nomes = [f"T{i}" for i in range(6)]
+    jogos = [(*rng.sample(range(6), 2), rng.randint(0, 3), rng.randint(0, 3)) for _ in range(30)]
+    corrigido = Campeonato([Equipe(n) for n in nomes])
+    ids = [corrigido.processar_partida(Partida(corrigido.equipes[m], corrigido.equipes[v], gm, gv))
+           for m, v, gm, gv in jogos]
+    jogos[7] = jogos[7][:2] + (5, 0)
+    corrigido.corrigir_partida(ids[7], 5, 0)
+    referencia = Campeonato([Equipe(n) for n in nomes])
+    for m, v, gm, gv in jogos:
+        referencia.processar_partida(Partida(referencia.equipes[m], referencia.equipes[v], gm, gv))
+    assert _estado(corrigido) == _estado(referencia)
+    assert str(corrigido.partidas_processadas[7]) == str(referencia.partidas_processadas[7])
+
+
+def test_processar_desfazer_e_corrigir_passam_pelos_metodos_de_dominio():
+    chamadas = []
+
+    class EquipeRegistrada(Equipe):
+        __slots__ = ()
+
+        def atualizar_estatisticas(self, gols_marcados, gols_sofridos):
+            chamadas.append(("atualizar", self.nome, gols_marcados, gols_sofridos))
+            super().atualizar_estatisticas(gols_marcados, gols_sofridos)
+
+        def reverter_estatisticas(self, gols_marcados, gols_sofridos):
+            chamadas.append(("reverter", self.nome, gols_marcados, gols_sofridos))
+            super().reverter_estatisticas(gols_marcados, gols_sofridos)
+
+    a, b = EquipeRegistrada("A"), EquipeRegistrada("B")
+    camp = Campeonato([a, b])
+    id_partida = camp.processar_partida(Partida(a, b, 2, 1))
+    camp.corrigir_partida(id_partida, 0, 0)
+    camp.desfazer_partida(id_partida)
+    assert chamadas == [
+        ("atualizar", "A", 2, 1), ("atualizar", "B", 1, 2),
+        ("reverter", "A", 2, 1), ("reverter", "B", 1, 2), ("atualizar", "A", 0, 0), ("atualizar", "B", 0, 0),
+        ("reverter", "A", 0, 0), ("reverter", "B", 0, 0),
+    ]
+    assert a.estatisticas.valores() == b.estatisticas.valores() == (0,) * 8
+
+
+def test_desfazer_partida_restaura_estado_e_calendario():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(4)], semente=5)
+    camp.sortear_jogos()
+    antes = _estado(camp)
+    restantes = len(camp.jogos_restantes())
+    m, v = camp.rodadas[0][0]
+    id_partida = camp.processar_partida(Partida(m, v, 2, 1))
+    assert len(camp.jogos_restantes()) == restantes - 1
+    camp.desfazer_partida(id_partida)
+    assert _estado(camp) == antes
+    assert len(camp.jogos_restantes()) == restantes
+    assert camp.partidas_processadas == []
+    with pytest.raises(ValueError):
+        camp.desfazer_partida(id_partida)
+    with pytest.raises(ValueError):
+        camp.corrigir_partida(99, 1, 0)
+    # reprocessar completa a rodada normalmente
+    for mandante, visitante in camp.rodadas[0]:
+        camp.processar_partida(Partida(mandante, visitante, 1, 0))
+    assert len(camp.tabela_apos_rodada(1)) == 4
+
+
+def test_classificacao_e_zonas_memorizadas_pela_versao():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(14)], semente=2)
+    camp.sortear_jogos()
+    tabela = camp.calcular_classificacao()
+    zonas = camp.determinar_classificacoes()
+    assert camp.calcular_classificacao() is tabela
+    assert camp.determinar_classificacoes() is zonas
+    acertos, falhas = camp.acertos_cache, camp.falhas_cache
+    assert acertos == 3 and falhas == 2  # zonas consultou a classificação já memorizada
+    # mudança de comportamento: antes eram uma lista e um dicionário de listas, alteráveis
+    # o resultado memorizado é compartilhado entre quem consulta: não pode ser alterado
+    with pytest.raises((TypeError, AttributeError)):
+        tabela.reverse()
+    with pytest.raises(TypeError):
+        zonas["rebaixados"] = []
+    with pytest.raises(AttributeError):
+        zonas["libertadores"].append("Intruso")
+
+    versao = camp.versao
+    m, v = camp.rodadas[0][0]
+    id_partida = camp.processar_partida(Partida(m, v, 3, 0))
+    assert camp.versao > versao
+    assert camp.calcular_classificacao()[0] is m
+    assert camp.determinar_classificacoes()["libertadores"][0] == m.nome
+
+    # setter de estatística e confronto direto também invalidam
+    versao = camp.versao
+    v.pontos = 10
+    assert camp.versao > versao and camp.calcular_classificacao()[0] is v
+    versao = camp.versao
+    camp.corrigir_partida(id_partida, 0, 0)
+    assert camp.versao > versao
+    camp.registrar_confronto(m, v, 1, 0)
+    assert camp.versao > versao + 1
+
+    falhas = camp.falhas_cache
+    camp.calcular_classificacao()
+    camp.invalidar_cache()
+    camp.calcular_classificacao()
+    assert camp.falhas_cache == falhas + 2
+
+
+def _tabela_exportacao():
+    equipes = [Equipe(n) for n in ("Alfa", 'Beta, "B"', "<Gama>")]
+    camp = Campeonato(equipes)
+    camp.processar_partida(Partida(equipes[0], equipes[1], 2, 0))
+    camp.processar_partida(Partida(equipes[2], equipes[1], 1, 1))
+    equipes[1].estatisticas.registrar_cartoes(vermelhos=1, amarelos=2)
+    return camp
+
+
+def test_imprimir_mantem_formato_de_console(capsys):
+    camp = _tabela_exportacao()
+    camp.exibir_classificacao()
+    esperado = "\n===== CLASSIFICAÇÃO =====\n" + f"{'Pos':<4}{'Time':<20}{'Pts':<5}{'Vit':<5}{'SG':<5}{'GM':<5}{'GS':<5}\n"
+    for i, e in enumerate(camp.calcular_classificacao(), start=1):
+        esperado += f"{i:<4}{e.nome:<20}{e.pontos:<5}{e.vitorias:<5}{e.saldo_de_gols():<5}{e.gols_marcados:<5}{e.gols_sofridos:<5}\n"
+    assert capsys.readouterr().out == esperado
+
+
+def test_exportar_classificacao_csv_json_html():
+    camp = _tabela_exportacao()
+    colunas = ["posicao", "nome", "pontos", "empates", "derrotas", "cartoes_vermelhos", "cartoes_amarelos"]
+
+    linhas = list(csv.reader(io.StringIO(camp.exportar_classificacao("csv", colunas))))
+    assert linhas[0] == colunas
+    assert linhas[-1] == ["3", 'Beta, "B"', "1", "1", "1", "1", "2"]
+
+    dados = json.loads(camp.exportar_classificacao("json", colunas))
+    assert [d["nome"] for d in dados] == [e.nome for e in camp.calcular_classificacao()]
+    assert dados[0] == {"posicao": 1, "nome": "Alfa", "pontos": 3, "empates": 0, "derrotas": 0,
+                        "cartoes_vermelhos": 0, "cartoes_amarelos": 0}
+
+    tabela_html = camp.exportar_classificacao("html")
+    assert "&lt;Gama&gt;" in tabela_html and "<th>Pts</th>" in tabela_html
+    assert tabela_html.count("<tr>") == 4
+
+
+def test_exportar_trecho_e_escrita_em_arquivo():
+    camp = Campeonato([Equipe(f"T{i:04d}") for i in range(2500)])
+    for i in range(0, 2500, 2):
+        camp.equipes[i].pontos = i
+    tabela = camp.calcular_classificacao()
+    trecho = json.loads(camp.exportar_classificacao("json", ["posicao", "nome"], inicio=10, fim=13))
+    assert trecho == [{"posicao": p + 1, "nome": tabela[p].nome} for p in range(10, 13)]
+    assert json.loads(camp.exportar_classificacao("json", inicio=5, fim=5)) == []
+
+    destino = io.StringIO()
+    camp.exportar_classificacao("texto", destino=destino)
+    assert destino.getvalue() == ClassificacaoPrinter.renderizar(tabela)
+    assert destino.getvalue().count("\n") == 2500 + 3
+    with pytest.raises(ValueError):
+        camp.exportar_classificacao("xml")
+    with pytest.raises(ValueError):
+        camp.exportar_classificacao(colunas=["nome", "idade"])
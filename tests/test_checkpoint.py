@@ -0,0 +1,152 @@
+import random
+import time
+
+import pytest
+
+from src import checkpoint
+from src import confrontos as modulo_confrontos
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def campeonato_em_andamento(n=6):
+    camp = Campeonato([Equipe(f"Time {i}") for i in range(n)], semente=4)
+    camp.sortear_jogos()
+    rng = random.Random(2)
+    for mandante, visitante in camp.calendario.rodada(0) + camp.calendario.rodada(1):
+        camp.processar_partida(Partida(mandante, visitante, rng.randint(0, 3), rng.randint(0, 3)))
+    camp.equipes[0].estatisticas.registrar_cartoes(1, 2)
+    return camp
+
+
+def assert_equivalentes(original, restaurado):
+    assert [str(e) for e in restaurado.equipes] == [str(e) for e in original.equipes]
+    assert [(e.cartoes_vermelhos, e.cartoes_amarelos) for e in restaurado.equipes] == \
+        [(e.cartoes_vermelhos, e.cartoes_amarelos) for e in original.equipes]
+    assert dict(restaurado.historico_confrontos) == dict(original.historico_confrontos)
+    assert [[(m.nome, v.nome) for m, v in r] for r in restaurado.rodadas] == \
+        [[(m.nome, v.nome) for m, v in r] for r in original.rodadas]
+    assert [str(p) for p in restaurado.partidas_processadas] == [str(p) for p in original.partidas_processadas]
+    assert [e.nome for e in restaurado.calcular_classificacao()] == [e.nome for e in original.calcular_classificacao()]
+
+
+def test_salvar_e_carregar_preserva_estado(tmp_path):
+    camp = campeonato_em_andamento()
+    caminho = tmp_path / "camp.bin"
+    checkpoint.salvar(camp, str(caminho))
+    restaurado = checkpoint.carregar(str(caminho))
+    assert_equivalentes(camp, restaurado)
+    # o gerador continua de onde parou
+    assert restaurado.rng.random() == camp.rng.random()
+
+
+def test_checkpoint_com_confrontos_esparsos(monkeypatch):
+    monkeypatch.setattr(modulo_confrontos, "LIMITE_DENSO", 2)
+    camp = campeonato_em_andamento()
+    restaurado = checkpoint.de_bytes(checkpoint.para_bytes(camp))
+    assert_equivalentes(camp, restaurado)
+
+
+def test_restaurado_continua_processando_partidas(monkeypatch):
+    camp = campeonato_em_andamento(4)
+    dados = checkpoint.para_bytes(camp)
+
+    def alocar_vazias(*_):
+        raise AssertionError("as matrizes de confrontos vêm do arquivo")
+
+    monkeypatch.setattr(modulo_confrontos.ConfrontosDiretos, "__init__", alocar_vazias)
+    restaurado = checkpoint.de_bytes(dados)
+    monkeypatch.undo()
+    for c in (camp, restaurado):
+        m, v = c.rodadas[2][0]
+        c.processar_partida(Partida(m, v, 2, 2))
+    assert_equivalentes(camp, restaurado)
+    assert len(restaurado.jogos_restantes()) == len(camp.jogos_restantes())
+
+
+def test_dados_invalidos_ou_versao_desconhecida():
+    with pytest.raises(ValueError):
+        checkpoint.de_bytes(b"XXXX" + bytes(10))
+    dados = bytearray(checkpoint.para_bytes(Campeonato([Equipe("A")])))
+    dados[4:6] = (99).to_bytes(2, "little")
+    with pytest.raises(ValueError):
+        checkpoint.de_bytes(bytes(dados))
+
+
+def test_calendario_sorteado_e_salvo_pela_ordem_sem_materializar():
+    camp = campeonato_em_andamento(20)
+    dados = checkpoint.para_bytes(camp)
+    assert camp._rodadas is None  # salvar não materializa as rodadas sorteadas
+    restaurado = checkpoint.de_bytes(dados)
+    assert restaurado.calendario.ordem == [restaurado.equipes[e.id] for e in camp.calendario.ordem]
+    assert restaurado._rodadas is None and restaurado._pendencias is not None
+    assert restaurado.jogos_restantes() == [(restaurado.equipes[m.id], restaurado.equipes[v.id])
+                                            for m, v in camp.jogos_restantes()]
+    assert_equivalentes(camp, restaurado)
+    # rodadas definidas à mão continuam gravadas por extenso
+    camp.rodadas = camp.rodadas[:3]
+    assert_equivalentes(camp, checkpoint.de_bytes(checkpoint.para_bytes(camp)))
+
+    # completar a rodada 3 no restaurado usa as pendências lidas do arquivo
+    restaurado = checkpoint.de_bytes(dados)
+    for mandante, visitante in restaurado.calendario.rodada(2):
+        restaurado.processar_partida(Partida(mandante, visitante, 1, 0))
+    assert 3 in restaurado.historico.retratos
+
+
+def liga_sorteada(n):
+    camp = Campeonato([Equipe(f"Equipe {i}") for i in range(n)], semente=7)
+    camp.sortear_jogos()
+    for mandante, visitante in camp.calendario.rodada(0):
+        camp.processar_partida(Partida(mandante, visitante, 1, 0))
+    return camp
+
+
+def test_liga_grande_sorteada_ida_e_volta_pelo_checkpoint():
+    camp = liga_sorteada(10_000)
+    dados = checkpoint.para_bytes(camp)
+    # sem as ~10^8 partidas do calendário por extenso: poucos bytes por equipe
+    assert len(dados) < 200 * 10_000
+    restaurado = checkpoint.de_bytes(dados)
+    assert [e.nome for e in restaurado.calendario.ordem] == [e.nome for e in camp.calendario.ordem]
+    assert [(m.nome, v.nome) for m, v in restaurado.calendario.rodada(5_000)] == \
+        [(m.nome, v.nome) for m, v in camp.calendario.rodada(5_000)]
+    assert restaurado.tabela_apos_rodada(1) == camp.tabela_apos_rodada(1)
+    assert [str(e) for e in restaurado.equipes[:50]] == [str(e) for e in camp.equipes[:50]]
+
+
+@pytest.mark.desempenho
+def test_liga_de_10_mil_equipes_restaurada_em_menos_de_um_segundo(tmp_path):
+    caminho = str(tmp_path / "liga.bin")
+    checkpoint.salvar(liga_sorteada(10_000), caminho)
+    inicio = time.perf_counter()
+    checkpoint.carregar(caminho)
+    assert time.perf_counter() - inicio < 0.5
+
+
+def test_checkpoint_preserva_identificadores_de_partidas_desfeitas():
+    camp = campeonato_em_andamento(4)
+    camp.desfazer_partida(0)
+    restaurado = checkpoint.de_bytes(checkpoint.para_bytes(camp))
+    assert_equivalentes(camp, restaurado)
+    for c in (camp, restaurado):
+        c.corrigir_partida(1, 4, 4)
+    assert_equivalentes(camp, restaurado)
+    with pytest.raises(ValueError):
+        restaurado.desfazer_partida(0)
+
+
+def test_checkpoint_preserva_historico_de_rodadas():
+    camp = campeonato_em_andamento()
+    camp.registrar_rodada(9)  # retrato manual, fora da sequência das rodadas completas
+    dados = checkpoint.para_bytes(camp)
+    restaurado = checkpoint.de_bytes(dados)
+    assert sorted(restaurado.historico.retratos) == [1, 2, 9]
+    for rodada in (1, 2, 9):
+        assert restaurado.tabela_apos_rodada(rodada) == camp.tabela_apos_rodada(rodada)
+    assert restaurado.trajetoria(restaurado.equipes[3]) == camp.trajetoria(camp.equipes[3])
+    # equipes que não mudaram entre retratos compartilham a linha, como no original
+    primeiro, segundo = (restaurado.historico.retratos[r].linhas for r in (2, 9))
+    assert [a is b for a, b in zip(primeiro, segundo)] == [False] + [True] * 5
+
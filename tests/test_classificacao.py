@@ -0,0 +1,52 @@
+import random
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def test_tabela_incremental_igual_a_ordenacao_completa():
+    rng = random.Random(42)
+    equipes = [Equipe(f"T{i}") for i in range(12)]
+    camp = Campeonato(equipes)
+    for _ in range(150):
+        mandante, visitante = rng.sample(equipes, 2)
+        # placares baixos geram muitos empates na chave básica
+        camp.processar_partida(Partida(mandante, visitante, rng.randint(0, 1), rng.randint(0, 1)))
+        if rng.random() < 0.2:
+            rng.choice(equipes).estatisticas.registrar_cartoes(rng.randint(0, 1), rng.randint(0, 2))
+        assert camp.calcular_classificacao() == camp._classificacao_completa()
+
+
+def test_tabela_reflete_alteracoes_diretas_nas_equipes():
+    a, b, c = Equipe("A"), Equipe("B"), Equipe("C")
+    camp = Campeonato([a, b, c])
+    assert camp.calcular_classificacao() == camp._classificacao_completa()
+    c.pontos = 5
+    assert camp.calcular_classificacao()[0] is c
+    # partida processada fora do campeonato também é percebida
+    Partida(b, a, 3, 0).processar_resultado()
+    assert [t.nome for t in camp.calcular_classificacao()] == ["C", "B", "A"]
+
+
+def test_confronto_direto_registrado_reordena_grupo_empatado():
+    a, b = Equipe("A"), Equipe("B")
+    camp = Campeonato([a, b])
+    for t in (a, b):
+        t.pontos = 3
+    assert camp.calcular_classificacao()[0] is a
+    camp.registrar_confronto(a, b, 0, 1)
+    assert camp.calcular_classificacao()[0] is b
+
+
+def test_invalidar_cache_reordena_apos_escrita_direta_nas_colunas():
+    equipes = [Equipe(nome) for nome in "ABCD"]
+    camp = Campeonato(equipes)
+    camp.processar_partida(Partida(equipes[2], equipes[1], 2, 0))
+    camp.processar_partida(Partida(equipes[0], equipes[3], 1, 1))
+    antes = [t.nome for t in camp.calcular_classificacao()]
+    camp.colunas_estatisticas.pontos[3] = 50  # por fora dos observadores das colunas
+    assert [t.nome for t in camp.calcular_classificacao()] == antes
+    camp.invalidar_cache()
+    assert camp.calcular_classificacao() == camp._classificacao_completa()
+    assert camp.calcular_classificacao()[0] is equipes[3]
@@ -0,0 +1,55 @@
+import pytest
+
+from src import confrontos as modulo
+from src.campeonato import Campeonato
+from src.confrontos import ConfrontosDiretos
+from src.equipe import Equipe
+
+
+def test_pontuacao_acumula_pontos_e_gols():
+    c = ConfrontosDiretos(3)
+    c.registrar(0, 1, 2, 0)
+    c.registrar(1, 0, 1, 1)
+    assert c.pontuacao(0, 1) == (4, 2, 3)
+    assert c.pontuacao(1, 0) == (1, -2, 1)
+    assert c.pontuacao(0, 2) == (0, 0, 0)
+    assert c.disputado(0, 1) and not c.disputado(1, 2)
+
+
+def test_mini_tabela_considera_apenas_o_grupo():
+    c = ConfrontosDiretos(4)
+    c.registrar(0, 1, 1, 0)
+    c.registrar(1, 2, 2, 0)
+    c.registrar(2, 0, 3, 1)
+    c.registrar(3, 0, 5, 0)  # fora do grupo
+    tabela = c.mini_tabela([0, 1, 2])
+    assert tabela == {0: (3, -1, 2), 1: (3, 1, 2), 2: (3, 0, 3)}
+
+
+def test_modo_esparso_para_ligas_grandes(monkeypatch):
+    monkeypatch.setattr(modulo, "LIMITE_DENSO", 2)
+    c = ConfrontosDiretos(3)
+    c.registrar(2, 0, 0, 0)
+    assert c.pontuacao(0, 2) == (1, 0, 0)
+    assert len(c.pontos) == 2  # só as células usadas
+    assert list(c.pares()) == [(0, 2)]
+    copia = c.copiar()
+    copia.registrar(2, 0, 1, 0)
+    assert c.pontuacao(2, 0) == (1, 0, 0)
+
+
+def test_historico_confrontos_visao_compativel():
+    a, b, d = Equipe('A'), Equipe('B'), Equipe('D')
+    camp = Campeonato([a, b, d])
+    camp.registrar_confronto(a, b, 2, 1)
+    historico = camp.historico_confrontos
+    assert list(historico) == [frozenset({'A', 'B'})]
+    assert historico[frozenset({'A', 'B'})]['B'] == {'pontos': 0, 'gols_pro': 1, 'gols_contra': 2}
+    assert frozenset({'A', 'D'}) not in historico
+
+
+def test_registrar_confronto_equipe_fora_do_campeonato():
+    a, b = Equipe('A'), Equipe('B')
+    camp = Campeonato([a])
+    with pytest.raises(ValueError):
+        camp.registrar_confronto(a, b, 1, 0)
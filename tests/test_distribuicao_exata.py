@@ -0,0 +1,95 @@
+import itertools
+import random
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.distribuicao_exata import DistribuicaoExata
+from src.equipe import Equipe
+from src.partida import Partida
+from src.rating import MotorRating
+
+
+def campeonato_parcial(n, rodadas_restantes, semente):
+    rng = random.Random(semente)
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n)], semente=semente)
+    camp.sortear_jogos()
+    motor = MotorRating(camp)
+    for rodada in camp.rodadas[:len(camp.rodadas) - rodadas_restantes]:
+        for mandante, visitante in rodada:
+            camp.processar_partida(Partida(mandante, visitante, rng.randint(0, 3), rng.randint(0, 2)))
+    return camp, motor
+
+
+def forca_bruta(exata):
+    """Distribuições de pontos e de posições enumerando todos os resultados restantes."""
+    n = len(exata.nomes)
+    posicoes = [[0.0] * n for _ in range(n)]
+    pontos = [{} for _ in range(n)]
+    for resultados in itertools.product(range(3), repeat=len(exata.jogos)):
+        p = 1.0
+        final = exata.pontos[:]
+        for (i, j, *probabilidades), resultado in zip(exata.jogos, resultados):
+            p *= probabilidades[resultado]
+            final[i] += (3, 1, 0)[resultado]
+            final[j] += (0, 1, 3)[resultado]
+        for x in range(n):
+            acima = sum(final[t] > final[x] for t in range(n) if t != x)
+            empatados = sum(final[t] == final[x] for t in range(n) if t != x)
+            for posicao in range(acima, acima + empatados + 1):
+                posicoes[x][posicao] += p / (empatados + 1)
+            pontos[x][final[x]] = pontos[x].get(final[x], 0.0) + p
+    return pontos, posicoes
+
+
+@pytest.mark.parametrize("semente", range(3))
+def test_coincide_com_a_enumeracao_completa(semente):
+    camp, motor = campeonato_parcial(6, rodadas_restantes=3, semente=semente)
+    exata = DistribuicaoExata(camp, motor)
+    pontos, posicoes = forca_bruta(exata)
+    for x, nome in enumerate(exata.nomes):
+        assert exata.distribuicao_posicoes()[nome] == pytest.approx(posicoes[x], abs=1e-12)
+        distribuicao = exata.distribuicao_pontos()[nome]
+        assert distribuicao == pytest.approx([pontos[x].get(k, 0.0) for k in range(len(distribuicao))], abs=1e-12)
+
+
+def test_zonas_e_modelo_em_dicionario():
+    camp, _ = campeonato_parcial(20, rodadas_restantes=1, semente=4)
+    probabilidades = {(m.nome, v.nome): (0.45, 0.3, 0.25) for m, v in camp.jogos_restantes()}
+    exata = DistribuicaoExata(camp, probabilidades)
+    zonas = exata.probabilidades_zonas()
+    assert sum(z["titulo"] for z in zonas.values()) == pytest.approx(1)
+    assert sum(z["rebaixados"] for z in zonas.values()) == pytest.approx(4)
+    for distribuicao in exata.distribuicao_posicoes().values():
+        assert sum(distribuicao) == pytest.approx(1)
+
+
+def test_validacoes_e_limite_de_estados():
+    camp, motor = campeonato_parcial(8, rodadas_restantes=4, semente=2)
+    with pytest.raises(ValueError):
+        DistribuicaoExata(camp, {(m.nome, v.nome): (0.5, 0.5, 0.5) for m, v in camp.jogos_restantes()})
+    exata = DistribuicaoExata(camp, motor, max_estados=2)
+    assert exata.estados_estimados() > 2
+    with pytest.raises(ValueError):
+        exata.distribuicao_posicoes()
+
+
+def test_tabela_embolada_e_recusada_sem_contar_tudo():
+    # esta tabela percorre 212 mil estados; com limite menor a contagem para logo depois dele
+    camp, motor = campeonato_parcial(20, rodadas_restantes=5, semente=9)
+    exata = DistribuicaoExata(camp, motor, max_estados=20_000)
+    assert exata.max_estados < exata.estados_estimados() < 2 * exata.max_estados
+    with pytest.raises(ValueError):
+        exata.distribuicao_posicoes()
+
+
+def test_ultimas_cinco_rodadas_de_vinte_equipes():
+    # esta tabela passava de 500 mil estados quando cada equipe tinha o seu cálculo; hoje são 5 mil
+    camp, motor = campeonato_parcial(20, rodadas_restantes=5, semente=1)
+    exata = DistribuicaoExata(camp, motor)
+    assert exata.estados_estimados() <= exata.max_estados
+    posicoes = exata.distribuicao_posicoes()
+    for distribuicao in posicoes.values():
+        assert sum(distribuicao) == pytest.approx(1)
+    for posicao in range(20):
+        assert sum(distribuicao[posicao] for distribuicao in posicoes.values()) == pytest.approx(1)
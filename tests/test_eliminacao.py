@@ -0,0 +1,97 @@
+import itertools
+import random
+
+from src.campeonato import Campeonato
+from src.eliminacao import AnalisadorEliminacao
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def campeonato_parcial(n, faltando, semente):
+    rng = random.Random(semente)
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n)], semente=semente)
+    camp.sortear_jogos()
+    jogos = [jogo for rodada in camp.rodadas for jogo in rodada]
+    for mandante, visitante in jogos[:len(jogos) - faltando]:
+        camp.processar_partida(Partida(mandante, visitante, rng.randint(0, 2), rng.randint(0, 2)))
+    return camp
+
+
+def posicoes_extremas(camp):
+    """Melhor e pior posição de cada equipe por força bruta sobre os jogos restantes."""
+    n = len(camp.equipes)
+    pontos = [e.pontos for e in camp.equipes]
+    restantes = [(m.id, v.id) for m, v in camp.jogos_restantes()]
+    melhor, pior = [n] * n, [1] * n
+    for resultados in itertools.product((3, 1, 0), repeat=len(restantes)):
+        final = pontos[:]
+        for (i, j), ganho in zip(restantes, resultados):
+            final[i] += ganho
+            final[j] += {3: 0, 1: 1, 0: 3}[ganho]
+        for x in range(n):
+            melhor[x] = min(melhor[x], 1 + sum(final[t] > final[x] for t in range(n) if t != x))
+            pior[x] = max(pior[x], 1 + sum(final[t] >= final[x] for t in range(n) if t != x))
+    return melhor, pior
+
+
+def test_intervalos_contem_as_posicoes_extremas():
+    for semente in range(25):
+        camp = campeonato_parcial(6, faltando=5, semente=semente)
+        melhor, pior = posicoes_extremas(camp)
+        situacoes = AnalisadorEliminacao(camp).situacoes()
+        for x, equipe in enumerate(camp.equipes):
+            situacao = situacoes[equipe.nome]
+            assert situacao.melhor_posicao <= melhor[x] <= situacao.melhor_confirmada
+            assert situacao.pior_confirmada <= pior[x] <= situacao.pior_posicao
+
+
+def test_status_e_numeros_magicos_no_fim_da_temporada():
+    camp = campeonato_parcial(20, faltando=10, semente=3)
+    lider = max(camp.equipes, key=lambda e: e.pontos)
+    lider.pontos += 40  # vantagem impossível de tirar em uma rodada
+    camp.invalidar_cache()
+    analisador = AnalisadorEliminacao(camp)
+    situacao = analisador.situacao(lider)
+    assert situacao.zonas["titulo"] == "garantido"
+    assert situacao.zonas["rebaixados"] == "eliminado"
+    assert situacao.melhor_posicao == situacao.pior_posicao == 1
+    assert situacao.numeros_magicos["titulo"] == 0
+    assert analisador.equipes("titulo", "garantido") == [lider.nome]
+    assert len(analisador.equipes("titulo", "eliminado")) == 19
+    for situacao in analisador.situacoes().values():
+        assert situacao.melhor_posicao <= situacao.melhor_confirmada <= situacao.pior_confirmada <= situacao.pior_posicao
+
+
+def test_numero_magico_garante_a_vaga():
+    camp = campeonato_parcial(20, faltando=30, semente=5)
+    analisador = AnalisadorEliminacao(camp)
+    for nome, situacao in analisador.situacoes().items():
+        numero = situacao.numeros_magicos["libertadores"]
+        if situacao.zonas["libertadores"] == "eliminado":
+            assert numero is None
+        elif numero is not None:
+            assert situacao.pontos + numero <= situacao.pontos_maximos
+
+
+def test_reanalisa_apos_processar_partida():
+    camp = campeonato_parcial(6, faltando=4, semente=1)
+    analisador = AnalisadorEliminacao(camp)
+    antes = analisador.situacoes()
+    assert analisador.situacoes() is antes
+    mandante, visitante = next(iter(camp.jogos_restantes()))
+    camp.processar_partida(Partida(mandante, visitante, 5, 0))
+    depois = analisador.situacoes()
+    assert depois is not antes
+    assert depois[mandante.nome].pontos == antes[mandante.nome].pontos + 3
+
+
+def test_so_reanalisa_equipes_cujo_problema_mudou():
+    camp = campeonato_parcial(20, faltando=20, semente=3)
+    analisador = AnalisadorEliminacao(camp)
+    analisador.situacoes()
+    antes = analisador.reanalisadas
+    rng = random.Random(3)
+    for mandante, visitante in list(camp.jogos_restantes())[:10]:
+        camp.processar_partida(Partida(mandante, visitante, rng.randint(0, 2), rng.randint(0, 2)))
+        assert analisador.situacoes() == AnalisadorEliminacao(camp).situacoes()
+    assert analisador.reanalisadas - antes < 10 * 20
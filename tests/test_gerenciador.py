@@ -0,0 +1,55 @@
+import pytest
+
+from src.gerenciador import GerenciadorCompeticoes
+
+
+@pytest.fixture
+def gerenciador():
+    with GerenciadorCompeticoes(workers=4) as g:
+        g.adicionar_competicao("A", ["Flamengo", "Palmeiras", "Santos", "Grêmio"], semente=1)
+        g.adicionar_competicao("Copa", ["Flamengo", "Santos", "Bahia"], semente=2)
+        yield g
+
+
+def test_clube_tem_equipe_separada_por_competicao(gerenciador):
+    assert sorted(gerenciador.competicoes_do_clube("Flamengo")) == ["A", "Copa"]
+    gerenciador.processar_partida("A", "Flamengo", "Santos", 2, 0).result()
+    assert gerenciador.equipe("Flamengo", "A").pontos == 3
+    assert gerenciador.equipe("Flamengo", "Copa").pontos == 0
+    with pytest.raises(ValueError):
+        gerenciador.equipe("Bahia", "A")
+    with pytest.raises(ValueError):
+        gerenciador.adicionar_competicao("A", ["X", "Y"])
+
+
+def test_competicao_recusada_nao_deixa_clubes_registrados(gerenciador):
+    with pytest.raises(ValueError):
+        gerenciador.adicionar_competicao("B", ["Vasco", "Flamengo", "Vasco"])
+    assert gerenciador.competicoes_do_clube("Vasco") == []
+    assert sorted(gerenciador.competicoes_do_clube("Flamengo")) == ["A", "Copa"]
+    assert "B" not in gerenciador.competicoes
+    gerenciador.adicionar_competicao("B", ["Vasco", "Flamengo"], semente=3)
+    assert gerenciador.equipe("Vasco", "B").pontos == 0
+
+
+def test_lote_distribuido_entre_competicoes(gerenciador):
+    futuros = gerenciador.processar_lote([
+        ("A", "Flamengo", "Palmeiras", 1, 1),
+        ("Copa", "Bahia", "Santos", 3, 1),
+        ("A", "Santos", "Grêmio", 0, 2),
+    ])
+    assert {nome: f.result() for nome, f in futuros.items()} == {"A": 2, "Copa": 1}
+    tabelas = gerenciador.classificacoes()
+    assert tabelas["Copa"][0].nome == "Bahia"
+    assert tabelas["A"][0].nome == "Grêmio"
+    resumo = gerenciador.metricas.resumo()
+    assert resumo["partidas"] == 3 and resumo["consultas"] == 2
+    assert gerenciador.metricas.partidas_por_competicao == {"A": 2, "Copa": 1}
+    assert resumo["partidas_por_segundo"] > 0
+
+
+def test_muitas_partidas_concorrentes_na_mesma_competicao(gerenciador):
+    futuros = [gerenciador.processar_partida("A", "Flamengo", "Palmeiras", 1, 0) for _ in range(200)]
+    assert sorted(f.result() for f in futuros) == list(range(200))
+    assert gerenciador.equipe("Flamengo", "A").pontos == 600
+    assert gerenciador.equipe("Palmeiras", "A").derrotas == 200
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def placares(camp, semente=8):
+    rng = random.Random(semente)
+    return [[(m, v, rng.randint(0, 3), rng.randint(0, 3)) for m, v in rodada] for rodada in camp.rodadas]
+
+
+def test_tabela_apos_cada_rodada_registrada_automaticamente():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(6)], semente=1)
+    camp.sortear_jogos()
+    esperadas = []
+    for rodada in placares(camp):
+        for m, v, gm, gv in rodada:
+            camp.processar_partida(Partida(m, v, gm, gv))
+        esperadas.append([(e.nome, e.pontos, e.saldo_de_gols()) for e in camp.calcular_classificacao()])
+    for numero, esperada in enumerate(esperadas, start=1):
+        tabela = camp.tabela_apos_rodada(numero)
+        assert [(l.nome, l.pontos, l.saldo_de_gols) for l in tabela] == esperada
+        assert [l.posicao for l in tabela] == list(range(1, 7))
+    equipe = camp.equipes[0]
+    trajetoria = camp.trajetoria(equipe)
+    assert len(trajetoria) == len(camp.rodadas)
+    assert trajetoria[-1] == [e.nome for e in camp.calcular_classificacao()].index(equipe.nome) + 1
+
+
+def test_carga_em_lote_registra_cada_rodada_no_ponto_certo():
+    nomes = [f"T{i}" for i in range(4)]
+    individual = Campeonato([Equipe(n) for n in nomes], semente=2)
+    individual.sortear_jogos()
+    lote = Campeonato([Equipe(n) for n in nomes], semente=2)
+    lote.sortear_jogos()
+    jogos = [j for rodada in placares(individual) for j in rodada]
+    for m, v, gm, gv in jogos:
+        individual.processar_partida(Partida(m, v, gm, gv))
+    lote.processar_partidas((m.nome, v.nome, gm, gv) for m, v, gm, gv in jogos)
+    for numero in range(1, len(individual.rodadas) + 1):
+        assert lote.tabela_apos_rodada(numero) == individual.tabela_apos_rodada(numero)
+
+
+def test_retratos_compartilham_linhas_de_equipes_sem_jogo():
+    # 5 equipes: uma folga por rodada, e a linha dela é reaproveitada
+    camp = Campeonato([Equipe(f"T{i}") for i in range(5)], semente=3)
+    camp.sortear_jogos()
+    for rodada in placares(camp)[:2]:
+        for m, v, gm, gv in rodada:
+            camp.processar_partida(Partida(m, v, gm, gv))
+    jogaram = {camp._indice(e) for m, v in camp.rodadas[1] for e in (m, v)}
+    (folga,) = set(range(5)) - jogaram
+    r1, r2 = camp.historico.retrato(1), camp.historico.retrato(2)
+    assert r1.linhas[folga] is r2.linhas[folga]
+
+
+def test_rodada_nao_registrada():
+    camp = Campeonato([Equipe("A"), Equipe("B")])
+    with pytest.raises(KeyError):
+        camp.tabela_apos_rodada(1)
+    camp.registrar_rodada(1)
+    assert [l.nome for l in camp.tabela_apos_rodada(1)] == ["A", "B"]
+
+
+def test_reprocessar_partida_desfeita_nao_altera_retrato():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(4)], semente=1)
+    camp.sortear_jogos()
+    ids = [camp.processar_partida(Partida(m, v, gm, gv)) for rodada in placares(camp)[:3] for m, v, gm, gv in rodada]
+    retrato = camp.tabela_apos_rodada(1)
+    # os dois primeiros ids são os jogos da rodada 1: cada um volta a completá-la
+    for id_partida, processar in zip(ids[:2], ("individual", "lote")):
+        m, v, gm, gv = camp.partidas.registro(id_partida)
+        camp.desfazer_partida(id_partida)
+        if processar == "individual":
+            camp.processar_partida(Partida(camp.equipes[m], camp.equipes[v], gm, gv))
+        else:
+            camp.processar_partidas([(camp.equipes[m], camp.equipes[v], gm + 2, gv)])
+        assert camp.tabela_apos_rodada(1) == retrato
@@ -0,0 +1,99 @@
+import json
+
+from src import instrumentacao
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+
+
+def campeonato_com_empates():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(8)], semente=1)
+    camp.sortear_jogos()
+    for mandante, visitante in camp.rodadas[0]:
+        camp.processar_partida(Partida(mandante, visitante, 1, 1))
+    return camp
+
+
+def test_contagens_por_ponto_quente_e_json():
+    original = Campeonato.calcular_classificacao
+    with instrumentacao.instrumentado():
+        assert Campeonato.calcular_classificacao is not original
+        camp = campeonato_com_empates()
+        camp.invalidar_cache()
+        camp.determinar_classificacoes()
+    assert Campeonato.calcular_classificacao is original
+    assert not instrumentacao.ativo()
+
+    dados = instrumentacao.instantaneo()
+    assert dados["Campeonato.processar_partida"]["chamadas"] == 4
+    assert dados["Partida.processar_resultado"]["chamadas"] == 4
+    assert dados["Equipe.atualizar_estatisticas"]["chamadas"] == 8
+    # rodada completa: as 8 equipes empatadas passam pelo confronto direto e pelos cartões
+    assert dados["Campeonato._desempatar_grupo"]["chamadas"] >= 1
+    assert dados["ConfrontosDiretos.mini_tabela"]["chamadas"] >= 1
+    assert dados["Campeonato._ordenar_por_cartoes"]["chamadas"] >= 1
+    assert dados["Campeonato.calcular_classificacao"]["chamadas"] == 2
+    assert all(p["tempo_total"] >= 0 for p in dados.values())
+
+    exportado = json.loads(instrumentacao.para_json())
+    assert exportado["ativo"] is False
+    assert exportado["pontos"]["Campeonato.processar_partida"]["chamadas"] == 4
+
+    with instrumentacao.instrumentado():
+        camp.desfazer_partida(0)
+    assert instrumentacao.instantaneo()["Equipe.reverter_estatisticas"]["chamadas"] == 2
+
+    with instrumentacao.instrumentado():
+        pass
+    assert instrumentacao.instantaneo() == {}
+
+
+def test_captura_de_perfil_e_memoria():
+    with instrumentacao.capturar() as captura:
+        camp = campeonato_com_empates()
+        tabela = camp.calcular_classificacao()
+    assert len(tabela) == 8
+    assert "processar_partida" in captura.relatorio_perfil()
+    assert captura.pico_memoria > 0
+    assert captura.maiores_alocacoes and json.dumps(captura.para_dict())
+
+    with instrumentacao.capturar(perfil=False) as so_memoria:
+        [0] * 1000
+    assert so_memoria.relatorio_perfil() == "" and so_memoria.pico_memoria >= 0
+
+
+def test_blocos_aninhados_e_em_threads_restauram_uma_vez():
+    import threading
+
+    original = Campeonato.calcular_classificacao
+    camp = campeonato_com_empates()
+    dentro, sair = threading.Event(), threading.Event()
+
+    def outra_thread():
+        with instrumentacao.instrumentado():
+            dentro.set()
+            sair.wait()
+            camp.invalidar_cache()
+            camp.calcular_classificacao()
+
+    with instrumentacao.instrumentado():
+        tarefa = threading.Thread(target=outra_thread)
+        tarefa.start()
+        dentro.wait()
+        with instrumentacao.instrumentado():
+            camp.invalidar_cache()
+            camp.calcular_classificacao()
+        assert instrumentacao.ativo()
+    # o bloco da outra thread ainda está aberto: a instrumentação continua
+    assert Campeonato.calcular_classificacao is not original
+    sair.set()
+    tarefa.join()
+    assert Campeonato.calcular_classificacao is original and not instrumentacao.ativo()
+    assert instrumentacao.instantaneo()["Campeonato.calcular_classificacao"]["chamadas"] == 2
+
+    instrumentacao.ativar()
+    with instrumentacao.instrumentado():
+        pass
+    assert instrumentacao.ativo()  # ligada por ativar(): o bloco não a desliga
+    instrumentacao.desativar()
+    assert Campeonato.calcular_classificacao is original
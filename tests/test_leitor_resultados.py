@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.leitor_resultados import LeitorResultados
+
+
+def criar_campeonato():
+    return Campeonato([Equipe(n) for n in ("A", "B", "C")])
+
+
+def test_carregar_csv_relata_linhas_invalidas_sem_interromper(tmp_path):
+    arquivo = tmp_path / "resultados.csv"
+    arquivo.write_text(
+        "mandante,visitante,gols_mandante,gols_visitante\n"
+        "A,B,2,0\n"
+        "A,A,1,1\n"
+        "B,C,-1,0\n"
+        "X,C,1,0\n"
+        "C,A,dois,0\n"
+        "C,A\n"
+        "C,A,1,1\n",
+        encoding="utf-8",
+    )
+    camp = criar_campeonato()
+    relatorio = LeitorResultados(camp, tamanho_lote=1).carregar(str(arquivo))
+    assert relatorio.processadas == 2
+    assert [e.linha for e in relatorio.erros] == [3, 4, 5, 6, 7]
+    assert "mesma equipe" in relatorio.erros[0].motivo
+    assert "negativos" in relatorio.erros[1].motivo
+    a, b, c = camp.equipes
+    assert (a.pontos, b.pontos, c.pontos) == (4, 0, 1)
+
+
+def test_carregar_jsonl_de_arquivo_aberto_filtrando_competicao():
+    linhas = [
+        {"competicao": "serie_a", "mandante": "A", "visitante": "B", "gols_mandante": 1, "gols_visitante": 0},
+        {"competicao": "serie_b", "mandante": "B", "visitante": "C", "gols_mandante": 3, "gols_visitante": 0},
+        {"competicao": "serie_a", "mandante": "C", "visitante": "B", "gols_mandante": 0, "gols_visitante": 0},
+    ]
+    texto = "\n".join(json.dumps(l) for l in linhas) + "\n{quebrado\n"
+    camp = criar_campeonato()
+    relatorio = LeitorResultados(camp, competicao="serie_a").carregar(io.StringIO(texto), formato="jsonl")
+    assert relatorio.processadas == 2
+    assert relatorio.total_erros == 1 and relatorio.erros[0].linha == 4
+    assert [e.pontos for e in camp.equipes] == [3, 1, 1]
+
+
+def test_ler_e_preguicoso_e_limita_erros_guardados():
+    camp = criar_campeonato()
+    leitor = LeitorResultados(camp, max_erros=2)
+    texto = "mandante,visitante,gols_mandante,gols_visitante\n" + "A,A,0,0\n" * 5
+    relatorio = leitor.carregar(io.StringIO(texto), formato="csv")
+    assert relatorio.total_erros == 5 and len(relatorio.erros) == 2
+    gerador = leitor.ler(io.StringIO(texto), formato="csv")
+    assert next(gerador)[0] == 2
+
+
+def test_formato_desconhecido():
+    with pytest.raises(ValueError):
+        list(LeitorResultados(criar_campeonato()).ler("resultados.xml"))
+
+
+def test_jsonl_com_tipos_errados_vira_erro_de_linha():
+    linhas = [
+        {"mandante": ["A"], "visitante": "B", "gols_mandante": 1, "gols_visitante": 0},
+        {"mandante": "A", "visitante": {"nome": "B"}, "gols_mandante": 1, "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": 70_000, "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": 1, "gols_visitante": 0},
+    ]
+    camp = criar_campeonato()
+    relatorio = LeitorResultados(camp).carregar(io.StringIO("\n".join(json.dumps(l) for l in linhas)), formato="jsonl")
+    assert relatorio.processadas == 1
+    assert [e.linha for e in relatorio.erros] == [1, 2, 3]
+    assert "mandante" in relatorio.erros[0].motivo and "visitante" in relatorio.erros[1].motivo
+
+
+def test_gols_so_inteiros_de_verdade_com_o_numero_da_linha():
+    linhas = [
+        {"mandante": "A", "visitante": "B", "gols_mandante": 1.7, "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": True, "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": "2", "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": 2.0, "gols_visitante": 0},
+        {"mandante": "A", "visitante": "B", "gols_mandante": 2, "gols_visitante": 0},
+    ]
+    camp = criar_campeonato()
+    relatorio = LeitorResultados(camp).carregar(io.StringIO("\n".join(json.dumps(l) for l in linhas)), formato="jsonl")
+    assert relatorio.processadas == 1 and camp.equipes[0].pontos == 3
+    assert [e.linha for e in relatorio.erros] == [1, 2, 3, 4]
+    assert relatorio.erros[0].motivo == "Linha 1: gols devem ser números inteiros, não 1.7."
+    assert "Linha 2" in relatorio.erros[1].motivo and "True" in relatorio.erros[1].motivo
+
+    texto = "mandante,visitante,gols_mandante,gols_visitante\nA,B,2.0,0\nA,B,1,1e3\nA,B,²,0\nA,B, 3 ,0\n"
+    camp = criar_campeonato()
+    relatorio = LeitorResultados(camp).carregar(io.StringIO(texto), formato="csv")
+    assert relatorio.processadas == 1 and camp.equipes[0].gols_marcados == 3
+    assert [(e.linha, e.motivo.split(":")[0]) for e in relatorio.erros] == [(2, "Linha 2"), (3, "Linha 3"), (4, "Linha 4")]
@@ -0,0 +1,128 @@
+import math
+import random
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.modelo_placar import DadosPartidas, ModeloPlacar
+from src.partida import Partida
+
+
+def poisson(media, rng):
+    x, gols, termo = rng.random(), 0, math.exp(-media)
+    acumulado = termo
+    while x > acumulado:
+        gols += 1
+        termo *= media / gols
+        acumulado += termo
+    return gols
+
+
+def dados_sinteticos(ataque, defesa, mando=1.3, temporadas=10, semente=0):
+    rng = random.Random(semente)
+    dados = DadosPartidas()
+    n = len(ataque)
+    for temporada in range(temporadas):
+        for i in range(n):
+            for j in range(n):
+                if i != j:
+                    dados.adicionar(f"T{i}", f"T{j}", poisson(mando * ataque[i] * defesa[j], rng),
+                                    poisson(ataque[j] * defesa[i], rng), temporada)
+    return dados
+
+
+def test_recupera_parametros_e_reajuste_com_partida_quente():
+    ataque = [1.4, 1.0, 0.6, 1.0]
+    defesa = [0.7, 1.0, 1.4, 1.1]
+    dados = dados_sinteticos(ataque, defesa, temporadas=150)
+    modelo = ModeloPlacar(dixon_coles=False)
+    iteracoes = modelo.ajustar(dados)
+    assert modelo.mando == pytest.approx(1.3, abs=0.1)
+    for i in range(4):
+        assert modelo.ataque[f"T{i}"] == pytest.approx(ataque[i], rel=0.12)
+        assert modelo.defesa[f"T{i}"] == pytest.approx(defesa[i], rel=0.12)
+
+    dados.adicionar("T0", "T1", 2, 0, 150)
+    assert modelo.ajustar(dados) < iteracoes
+    assert sum(modelo.ataque.values()) == pytest.approx(4)
+
+
+def test_dixon_coles_captura_excesso_de_empates_baixos():
+    dados = dados_sinteticos([1.0] * 4, [1.0] * 4, temporadas=20)
+    for k in range(120):
+        dados.adicionar(f"T{k % 4}", f"T{(k + 1) % 4}", k % 2, k % 2, 20)
+    simples = ModeloPlacar(dixon_coles=False)
+    simples.ajustar(dados)
+    corrigido = ModeloPlacar()
+    corrigido.ajustar(dados)
+    assert corrigido.rho < 0
+    assert corrigido.log_verossimilhanca(dados) > simples.log_verossimilhanca(dados)
+    assert corrigido.probabilidades("T0", "T1")[1] > simples.probabilidades("T0", "T1")[1]
+    matriz = corrigido.matriz_placar("T0", "T1")
+    assert sum(map(sum, matriz)) == pytest.approx(1, abs=1e-6)
+
+
+def test_meia_vida_da_mais_peso_aos_resultados_recentes():
+    dados = DadosPartidas()
+    for tempo in range(10):
+        dados.adicionar("A", "B", 0 if tempo < 9 else 4, 1, tempo)
+        dados.adicionar("B", "A", 1, 0 if tempo < 9 else 4, tempo)
+    sem_decaimento = ModeloPlacar(dixon_coles=False)
+    sem_decaimento.ajustar(dados)
+    recente = ModeloPlacar(dixon_coles=False, meia_vida=1)
+    recente.ajustar(dados)
+    assert recente.ataque["A"] > sem_decaimento.ataque["A"]
+    with pytest.raises(ValueError):
+        ModeloPlacar(meia_vida=0)
+    with pytest.raises(ValueError):
+        ModeloPlacar().ajustar(DadosPartidas())
+
+
+def test_dados_do_campeonato_e_simulacao():
+    equipes = [Equipe(f"T{i}") for i in range(4)]
+    camp = Campeonato(equipes, semente=2)
+    camp.sortear_jogos()
+    dados = DadosPartidas()
+    rodada = camp.rodadas[0]
+    camp.processar_partida(Partida(rodada[0][0], rodada[0][1], 3, 0))
+    dados.adicionar_campeonato(camp)
+    dados.acompanhar(camp)
+    camp.processar_partida(Partida(rodada[1][0], rodada[1][1], 1, 1))
+    assert len(dados) == 2
+    assert dados.nomes == [rodada[0][0].nome, rodada[0][1].nome, rodada[1][0].nome, rodada[1][1].nome]
+
+    modelo = ModeloPlacar()
+    modelo.ajustar(dados)
+    resultado = camp.simular(50, modelo=modelo, workers=1)
+    assert sum(resultado.distribuicao_posicoes()["T0"]) == pytest.approx(1)
+    gols = modelo.sortear_placar("T0", "T1", random.Random(0))
+    assert all(0 <= g <= modelo.max_gols for g in gols)
+
+
+def test_sorteio_nao_joga_a_massa_truncada_no_ultimo_placar():
+    modelo = ModeloPlacar(dixon_coles=False, max_gols=2)
+    modelo.ataque = {"A": 3.0, "B": 3.0}  # médias de 3 gols: ~58% da massa passa de 2x2
+    rng = random.Random(1)
+    sorteios = [modelo.sortear_placar("A", "B", rng) for _ in range(4000)]
+    matriz = modelo.matriz_placar("A", "B")
+    total = sum(map(sum, matriz))
+    for placar in ((2, 2), (0, 0), (1, 2)):
+        esperado = matriz[placar[0]][placar[1]] / total
+        assert sorteios.count(placar) / len(sorteios) == pytest.approx(esperado, abs=0.03)
+
+
+def test_sorteio_em_lote_repete_o_sorteio_individual():
+    modelo = ModeloPlacar(dixon_coles=False, max_gols=2)
+    modelo.ataque = {"A": 3.0, "B": 0.5, "C": 1.0}
+    confrontos = [("A", "B"), ("B", "C"), ("C", "A"), ("A", "C")] * 50
+    individual, em_lote = random.Random(3), random.Random(3)
+    assert modelo.sortear_placares(confrontos, em_lote) == [modelo.sortear_placar(m, v, individual)
+                                                            for m, v in confrontos]
+    assert em_lote.random() == individual.random()
+
+    camp = Campeonato([Equipe(nome) for nome in "ABC"], semente=1)
+    camp.sortear_jogos()
+    objetos = camp.simular(40, modelo=modelo, workers=1, semente=2)
+    assert camp.simular(40, modelo=modelo, workers=1, semente=2, motor="lote").contagem_posicoes == \
+        objetos.contagem_posicoes
@@ -0,0 +1,108 @@
+from collections import Counter
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.otimizador_calendario import PESO_VIOLACAO, OtimizadorCalendario
+from src.partida import Partida
+
+
+def novo_campeonato(n_equipes, semente=1):
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n_equipes)], semente=semente)
+    camp.sortear_jogos()
+    return camp
+
+
+def quebras(rodadas, equipes):
+    total = 0
+    for equipe in equipes:
+        mandos = []
+        for rodada in rodadas:
+            mandos += [m is equipe for m, v in rodada if equipe in (m, v)] or [None]
+        total += sum(1 for a, b in zip(mandos, mandos[1:]) if a is not None and a == b)
+    return total
+
+
+def assert_turno_e_returno_valido(rodadas, equipes):
+    jogos = Counter(jogo for rodada in rodadas for jogo in rodada)
+    assert set(jogos.values()) == {1}
+    assert len(jogos) == len(equipes) * (len(equipes) - 1)
+    for rodada in rodadas:
+        presentes = [equipe for jogo in rodada for equipe in jogo]
+        assert len(presentes) == len(set(presentes))
+
+
+@pytest.mark.parametrize("n_equipes", [6, 20])
+def test_sem_restricoes_atinge_o_minimo_de_quebras(n_equipes):
+    camp = novo_campeonato(n_equipes)
+    resultado = OtimizadorCalendario(camp, semente=0).otimizar()
+    assert_turno_e_returno_valido(resultado.rodadas, camp.equipes)
+    assert resultado.quebras == quebras(resultado.rodadas, camp.equipes) == 3 * n_equipes - 6
+    assert resultado.objetivo == resultado.quebras
+    assert resultado.iteracoes == 0
+
+
+def test_restricoes_obrigatorias_sao_atendidas():
+    camp = novo_campeonato(10)
+    e = camp.equipes
+    bloqueios = {e[4]: [1, 2, 3], e[5]: [10, 18]}
+    resultado = OtimizadorCalendario(camp, estadios_compartilhados=[(e[0], e[1])], mandos_bloqueados=bloqueios,
+                                     classicos=[(e[0], e[1]), (e[2], e[3]), (e[6], e[7])],
+                                     semente=3).otimizar(tempo_limite=5)
+    rodadas = resultado.rodadas
+    assert_turno_e_returno_valido(rodadas, e)
+    assert resultado.violacoes == 0
+    assert resultado.quebras == quebras(rodadas, e)
+    mandantes = [{m for m, _ in rodada} for rodada in rodadas]
+    assert not any({e[0], e[1]} <= casa for casa in mandantes)
+    for equipe, numeros in bloqueios.items():
+        assert all(equipe not in mandantes[numero - 1] for numero in numeros)
+    for rodada in rodadas:
+        pares = {frozenset(jogo) for jogo in rodada}
+        assert len(pares & {frozenset((e[0], e[1])), frozenset((e[2], e[3])), frozenset((e[6], e[7]))}) <= 1
+
+
+def test_objetivo_pesa_violacoes_e_busca_e_reproduzivel():
+    camp = novo_campeonato(8)
+    e = camp.equipes
+    restricoes = dict(mandos_bloqueados={e[0]: range(1, 8)}, classicos=[(e[0], e[1]), (e[2], e[3])])
+    a = OtimizadorCalendario(camp, semente=5, **restricoes).otimizar(max_iteracoes=300)
+    b = OtimizadorCalendario(camp, semente=5, **restricoes).otimizar(max_iteracoes=300)
+    assert a.rodadas == b.rodadas
+    assert a.objetivo == a.quebras + PESO_VIOLACAO * a.violacoes
+    with pytest.raises(ValueError):
+        OtimizadorCalendario(camp, mandos_bloqueados={e[0]: [15]})
+
+
+def test_campeonato_adota_calendario_otimizado():
+    camp = novo_campeonato(7)
+    resultado = camp.otimizar_calendario(tempo_limite=0.5, semente=1)
+    assert camp.rodadas == resultado.rodadas
+    assert_turno_e_returno_valido(camp.rodadas, camp.equipes)
+    for mandante, visitante in camp.rodadas[0]:
+        camp.processar_partida(Partida(mandante, visitante, 1, 1))
+    assert 1 in camp.historico.retratos
+
+
+def test_otimiza_as_rodadas_definidas_em_vez_de_sortear_outras():
+    camp = novo_campeonato(8)
+    e = camp.equipes
+    primeira = camp.otimizar_calendario(tempo_limite=0.2, mandos_bloqueados={e[0]: [1, 2]}, semente=1)
+    assert camp.calendario is None
+    # sem restrições novas, parte das rodadas já otimizadas: nunca piora nem troca os confrontos
+    segunda = OtimizadorCalendario(camp, mandos_bloqueados={e[0]: [1, 2]}, semente=2).otimizar(max_iteracoes=0)
+    assert segunda.rodadas == primeira.rodadas
+    assert (segunda.quebras, segunda.violacoes) == (primeira.quebras, primeira.violacoes)
+    assert quebras(segunda.rodadas, e) == segunda.quebras
+
+    with pytest.raises(ValueError):
+        OtimizadorCalendario(Campeonato([Equipe(f"T{i}") for i in range(4)]))  # sem rodadas
+    incompleto = novo_campeonato(6)
+    incompleto.rodadas = incompleto.rodadas[:-1]
+    with pytest.raises(ValueError):
+        OtimizadorCalendario(incompleto)
+    sem_espelho = novo_campeonato(6)
+    sem_espelho.rodadas = sem_espelho.rodadas[:5] + sem_espelho.rodadas[6:] + sem_espelho.rodadas[5:6]
+    with pytest.raises(ValueError):
+        OtimizadorCalendario(sem_espelho)
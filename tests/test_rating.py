@@ -0,0 +1,84 @@
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+from src.rating import MotorRating
+
+
+def campeonato_sorteado(n=4):
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n)], semente=3)
+    camp.sortear_jogos()
+    return camp
+
+
+def test_atualizacao_incremental_com_mando_e_margem():
+    camp = campeonato_sorteado()
+    motor = MotorRating(camp, k=20, vantagem_mando=0)
+    a, b = camp.rodadas[0][0]
+    camp.processar_partida(Partida(a, b, 1, 0))
+    assert motor.rating(a) == pytest.approx(1510)
+    assert motor.rating(b) == pytest.approx(1490)
+    assert motor.jogos == 1
+
+    # goleada pesa mais e a soma dos ratings se conserva
+    outro = MotorRating(campeonato_sorteado(), k=20, vantagem_mando=0)
+    c, d = outro.campeonato.rodadas[0][0]
+    outro.campeonato.processar_partida(Partida(c, d, 4, 0))
+    assert outro.rating(c) == pytest.approx(1500 + 20 * 15 / 8 / 2)
+    assert sum(outro.ratings) == pytest.approx(1500 * 4)
+
+
+def test_mando_reduz_ganho_do_mandante_favorito():
+    camp = campeonato_sorteado()
+    motor = MotorRating(camp, vantagem_mando=100)
+    a, b = camp.rodadas[0][0]
+    assert motor.expectativa(camp._indice(a), camp._indice(b)) > 0.5
+    camp.processar_partida(Partida(a, b, 1, 0))
+    assert motor.rating(a) - 1500 < 10
+
+
+def test_lote_e_reajuste_coincidem_com_incremental():
+    jogos = [(0, 1, 2, 0), (2, 3, 1, 1), (0, 2, 0, 3), (1, 3, 2, 1), (3, 0, 1, 0), (1, 2, 2, 2)]
+    incremental = Campeonato([Equipe(f"T{i}") for i in range(4)])
+    motor = MotorRating(incremental)
+    for i, j, gm, gv in jogos:
+        incremental.processar_partida(Partida(incremental.equipes[i], incremental.equipes[j], gm, gv))
+
+    em_lote = Campeonato([Equipe(f"T{i}") for i in range(4)])
+    motor_lote = MotorRating(em_lote)
+    em_lote.processar_partidas((em_lote.equipes[i], em_lote.equipes[j], gm, gv) for i, j, gm, gv in jogos)
+    assert list(motor_lote.ratings) == pytest.approx(list(motor.ratings))
+
+    ratings = list(motor.ratings)
+    motor.reajustar()
+    assert list(motor.ratings) == pytest.approx(ratings)
+    assert motor.taxa_empate > 0
+
+    # ligado depois dos jogos, o motor parte do histórico existente
+    assert list(MotorRating(incremental).ratings) == pytest.approx(ratings)
+    assert MotorRating(incremental).taxa_empate == motor.taxa_empate
+    assert MotorRating(incremental, taxa_empate=0.1).taxa_empate == 0.1
+
+
+def test_probabilidades_da_rodada():
+    camp = campeonato_sorteado()
+    motor = MotorRating(camp)
+    previsoes = motor.probabilidades_rodada(1)
+    assert len(previsoes) == 2
+    for mandante, visitante, vitoria, empate, derrota in previsoes:
+        assert (mandante, visitante) in camp.rodadas[0]
+        assert vitoria + empate + derrota == pytest.approx(1)
+        assert vitoria > derrota  # ratings iguais: só o mando diferencia
+    assert len(motor.probabilidades_restantes()) == 12
+
+
+def test_desligar_e_taxa_invalida():
+    camp = campeonato_sorteado()
+    motor = MotorRating(camp)
+    motor.desligar()
+    a, b = camp.rodadas[0][0]
+    camp.processar_partida(Partida(a, b, 3, 0))
+    assert motor.rating(a) == 1500
+    with pytest.raises(ValueError):
+        MotorRating(camp, taxa_empate=0.8)
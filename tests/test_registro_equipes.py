@@ -0,0 +1,64 @@
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+from src.registro_equipes import RegistroEquipes
+
+
+def test_ids_estaveis_e_busca_por_nome_e_id():
+    equipes = [Equipe(nome) for nome in ("Bahia", "Vitória", "Sport")]
+    camp = Campeonato(equipes)
+    registro = camp.registro
+    assert [e.id for e in equipes] == [0, 1, 2]
+    assert registro[1] is equipes[1]
+    assert registro.por_nome("Sport") is equipes[2]
+    assert registro.id_do_nome("Bahia") == 0
+    assert registro.id_do_nome("Náutico") is None
+    assert equipes[0] in registro and "Vitória" in registro
+    with pytest.raises(ValueError):
+        registro.por_nome("Náutico")
+
+
+def test_equipe_de_outro_campeonato_e_nomes_repetidos():
+    camp = Campeonato([Equipe("A"), Equipe("B")])
+    intrusa = Equipe("A")
+    Campeonato([intrusa, Equipe("C")])  # mesmo id (0) em outro campeonato
+    assert intrusa not in camp.registro
+    with pytest.raises(ValueError):
+        camp.registro.indice(intrusa)
+    with pytest.raises(ValueError):
+        camp.processar_partida(Partida(intrusa, camp.equipes[1], 1, 0))
+    livre = Equipe("D")
+    with pytest.raises(ValueError):
+        RegistroEquipes([livre, Equipe("A"), Equipe("A")])
+    assert livre.id is None
+
+
+def test_equipe_pertence_a_um_so_registro():
+    # mudança de comportamento: antes o mesmo objeto Equipe podia entrar em dois campeonatos
+    equipes = [Equipe("A"), Equipe("B")]
+    camp = Campeonato(equipes)
+    camp.processar_partida(Partida(equipes[0], equipes[1], 0, 2))
+    nova = Equipe("C")
+    with pytest.raises(ValueError, match="já pertence a outro campeonato"):
+        Campeonato([nova, equipes[1]])
+    # a recusa não mexe em nada: id e estatísticas continuam os do primeiro campeonato
+    assert nova.id is None
+    assert camp.registro.indice(equipes[1]) == 1
+    assert equipes[1].pontos == 3
+    camp.processar_partida(Partida(equipes[1], equipes[0], 1, 0))
+    assert equipes[1].pontos == 6
+    # a outra competição usa objetos Equipe novos, com o mesmo nome
+    copa = Campeonato([nova, Equipe("B")])
+    assert copa.registro.por_nome("B") is not equipes[1] and copa.registro.por_nome("B").pontos == 0
+
+
+def test_estruturas_internas_por_id():
+    camp = Campeonato([Equipe(f"T{i}") for i in range(4)], semente=1)
+    camp.sortear_jogos()
+    (a, b), (c, d) = camp.rodadas[0]
+    camp.processar_partidas([(a.nome, b.nome, 2, 0), (c, d, 1, 1)])
+    assert camp.partidas.registro(0) == (a.id, b.id, 2, 0)
+    assert camp.historico_confrontos[frozenset({a.nome, b.nome})][a.nome]["pontos"] == 3
+    assert [linha.nome for linha in camp.tabela_apos_rodada(1)] == [e.nome for e in camp.calcular_classificacao()]
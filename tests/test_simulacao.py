@@ -0,0 +1,107 @@
+import random
+
+import pytest
+
+from src.campeonato import Campeonato
+from src.equipe import Equipe
+from src.partida import Partida
+from src.simulacao import ModeloPoisson, SimuladorTemporadas
+
+
+def criar_campeonato(n=6, semente=1):
+    random.seed(semente)
+    camp = Campeonato([Equipe(f"T{i}") for i in range(n)])
+    camp.sortear_jogos()
+    return camp
+
+
+def test_jogos_restantes_exclui_partidas_processadas():
+    camp = criar_campeonato()
+    total = sum(len(r) for r in camp.rodadas)
+    mandante, visitante = camp.rodadas[0][0]
+    camp.processar_partida(Partida(mandante, visitante, 1, 0))
+    restantes = camp.jogos_restantes()
+    assert len(restantes) == total - 1
+    assert (mandante, visitante) not in restantes
+    # o returno continua pendente
+    assert (visitante, mandante) in restantes
+
+
+def test_simular_distribuicao_soma_um():
+    camp = criar_campeonato()
+    resultado = camp.simular(50, workers=1, semente=3)
+    distribuicao = resultado.distribuicao_posicoes()
+    assert set(distribuicao) == {e.nome for e in camp.equipes}
+    for probs in distribuicao.values():
+        assert sum(probs) == pytest.approx(1.0)
+    # cada posição é ocupada por exatamente uma equipe em cada temporada
+    for pos in range(len(camp.equipes)):
+        assert sum(p[pos] for p in distribuicao.values()) == pytest.approx(1.0)
+
+
+def test_simular_independe_do_numero_de_workers():
+    camp = criar_campeonato()
+    serial = camp.simular(40, workers=1, semente=7)
+    paralelo = camp.simular(40, workers=2, semente=7)
+    assert serial.contagem_posicoes == paralelo.contagem_posicoes
+
+
+def test_simular_parte_do_estado_atual():
+    camp = criar_campeonato(4)
+    # todos os jogos já disputados: o resultado é determinístico
+    for mandante, visitante in camp.jogos_restantes():
+        gols = 3 if mandante.nome == "T0" or visitante.nome == "T0" else 1
+        placar = (gols, 0) if mandante.nome == "T0" else (0, gols) if visitante.nome == "T0" else (1, 1)
+        camp.processar_partida(Partida(mandante, visitante, *placar))
+    assert camp.jogos_restantes() == []
+    zonas = camp.simular(10, workers=1).probabilidades_zonas()
+    assert zonas["T0"]["titulo"] == 1.0
+    assert zonas["T0"]["libertadores"] == 1.0
+
+
+def test_simulacao_nao_altera_campeonato_original():
+    camp = criar_campeonato()
+    antes = [(e.nome, e.pontos, e.gols_marcados) for e in camp.equipes]
+    SimuladorTemporadas(camp).executar(5, workers=1)
+    assert [(e.nome, e.pontos, e.gols_marcados) for e in camp.equipes] == antes
+    assert camp.historico_confrontos == {}
+
+
+def test_modelo_poisson_valida_medias():
+    with pytest.raises(ValueError):
+        ModeloPoisson(0, 1)
+    gols = ModeloPoisson().sortear_placar("A", "B", random.Random(0))
+    assert all(g >= 0 for g in gols)
+
+
+def test_motor_em_lote_reproduz_motor_de_objetos():
+    camp = criar_campeonato(8, semente=5)
+    # estado parcialmente disputado, com confronto direto registrado
+    for mandante, visitante in camp.rodadas[0]:
+        camp.processar_partida(Partida(mandante, visitante, 1, 1))
+    objetos = camp.simular(60, workers=1, semente=11)
+    lote = camp.simular(60, workers=1, semente=11, motor="lote")
+    assert lote.contagem_posicoes == objetos.contagem_posicoes
+
+
+def test_sorteio_em_lote_e_modelo_so_com_sorteio_individual():
+    modelo = ModeloPoisson(2.0, 0.7)
+    confrontos = [("A", "B"), ("B", "A")] * 30
+    individual, em_lote = random.Random(4), random.Random(4)
+    assert modelo.sortear_placares(confrontos, em_lote) == [modelo.sortear_placar(m, v, individual)
+                                                            for m, v in confrontos]
+    assert em_lote.random() == individual.random()
+
+    class SoIndividual:
+        sortear_placar = modelo.sortear_placar
+
+    camp = criar_campeonato(6, semente=2)
+    objetos = camp.simular(30, modelo=SoIndividual(), workers=1, semente=5)
+    lote = camp.simular(30, modelo=SoIndividual(), workers=1, semente=5, motor="lote")
+    assert lote.contagem_posicoes == objetos.contagem_posicoes
+
+
+def test_motor_desconhecido_levanta_value_error():
+    camp = criar_campeonato()
+    with pytest.raises(ValueError):
+        camp.simular(1, workers=1, motor="gpu")
@@ -1,6 +1,6 @@
 # Testes adicionais para a classe Equipe (arquivo: tests/test_time.py)
 import pytest
-from src.equipe import Equipe
+from src.equipe import ColunasEstatisticas, Equipe, EstatisticasEmColunas, EstatisticasEquipe
 
 @pytest.mark.parametrize(
     "nome, gols_marcados, gols_sofridos, pontos_esperados, vitorias_esperadas",
@@ -146,4 +146,32 @@ def test_str_apos_varias_partidas_reflete_estatisticas():
     assert "1E" in texto
     assert "1D" in texto
     assert "GM 7" in texto   # 4+1+2
-    assert "GS 4" in texto   # 0+2+2
\ No newline at end of file
+    assert "GS 4" in texto   # 0+2+2
+
+def test_equipe_e_estatisticas_sem_dict():
+    time = Equipe("Fortaleza")
+    assert not hasattr(time, "__dict__")
+    assert not hasattr(time.estatisticas, "__dict__")
+
+
+def test_estatisticas_movidas_para_colunas_compartilhadas():
+    time = Equipe("Bahia")
+    time.atualizar_estatisticas(2, 1)
+    colunas = ColunasEstatisticas()
+    colunas.adicionar()
+    assert isinstance(time.estatisticas, EstatisticasEquipe)
+    indice = time.mover_para(colunas)
+    assert indice == 1 and isinstance(time.estatisticas, EstatisticasEmColunas)
+    assert colunas.pontos[1] == 3 and colunas.gols_marcados[1] == 2
+    time.atualizar_estatisticas(0, 0)
+    assert colunas.pontos[1] == 4
+    assert time.pontos == 4 and time.empates == 1
+
+
+def test_reverter_estatisticas_desfaz_resultado():
+    time = Equipe("Cruzeiro")
+    time.atualizar_estatisticas(3, 1)
+    time.atualizar_estatisticas(1, 1)
+    time.reverter_estatisticas(3, 1)
+    assert (time.pontos, time.vitorias, time.empates, time.derrotas) == (1, 0, 1, 0)
+    assert (time.gols_marcados, time.gols_sofridos) == (1, 1)